@@ -0,0 +1,99 @@
+"""
+Compare iterating heroes and reading `hero.team` with the default lazy loads, one
+query per team, with `session.enable_batch_lazy_loads()`, that loads the teams of
+all the heroes in the session with one IN query, and with `selectinload()`
+declared in the query.
+
+SQLite runs in process, so the benchmark also simulates the round-trip time of a
+database server by sleeping 0.5 ms before each query.
+
+Run with:
+
+    python benchmarks/bench_batch_lazy_loads.py [NUMBER_OF_HEROES ...]
+
+By default it uses 100 and 1,000 heroes, each one in a different team.
+"""
+import sys
+import time
+from typing import Any, Callable, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import registry, selectinload
+from sqlmodel import Field, Relationship, Session, SQLModel, create_engine, select
+
+
+def create_models() -> Any:
+    class Base(SQLModel, registry=registry()):
+        pass
+
+    class Team(Base, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        heroes: List["Hero"] = Relationship(back_populates="team")
+
+    class Hero(Base, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+        team: Optional[Team] = Relationship(back_populates="heroes")
+
+    return Base, Team, Hero
+
+
+def measure(engine: Any, read: Callable[[], Any], latency: float) -> str:
+    queries = 0
+
+    def count(*args: Any) -> None:
+        nonlocal queries
+        queries += 1
+        time.sleep(latency)
+
+    event.listen(engine, "before_cursor_execute", count)
+    best = float("inf")
+    for _ in range(5):
+        queries = 0
+        start = time.perf_counter()
+        read()
+        best = min(best, time.perf_counter() - start)
+    event.remove(engine, "before_cursor_execute", count)
+    return f"{best * 1000:8.1f} ms {queries:5} queries"
+
+
+def bench(total: int) -> None:
+    Base, Team, Hero = create_models()
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        for i in range(total):
+            session.add(Hero(name=f"Hero {i}", team=Team(name=f"Team {i}")))
+        session.commit()
+
+    def read(batch: bool, statement: Any) -> Callable[[], Any]:
+        def run() -> Any:
+            with Session(engine) as session:
+                if batch:
+                    session.enable_batch_lazy_loads()
+                return [hero.team.name for hero in session.exec(statement).all()]
+
+        return run
+
+    print(f"{total:,} heroes")
+    for label, run in [
+        ("lazy loads", read(False, select(Hero))),
+        ("batch lazy loads", read(True, select(Hero))),
+        ("selectinload()", read(False, select(Hero).options(selectinload(Hero.team)))),
+    ]:
+        for latency in (0, 0.0005):
+            result = measure(engine, run, latency)
+            print(f"{label:>20} {latency * 1000:.1f} ms latency: {result}")
+    engine.dispose()
+
+
+def main() -> None:
+    totals = [int(arg) for arg in sys.argv[1:]] or [100, 1000]
+    for total in totals:
+        bench(total)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Compare the time to start with an existing database, calling
+`SQLModel.metadata.create_all()`, that checks each table with a separate query,
+and `bootstrap_schema()`, that compares a fingerprint of the schema with the one
+stored by the previous start, and does nothing else when it matches.
+
+SQLite runs in process, so the benchmark also simulates the round-trip time of a
+database server, e.g. PostgreSQL in the same network, by sleeping 0.5 ms before
+each query.
+
+Run with:
+
+    python benchmarks/bench_bootstrap.py [NUMBER_OF_TABLES ...]
+
+By default it uses 100 and 500 tables, in a SQLite file in a temporary directory.
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import registry
+from sqlmodel import Field, SQLModel, create_engine
+from sqlmodel.schema import bootstrap_schema
+
+
+def create_models(total: int) -> List[Any]:
+    class Base(SQLModel, registry=registry()):
+        pass
+
+    models: List[Any] = [Base]
+    for i in range(total):
+        namespace: Dict[str, Any] = {
+            "__module__": __name__,
+            "__annotations__": {"id": Optional[int], "name": str},
+            "id": Field(default=None, primary_key=True),
+            "name": Field(index=True),
+        }
+        models.append(type(SQLModel)(f"Model{i}", (Base,), namespace, table=True))
+    return models
+
+
+def measure(engine: Any, start_up: Callable[[], Any], latency: float) -> str:
+    queries = 0
+
+    def count(*args: Any) -> None:
+        nonlocal queries
+        queries += 1
+        if latency:
+            time.sleep(latency)
+
+    event.listen(engine, "before_cursor_execute", count)
+    best = float("inf")
+    for _ in range(5):
+        queries = 0
+        start = time.perf_counter()
+        start_up()
+        best = min(best, time.perf_counter() - start)
+    event.remove(engine, "before_cursor_execute", count)
+    return f"{best * 1000:8.1f} ms {queries:5} queries"
+
+
+def bench(total: int, directory: str) -> None:
+    metadata = create_models(total)[0].metadata
+    engine = create_engine(f"sqlite:///{Path(directory) / f'bench_{total}.db'}")
+    bootstrap_schema(engine, metadata)
+    print(f"{total:,} tables")
+    for latency in (0, 0.0005):
+        for label, start_up in [
+            ("create_all()", lambda: metadata.create_all(engine)),
+            ("bootstrap_schema()", lambda: bootstrap_schema(engine, metadata)),
+        ]:
+            result = measure(engine, start_up, latency)
+            print(f"{label:>20} {latency * 1000:.1f} ms latency: {result}")
+    engine.dispose()
+
+
+def main() -> None:
+    totals = [int(arg) for arg in sys.argv[1:]] or [100, 500]
+    with tempfile.TemporaryDirectory() as directory:
+        for total in totals:
+            bench(total, directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Compare inserting heroes and reading their generated IDs with `session.add_all()`,
+`session.commit()` and `session.refresh()` for each hero, with
+`session.bulk_insert()`, that validates the rows at once and inserts them with
+`RETURNING`.
+
+SQLite runs in process, so the benchmark also simulates the round-trip time of a
+database server by sleeping 0.5 ms before each query. SQLite can't sort the rows
+from `RETURNING` by the parameters, so SQLAlchemy still sends them one at a time,
+only without the refresh queries. With PostgreSQL each chunk is a single query.
+
+Run with:
+
+    python benchmarks/bench_bulk_insert.py [NUMBER_OF_HEROES ...]
+
+By default it uses 100 and 1,000 heroes.
+"""
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import registry
+from sqlmodel import Field, Session, SQLModel, create_engine
+
+
+def create_model() -> Any:
+    class Base(SQLModel, registry=registry()):
+        pass
+
+    class Hero(Base, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        secret_name: str
+        age: Optional[int] = None
+
+    return Hero
+
+
+def measure(engine: Any, insert: Callable[[], List[int]], latency: float) -> str:
+    queries = 0
+
+    def count(*args: Any) -> None:
+        nonlocal queries
+        queries += 1
+        time.sleep(latency)
+
+    event.listen(engine, "before_cursor_execute", count)
+    best = float("inf")
+    for _ in range(5):
+        queries = 0
+        start = time.perf_counter()
+        ids = insert()
+        best = min(best, time.perf_counter() - start)
+        assert all(id is not None for id in ids)
+    event.remove(engine, "before_cursor_execute", count)
+    return f"{best * 1000:8.1f} ms {queries:5} queries"
+
+
+def bench(total: int) -> None:
+    Hero = create_model()
+    engine = create_engine("sqlite://")
+    Hero.metadata.create_all(engine)
+    rows: List[Dict[str, Any]] = [
+        {"name": f"Hero {i}", "secret_name": f"Secret {i}", "age": i % 80}
+        for i in range(total)
+    ]
+
+    def unit_of_work() -> List[int]:
+        with Session(engine) as session:
+            heroes = [Hero(**row) for row in rows]
+            session.add_all(heroes)
+            session.commit()
+            for hero in heroes:
+                session.refresh(hero)
+            return [hero.id for hero in heroes]
+
+    def bulk_insert() -> List[int]:
+        with Session(engine) as session:
+            heroes = session.bulk_insert(Hero, rows)
+            ids = [hero.id for hero in heroes]
+            session.commit()
+            return ids
+
+    print(f"{total:,} heroes")
+    for label, insert in [
+        ("add_all() + refresh()", unit_of_work),
+        ("bulk_insert()", bulk_insert),
+    ]:
+        for latency in (0, 0.0005):
+            result = measure(engine, insert, latency)
+            print(f"{label:>22} {latency * 1000:.1f} ms latency: {result}")
+    engine.dispose()
+
+
+def main() -> None:
+    totals = [int(arg) for arg in sys.argv[1:]] or [100, 1000]
+    for total in totals:
+        bench(total)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Compare updating the age of many heroes by loading them, setting the attribute
+and flushing, with `session.bulk_update()`, that sends only the changed column
+in an `UPDATE ... WHERE id = ?` with many parameters, without loading them.
+
+Half of the heroes get a new age, the other half a new name, so the updates
+are sent in two groups. SQLite runs in process, so the benchmark also simulates
+the round-trip time of a database server by sleeping 0.5 ms before each query.
+
+Run with:
+
+    python benchmarks/bench_bulk_update.py [NUMBER_OF_HEROES ...]
+
+By default it uses 100 and 1,000 heroes.
+"""
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import registry
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+
+def create_model() -> Any:
+    class Base(SQLModel, registry=registry()):
+        pass
+
+    class Hero(Base, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        secret_name: str
+        age: Optional[int] = None
+
+    return Hero
+
+
+def measure(engine: Any, save: Callable[[int], Any], latency: float) -> str:
+    queries = 0
+
+    def count(*args: Any) -> None:
+        nonlocal queries
+        queries += 1
+        time.sleep(latency)
+
+    event.listen(engine, "before_cursor_execute", count)
+    best = float("inf")
+    for run in range(5):
+        queries = 0
+        start = time.perf_counter()
+        save(run)
+        best = min(best, time.perf_counter() - start)
+    event.remove(engine, "before_cursor_execute", count)
+    return f"{best * 1000:8.1f} ms {queries:5} queries"
+
+
+def bench(total: int) -> None:
+    Hero = create_model()
+
+    def get_rows(run: int) -> List[Dict[str, Any]]:
+        return [
+            {"id": i, "age": run} if i % 2 else {"id": i, "name": f"Hero {i} {run}"}
+            for i in range(1, total + 1)
+        ]
+
+    def load_then_flush(run: int) -> None:
+        rows = {row["id"]: row for row in get_rows(run)}
+        with Session(engine) as session:
+            for hero in session.exec(select(Hero)):
+                for key, value in rows[hero.id].items():
+                    setattr(hero, key, value)
+            session.commit()
+
+    def bulk_update(run: int) -> None:
+        with Session(engine) as session:
+            session.bulk_update(Hero, get_rows(run))
+            session.commit()
+
+    print(f"{total:,} heroes")
+    for label, save in [
+        ("load then flush", load_then_flush),
+        ("bulk_update()", bulk_update),
+    ]:
+        for latency in (0, 0.0005):
+            engine = create_engine("sqlite://")
+            Hero.metadata.create_all(engine)
+            with Session(engine) as session:
+                session.bulk_insert(
+                    Hero,
+                    [
+                        {"name": f"Hero {i}", "secret_name": f"Secret {i}"}
+                        for i in range(total)
+                    ],
+                    returning=False,
+                )
+                session.commit()
+            result = measure(engine, save, latency)
+            print(f"{label:>20} {latency * 1000:.1f} ms latency: {result}")
+            engine.dispose()
+
+
+def main() -> None:
+    totals = [int(arg) for arg in sys.argv[1:]] or [100, 1000]
+    for total in totals:
+        bench(total)
+
+
+if __name__ == "__main__":
+    main()
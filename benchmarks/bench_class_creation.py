@@ -0,0 +1,130 @@
+"""
+Measure how the creation of table models and the configuration of their mappers
+scale with the number of models, and where the time goes, using
+`sqlmodel.profiling.profile_class_creation()`.
+
+Each group of synthetic models has a team, a hero with a one-to-many relationship
+to the team, and a power with a many-to-many relationship to the hero through a
+link model.
+
+Run with:
+
+    python benchmarks/bench_class_creation.py [NUMBER_OF_MODELS ...]
+
+By default it creates 100, 200 and 400 models.
+"""
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import registry
+from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel.profiling import CLASS_CREATION_PHASES, profile_class_creation
+
+
+def create_model(name: str, base: Any, fields: Dict[str, Any]) -> Any:
+    namespace: Dict[str, Any] = {"__module__": __name__, "__annotations__": {}}
+    for field_name, (annotation, value) in fields.items():
+        namespace["__annotations__"][field_name] = annotation
+        if value is not None:
+            namespace[field_name] = value
+    return type(SQLModel)(name, (base,), namespace, table=True)
+
+
+def create_models(total: int) -> List[Any]:
+    class Base(SQLModel, registry=registry()):
+        pass
+
+    # Keep a reference to the models, as the ones declared in a module would be
+    models: List[Any] = [Base]
+    for i in range(total // 4):
+        id_field = (Optional[int], Field(default=None, primary_key=True))
+        link = create_model(
+            f"HeroPowerLink{i}",
+            Base,
+            {
+                "hero_id": (
+                    Optional[int],
+                    Field(default=None, foreign_key=f"hero{i}.id", primary_key=True),
+                ),
+                "power_id": (
+                    Optional[int],
+                    Field(default=None, foreign_key=f"power{i}.id", primary_key=True),
+                ),
+            },
+        )
+        team = create_model(
+            f"Team{i}",
+            Base,
+            {
+                "id": id_field,
+                "name": (str, Field(index=True)),
+                "headquarters": (str, None),
+                "heroes": (
+                    List[f"Hero{i}"],  # type: ignore
+                    Relationship(back_populates="team"),
+                ),
+            },
+        )
+        hero = create_model(
+            f"Hero{i}",
+            Base,
+            {
+                "id": (Optional[int], Field(default=None, primary_key=True)),
+                "name": (str, Field(index=True)),
+                "age": (Optional[int], Field(default=None)),
+                "team_id": (
+                    Optional[int],
+                    Field(default=None, foreign_key=f"team{i}.id"),
+                ),
+                "team": (Optional[team], Relationship(back_populates="heroes")),
+                "powers": (
+                    List[f"Power{i}"],  # type: ignore
+                    Relationship(back_populates="heroes", link_model=link),
+                ),
+            },
+        )
+        power = create_model(
+            f"Power{i}",
+            Base,
+            {
+                "id": (Optional[int], Field(default=None, primary_key=True)),
+                "name": (str, None),
+                "heroes": (
+                    List[hero],
+                    Relationship(back_populates="powers", link_model=link),
+                ),
+            },
+        )
+        models.extend([link, team, hero, power])
+    return models
+
+
+def bench(total: int) -> None:
+    with profile_class_creation() as profile:
+        start = time.perf_counter()
+        models = create_models(total)
+        created = time.perf_counter()
+        models[0]._sa_registry.configure()
+        configured = time.perf_counter()
+    totals = profile.totals()
+    phases = "  ".join(
+        f"{phase} {totals[phase] * 1000:.0f}" for phase in CLASS_CREATION_PHASES
+    )
+    print(
+        f"{len(models) - 1:>6,} models  "
+        f"create {(created - start) * 1000:8.1f} ms  "
+        f"configure {(configured - created) * 1000:8.1f} ms  "
+        f"({(configured - start) / (len(models) - 1) * 1000:.2f} ms/model)"
+    )
+    print(f"{'':>14}{phases} (ms)")
+
+
+def main() -> None:
+    totals = [int(arg) for arg in sys.argv[1:]] or [100, 200, 400]
+    for total in totals:
+        bench(total)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Show the cost of a query builder that defeats SQLAlchemy's compiled statement
+cache, using `sqlmodel.profiling.track_compiled_cache()` to find it, and the
+overhead of tracking the cache.
+
+Run with:
+
+    python benchmarks/bench_compiled_cache.py [NUMBER_OF_QUERIES]
+
+By default it runs 2,000 queries of each kind.
+"""
+import sys
+import time
+from typing import Callable, Optional
+
+from sqlmodel import Field, Session, SQLModel, create_engine, select, text
+from sqlmodel.profiling import track_compiled_cache
+
+
+class Hero(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    age: Optional[int] = None
+
+
+def by_age(session: Session, age: int) -> None:
+    session.exec(select(Hero).where(Hero.age == age)).all()
+
+
+def by_age_literal(session: Session, age: int) -> None:
+    # A new SQL string, and a new cache entry, for each value
+    session.exec(select(Hero).where(text(f"age = {age}"))).all()
+
+
+def measure(
+    session: Session, query: Callable[[Session, int], None], total: int
+) -> float:
+    start = time.perf_counter()
+    for i in range(total):
+        query(session, i)
+    return (time.perf_counter() - start) / total * 1_000_000
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        by_age(session, 0)
+        for query in (by_age, by_age_literal):
+            print(
+                f"{query.__name__:>16}: {measure(session, query, total):8.1f} us/query"
+            )
+        with track_compiled_cache(engine) as stats:
+            tracked = measure(session, by_age, total)
+            measure(session, by_age_literal, total)
+        print(f"{'by_age tracked':>16}: {tracked:8.1f} us/query")
+    print(stats.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Compare the per-instance cost of creating table model instances with `__init__`
+(validated) and with `construct_many()` (trusted data, no validation).
+
+Run with:
+
+    python benchmarks/bench_construct.py
+"""
+import timeit
+from typing import Optional
+
+from sqlmodel import Field, SQLModel
+
+N = 10_000
+
+
+class Hero(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(index=True)
+    secret_name: str
+    age: Optional[int] = Field(default=None, index=True)
+
+
+dict_rows = [
+    {"name": f"Hero {i}", "secret_name": f"Secret {i}", "age": i % 100}
+    for i in range(N)
+]
+tuple_rows = [(None, row["name"], row["secret_name"], row["age"]) for row in dict_rows]
+
+
+def run_init() -> None:
+    [Hero(**row) for row in dict_rows]
+
+
+def run_construct_many_dicts() -> None:
+    Hero.construct_many(dict_rows)
+
+
+def run_construct_many_tuples() -> None:
+    Hero.construct_many(tuple_rows)
+
+
+def main() -> None:
+    for label, func in [
+        ("Hero(**row)", run_init),
+        ("Hero.construct_many(dicts)", run_construct_many_dicts),
+        ("Hero.construct_many(tuples)", run_construct_many_tuples),
+    ]:
+        best = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{label:<30} {best / N * 1_000_000:8.2f} µs per instance")
+
+
+if __name__ == "__main__":
+    main()
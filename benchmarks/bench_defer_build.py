@@ -0,0 +1,61 @@
+"""
+Compare the time to create many table models with the Pydantic schema built at
+class creation (the default) and deferred with `defer_build=True`, and the time
+of `rebuild_all()` to build the deferred ones afterwards. Requires Pydantic v2.
+
+Run with:
+
+    python benchmarks/bench_defer_build.py [NUMBER_OF_MODELS]
+
+By default it creates 200 models.
+"""
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import registry
+from sqlmodel import Field, SQLModel
+
+
+def create_models(total: int, defer_build: bool) -> Tuple[List[Any], float]:
+    class Base(SQLModel, registry=registry()):
+        model_config = {"defer_build": defer_build}
+
+    # Keep a reference to the models, as the ones declared in a module would be
+    models: List[Any] = [Base]
+    start = time.perf_counter()
+    for i in range(total):
+        namespace: Dict[str, Any] = {
+            "__module__": __name__,
+            "__annotations__": {
+                "id": Optional[int],
+                "name": str,
+                "description": Optional[str],
+                "score": float,
+                "created_at": datetime,
+            },
+            "id": Field(default=None, primary_key=True),
+            "name": Field(index=True),
+            "description": None,
+        }
+        models.append(type(SQLModel)(f"Model{i}", (Base,), namespace, table=True))
+    return models, time.perf_counter() - start
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    _, eager = create_models(total, defer_build=False)
+    models, deferred = create_models(total, defer_build=True)
+    start = time.perf_counter()
+    rebuilt = models[0].rebuild_all()
+    rebuild = time.perf_counter() - start
+    assert len(rebuilt) == len(models)
+    print(f"{total:,} models")
+    print(f"{'eager':>14}: {eager * 1000:8.1f} ms")
+    print(f"{'defer_build':>14}: {deferred * 1000:8.1f} ms")
+    print(f"{'rebuild_all()':>14}: {rebuild * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Compare the time to dump a list of table model instances to JSON, one instance
+at a time with `model_dump()` and `model_dump_json()`, and all at once with
+`Hero.dump_many()`. Requires Pydantic v2.
+
+Run with:
+
+    python benchmarks/bench_dump.py [NUMBER_OF_ROWS ...]
+
+By default it dumps 1,000 and 10,000 instances.
+"""
+import json
+import sys
+import time
+from typing import Any, Callable, List, Optional
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Field, Session, SQLModel, create_engine, insert, select
+
+
+class Hero(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    secret_name: str
+    age: Optional[int] = None
+
+
+def measure(heroes: List[Hero], dump: Callable[[List[Hero]], Any]) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        dump(heroes)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(total: int) -> None:
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Hero),
+            [
+                {"name": f"Hero {i}", "secret_name": f"Secret {i}", "age": i % 100}
+                for i in range(total)
+            ],
+        )
+    with Session(engine) as session:
+        heroes = list(session.exec(select(Hero)).all())
+        cases = {
+            "model_dump + json.dumps": lambda heroes: json.dumps(
+                [hero.model_dump(mode="json") for hero in heroes]
+            ).encode(),
+            "model_dump_json joined": lambda heroes: b"["
+            + b",".join(hero.model_dump_json().encode() for hero in heroes)
+            + b"]",
+            "dump_many": lambda heroes: Hero.dump_many(heroes),
+        }
+        for name, dump in cases.items():
+            seconds = measure(heroes, dump)
+            print(f"{total:>10,} rows {name:<25} {seconds * 1000:10.2f} ms")
+
+
+def main() -> None:
+    totals = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000]
+    for total in totals:
+        bench(total)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Split the time of `session.exec(select(Hero)).all()` and of
+`session.exec_readonly(select(Hero)).all()` into compile, database round trip, row
+fetch and model hydration, with `sqlmodel.profiling.track_exec_timings()`, for
+increasing numbers of rows on SQLite.
+
+Run with:
+
+    python benchmarks/bench_exec_timings.py [NUMBER_OF_ROWS ...]
+
+By default it uses 10,000 and 100,000 rows.
+"""
+import sys
+from typing import Optional
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Field, Session, SQLModel, create_engine, insert, select
+from sqlmodel.profiling import ExecTiming, track_exec_timings
+
+
+class Hero(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    secret_name: str
+    age: Optional[int] = None
+
+
+def show(label: str, timing: ExecTiming) -> None:
+    steps = "  ".join(
+        f"{step} {getattr(timing, step) * 1000:7.1f}"
+        for step in ("compile", "execute", "fetch", "hydrate", "total")
+    )
+    print(f"{label:>16}: {steps} ms")
+
+
+def bench(total: int) -> None:
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.exec(
+            insert(Hero),
+            params=[
+                {"name": f"Hero {i}", "secret_name": f"Secret {i}", "age": i % 90}
+                for i in range(total)
+            ],
+        )
+        session.commit()
+    print(f"{total:,} rows")
+    for label in ("exec", "exec_readonly"):
+        with Session(engine) as session:
+            with track_exec_timings(session) as timings:
+                if label == "exec":
+                    session.exec(select(Hero)).all()
+                else:
+                    session.exec_readonly(select(Hero)).all()
+        show(label, timings.records[0])
+    engine.dispose()
+
+
+def main() -> None:
+    totals = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    for total in totals:
+        bench(total)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Measure the time to import sqlmodel in a fresh interpreter, with
+`python -X importtime`, both for a bare `import sqlmodel` and for the names a
+typical application uses.
+
+Run with:
+
+    python benchmarks/bench_import.py [NUMBER_OF_RUNS]
+
+By default it takes the best of 5 runs.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+STATEMENTS = {
+    "import sqlmodel": "import sqlmodel",
+    "first use": (
+        "from sqlmodel import Field, Session, SQLModel, create_engine, select"
+    ),
+}
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def import_times(statement: str) -> List[Tuple[str, int]]:
+    # -X importtime writes one line per module to stderr, with the cumulative
+    # time in microseconds in the second column and the nesting as indentation
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    times: List[Tuple[str, int]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times.append((name.rstrip(), int(cumulative)))
+    return times
+
+
+def total_time(times: List[Tuple[str, int]]) -> int:
+    # Sum the top-level entries after the interpreter startup (which ends with
+    # site), modules loaded lazily on first use show up as their own top-level
+    # entries after the one for sqlmodel
+    names = [name for name, _ in times]
+    start = names.index(" site") + 1 if " site" in names else 0
+    return sum(value for name, value in times[start:] if not name.startswith("  "))
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for label, statement in STATEMENTS.items():
+        samples: List[List[Tuple[str, int]]] = [
+            import_times(statement) for _ in range(runs)
+        ]
+        best = min(samples, key=total_time)
+        modules = {name.strip() for name, _ in best}
+        loaded = ", ".join(
+            name for name in ("sqlalchemy", "pydantic") if name in modules
+        )
+        print(
+            f"{label:>16}: {total_time(best) / 1000:8.1f} ms "
+            f"({len(best)} modules, loads: {loaded or 'nothing heavy'})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Measure how many rows per second are loaded into table model instances with
+`session.exec(select(Hero)).all()`, using SQLite in memory.
+
+Run with:
+
+    python benchmarks/bench_load.py [NUMBER_OF_ROWS ...]
+
+By default it loads 10,000, 100,000 and 1,000,000 rows.
+"""
+import sys
+import time
+from typing import Optional
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Field, Session, SQLModel, create_engine, insert, select
+
+
+class Hero(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(index=True)
+    secret_name: str
+    age: Optional[int] = Field(default=None, index=True)
+
+
+def bench(total: int) -> None:
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Hero),
+            [
+                {"name": f"Hero {i}", "secret_name": f"Secret {i}", "age": i % 100}
+                for i in range(total)
+            ],
+        )
+    best = float("inf")
+    for _ in range(3):
+        with Session(engine) as session:
+            start = time.perf_counter()
+            heroes = session.exec(select(Hero)).all()
+            best = min(best, time.perf_counter() - start)
+            assert len(heroes) == total
+    print(f"{total:>10,} rows {total / best:12,.0f} rows/s")
+
+
+def main() -> None:
+    totals = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    for total in totals:
+        bench(total)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Measure the memory used per table model instance loaded from the database with
+`session.exec(select(Hero)).all()`, using SQLite in memory.
+
+Run with:
+
+    python benchmarks/bench_memory.py [NUMBER_OF_ROWS]
+"""
+import gc
+import sys
+import tracemalloc
+from typing import Optional
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Field, Session, SQLModel, create_engine, insert, select
+
+
+class Hero(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    secret_name: str
+    age: Optional[int] = None
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Hero),
+            [
+                {"name": f"Hero {i}", "secret_name": f"Secret {i}", "age": i % 100}
+                for i in range(total)
+            ],
+        )
+    with Session(engine) as session:
+        # Warm up caches, compiled statements, etc.
+        session.exec(select(Hero).limit(1)).all()
+        gc.collect()
+        tracemalloc.start()
+        heroes = session.exec(select(Hero)).all()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert len(heroes) == total
+    print(f"{total:,} instances {current / total:8.1f} bytes per instance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Compare reading the pages of a table ordered by an indexed column with
+`.offset().limit()`, where the database skips all the previous rows for each
+page, with `.paginate()`, that filters the rows after the cursor of the
+previous page with `WHERE`, using the index.
+
+It reads the first pages and the last pages, to show that `OFFSET` degrades on
+deep pages while keyset pagination takes the same time for any page.
+
+Run with:
+
+    python benchmarks/bench_paginate.py [NUMBER_OF_HEROES ...]
+
+By default it uses 10,000 and 100,000 heroes.
+"""
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import registry
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+PAGE_SIZE = 50
+PAGES = 20
+
+
+def create_model() -> Any:
+    class Base(SQLModel, registry=registry()):
+        pass
+
+    class Hero(Base, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str = Field(index=True)
+        age: int
+
+    return Hero
+
+
+def measure(read: Callable[[int], Any], first_page: int) -> str:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        read(first_page)
+        best = min(best, time.perf_counter() - start)
+    return f"{best * 1000 / PAGES:8.2f} ms per page"
+
+
+def bench(total: int) -> None:
+    Hero = create_model()
+    engine = create_engine("sqlite://")
+    Hero.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.execute(
+            insert(Hero),
+            [{"name": f"Hero {i:07}", "age": i % 100} for i in range(total)],
+        )
+        session.commit()
+    last_pages = total // PAGE_SIZE - PAGES
+
+    def read_offset(first_page: int) -> List[Any]:
+        with Session(engine) as session:
+            return [
+                session.exec(
+                    select(Hero)
+                    .order_by(Hero.name, Hero.id)
+                    .offset(page * PAGE_SIZE)
+                    .limit(PAGE_SIZE)
+                ).all()
+                for page in range(first_page, first_page + PAGES)
+            ]
+
+    # The cursor for the first page to read, as a client would have from the
+    # previous page
+    start_cursors: Dict[int, Optional[str]] = {0: None, last_pages: None}
+    if last_pages:
+        with Session(engine) as session:
+            start_cursors[last_pages] = session.exec(
+                select(Hero).paginate(limit=last_pages * PAGE_SIZE, order_by=Hero.name)
+            ).next_cursor
+
+    def read_paginate(first_page: int) -> List[Any]:
+        pages = []
+        cursor = start_cursors[first_page]
+        with Session(engine) as session:
+            for _ in range(PAGES):
+                page = session.exec(
+                    select(Hero).paginate(
+                        after=cursor, limit=PAGE_SIZE, order_by=Hero.name
+                    )
+                )
+                pages.append(page.items)
+                cursor = page.next_cursor
+        return pages
+
+    def get_ids(pages: List[Any]) -> List[List[Any]]:
+        return [[hero.id for hero in page] for page in pages]
+
+    assert get_ids(read_offset(last_pages)) == get_ids(read_paginate(last_pages))
+    print(f"{total:,} heroes, {PAGE_SIZE} per page")
+    for label, first_page in [("first pages", 0), ("last pages", last_pages)]:
+        for method, read in [("offset", read_offset), ("paginate()", read_paginate)]:
+            result = measure(read, first_page)
+            print(f"{label:>12} {method:>11}: {result}")
+    engine.dispose()
+
+
+def main() -> None:
+    totals = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    for total in totals:
+        bench(total)
+
+
+if __name__ == "__main__":
+    main()
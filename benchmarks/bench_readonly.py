@@ -0,0 +1,80 @@
+"""
+Compare how many rows per second are loaded with the ORM path,
+`session.exec(select(Hero)).all()`, and with the read-only path,
+`session.exec_readonly(select(Hero)).all()`, building table model instances or
+non-table read model instances, and with `session.exec(select(HeroRead)).all()`,
+that only selects the columns of the read model, using SQLite in memory.
+
+Run with:
+
+    python benchmarks/bench_readonly.py [NUMBER_OF_ROWS ...]
+
+By default it loads 10,000 and 100,000 rows.
+"""
+import sys
+import time
+from typing import Any, Callable, List, Optional
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Field, Session, SQLModel, create_engine, insert, select
+
+
+class HeroBase(SQLModel):
+    name: str = Field(index=True)
+    age: Optional[int] = Field(default=None, index=True)
+
+
+class Hero(HeroBase, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    secret_name: str
+
+
+class HeroRead(HeroBase):
+    id: int
+
+
+def measure(engine: Any, total: int, load: Callable[[Session], List[Any]]) -> float:
+    best = float("inf")
+    for _ in range(3):
+        with Session(engine) as session:
+            start = time.perf_counter()
+            heroes = load(session)
+            best = min(best, time.perf_counter() - start)
+            assert len(heroes) == total
+    return total / best
+
+
+def bench(total: int) -> None:
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Hero),
+            [
+                {"name": f"Hero {i}", "secret_name": f"Secret {i}", "age": i % 100}
+                for i in range(total)
+            ],
+        )
+    cases = {
+        "exec": lambda session: session.exec(select(Hero)).all(),
+        "exec_readonly": lambda session: session.exec_readonly(select(Hero)).all(),
+        "exec_readonly read model": lambda session: session.exec_readonly(
+            select(Hero), model=HeroRead
+        ).all(),
+        "exec select(HeroRead)": lambda session: session.exec(select(HeroRead)).all(),
+    }
+    for name, load in cases.items():
+        rate = measure(engine, total, load)
+        print(f"{total:>10,} rows {name:<25} {rate:12,.0f} rows/s")
+
+
+def main() -> None:
+    totals = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    for total in totals:
+        bench(total)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Measure the throughput of attribute assignment on SQLModel instances.
+
+Run with:
+
+    python benchmarks/bench_setattr.py
+"""
+import timeit
+from typing import Optional
+
+from sqlmodel import Field, Session, SQLModel, create_engine
+
+N = 100_000
+
+
+class HeroBase(SQLModel):
+    name: str
+    secret_name: str
+    age: Optional[int] = None
+
+
+class Hero(HeroBase, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+
+def main() -> None:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    plain_hero = HeroBase(name="Deadpond", secret_name="Dive Wilson")
+    transient_hero = Hero(name="Deadpond", secret_name="Dive Wilson")
+    persistent_hero = Hero(name="Rusty-Man", secret_name="Tommy Sharp")
+    with Session(engine) as session:
+        session.add(persistent_hero)
+        session.commit()
+        session.refresh(persistent_hero)
+        for label, hero in [
+            ("non table model", plain_hero),
+            ("transient table instance", transient_hero),
+            ("persistent table instance", persistent_hero),
+        ]:
+            best = min(
+                timeit.repeat(
+                    "hero.age = 42", globals={"hero": hero}, number=N, repeat=5
+                )
+            )
+            print(f"{label:<28} {N / best:12,.0f} assignments/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Measure how many fields per second get their SQLAlchemy type resolved, the step
+that runs for every field of every table model when the class is created.
+
+Run with:
+
+    python benchmarks/bench_sqlalchemy_type.py [NUMBER_OF_ROUNDS]
+"""
+import ipaddress
+import sys
+import time
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Optional
+
+from sqlmodel import Field, SQLModel
+from sqlmodel.compat import get_model_fields, get_sqlalchemy_type
+
+
+class Color(str, Enum):
+    red = "red"
+    blue = "blue"
+
+
+class Hero(SQLModel):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    color: Color
+    score: float
+    active: bool
+    born: date
+    updated_at: datetime
+    balance: Decimal
+    address: ipaddress.IPv6Network
+    avatar: Path
+    uuid: uuid.UUID
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    fields = list(get_model_fields(Hero).values())
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for field in fields:
+            get_sqlalchemy_type(field)
+    elapsed = time.perf_counter() - start
+    total = rounds * len(fields)
+    print(f"{total:,} fields {total / elapsed:12,.0f} fields/s")
+
+
+if __name__ == "__main__":
+    main()
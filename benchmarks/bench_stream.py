@@ -0,0 +1,81 @@
+"""
+Compare the peak memory used to go through all the rows of a table with
+`session.exec(select(Hero))` and with `session.exec_stream(select(Hero))`, using
+SQLite in memory.
+
+Run with:
+
+    python benchmarks/bench_stream.py [NUMBER_OF_ROWS ...]
+
+By default it goes through 10,000, 100,000 and 500,000 rows.
+"""
+import gc
+import sys
+import tracemalloc
+from typing import Any, Callable, Optional
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Field, Session, SQLModel, create_engine, insert, select
+
+
+class Hero(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    secret_name: str
+    age: Optional[int] = None
+
+
+def exec_all(session: Session) -> int:
+    count = 0
+    for _ in session.exec(select(Hero)):
+        count += 1
+    return count
+
+
+def exec_stream(session: Session) -> int:
+    count = 0
+    for heroes in session.exec_stream(select(Hero), batch_size=1000):
+        count += len(heroes)
+    return count
+
+
+def measure(engine: Any, total: int, consume: Callable[[Session], int]) -> int:
+    with Session(engine) as session:
+        # Warm up caches, compiled statements, etc.
+        session.exec(select(Hero).limit(1)).all()
+        session.expunge_all()
+        gc.collect()
+        tracemalloc.start()
+        count = consume(session)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert count == total
+    return peak
+
+
+def bench(total: int) -> None:
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Hero),
+            [
+                {"name": f"Hero {i}", "secret_name": f"Secret {i}", "age": i % 100}
+                for i in range(total)
+            ],
+        )
+    for name, consume in [("exec", exec_all), ("exec_stream", exec_stream)]:
+        peak = measure(engine, total, consume)
+        print(f"{total:>10,} rows {name:<12} {peak / 1024 / 1024:10.1f} MiB peak")
+
+
+def main() -> None:
+    totals = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 500_000]
+    for total in totals:
+        bench(total)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Compare inserting or updating teams by name with a loop that selects each team
+and then inserts or updates it, two round trips per row, with
+`session.upsert()`, that sends `INSERT ... ON CONFLICT DO UPDATE` in chunks.
+
+Half of the rows are new and half already exist. SQLite runs in process, so the
+benchmark also simulates the round-trip time of a database server by sleeping
+0.5 ms before each query.
+
+Run with:
+
+    python benchmarks/bench_upsert.py [NUMBER_OF_TEAMS ...]
+
+By default it uses 100 and 1,000 teams.
+"""
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import registry
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+
+def create_model() -> Any:
+    class Base(SQLModel, registry=registry()):
+        pass
+
+    class Team(Base, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str = Field(unique=True)
+        headquarters: str
+
+    return Team
+
+
+def measure(engine: Any, save: Callable[[int], Any], latency: float) -> str:
+    queries = 0
+
+    def count(*args: Any) -> None:
+        nonlocal queries
+        queries += 1
+        time.sleep(latency)
+
+    event.listen(engine, "before_cursor_execute", count)
+    best = float("inf")
+    for run in range(5):
+        queries = 0
+        start = time.perf_counter()
+        save(run)
+        best = min(best, time.perf_counter() - start)
+    event.remove(engine, "before_cursor_execute", count)
+    return f"{best * 1000:8.1f} ms {queries:5} queries"
+
+
+def bench(total: int) -> None:
+    Team = create_model()
+
+    def get_rows(run: int) -> List[Dict[str, Any]]:
+        # Half of the rows of the previous run, half new ones
+        first = run * total // 2
+        return [
+            {"name": f"Team {i}", "headquarters": f"Tower {run}"}
+            for i in range(first, first + total)
+        ]
+
+    def select_then_insert(run: int) -> None:
+        with Session(engine) as session:
+            for row in get_rows(run):
+                team = session.exec(
+                    select(Team).where(Team.name == row["name"])
+                ).first()
+                if team is None:
+                    session.add(Team(**row))
+                else:
+                    team.headquarters = row["headquarters"]
+                session.flush()
+            session.commit()
+
+    def upsert(run: int) -> None:
+        with Session(engine) as session:
+            session.upsert(Team, get_rows(run))
+            session.commit()
+
+    print(f"{total:,} teams")
+    for label, save in [
+        ("select then insert", select_then_insert),
+        ("upsert()", upsert),
+    ]:
+        for latency in (0, 0.0005):
+            engine = create_engine("sqlite://")
+            Team.metadata.create_all(engine)
+            result = measure(engine, save, latency)
+            print(f"{label:>20} {latency * 1000:.1f} ms latency: {result}")
+            engine.dispose()
+
+
+def main() -> None:
+    totals = [int(arg) for arg in sys.argv[1:]] or [100, 1000]
+    for total in totals:
+        bench(total)
+
+
+if __name__ == "__main__":
+    main()
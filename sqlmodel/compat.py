@@ -1,18 +1,16 @@
-import ipaddress
-import uuid
-from datetime import date, datetime, time, timedelta
-from decimal import Decimal
-from enum import Enum
-from pathlib import Path
 from types import NoneType
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
     Any,
     Callable,
     Dict,
     ForwardRef,
+    List,
+    Mapping,
     Optional,
     Sequence,
+    Set,
     Type,
     TypeVar,
     Union,
@@ -22,40 +20,47 @@ from typing import (
 )
 
 from pydantic import VERSION as PYDANTIC_VERSION
-from sqlalchemy import (
-    Boolean,
-    Column,
-    Date,
-    DateTime,
-    Float,
-    ForeignKey,
-    Integer,
-    Interval,
-    Numeric,
-)
-from sqlalchemy import Enum as sa_Enum
+from sqlalchemy import Column, ForeignKey
 from sqlalchemy.orm import Mapped
-from sqlalchemy.sql.sqltypes import LargeBinary, Time
 
-from .sql.sqltypes import GUID, AutoString
+from .sql.sqltypes import get_sqlalchemy_type_for
 
 IS_PYDANTIC_V2 = int(PYDANTIC_VERSION.split(".")[0]) >= 2
 
 
 if IS_PYDANTIC_V2:
     from pydantic import ConfigDict as PydanticModelConfig
+    from pydantic import TypeAdapter
     from pydantic._internal._fields import PydanticMetadata
     from pydantic._internal._model_construction import ModelMetaclass
     from pydantic_core import PydanticUndefined as PydanticUndefined  # noqa
     from pydantic_core import PydanticUndefinedType as PydanticUndefinedType
 else:
     from pydantic import BaseConfig as PydanticModelConfig
+    from pydantic.error_wrappers import ValidationError
+    from pydantic.errors import MissingError
     from pydantic.fields import SHAPE_SINGLETON, ModelField
     from pydantic.fields import Undefined as PydanticUndefined  # noqa
     from pydantic.fields import UndefinedType as PydanticUndefinedType
     from pydantic.main import ModelMetaclass as ModelMetaclass
+    from pydantic.main import validate_model
     from pydantic.typing import resolve_annotations
 
+# Private SQLAlchemy APIs used by track_exec_timings() to fetch the rows apart from
+# building the objects, without them the fetch time is counted in hydrate
+try:
+    from sqlalchemy.engine.cursor import _DEFAULT_FETCH as _DEFAULT_FETCH
+    from sqlalchemy.engine.cursor import (
+        FullyBufferedCursorFetchStrategy as FullyBufferedCursorFetchStrategy,
+    )
+    from sqlalchemy.engine.default import DefaultExecutionContext
+
+    HAS_CURSOR_FETCH_INTERNALS = hasattr(
+        DefaultExecutionContext, "_is_server_side"
+    ) and hasattr(DefaultExecutionContext, "cursor_fetch_strategy")
+except ImportError:  # pragma: no cover
+    HAS_CURSOR_FETCH_INTERNALS = False
+
 if TYPE_CHECKING:
     from .main import FieldInfo, RelationshipInfo, SQLModel, SQLModelMetaclass
 
@@ -63,6 +68,7 @@ if TYPE_CHECKING:
 NoArgAnyCallable = Callable[[], Any]
 T = TypeVar("T")
 InstanceOrType = Union[T, Type[T]]
+_TSQLModel = TypeVar("_TSQLModel", bound="SQLModel")
 
 if IS_PYDANTIC_V2:
 
@@ -120,15 +126,214 @@ def get_fields_set(model: InstanceOrType["SQLModel"]) -> set[str]:
         return model.__fields_set__  # type: ignore
 
 
-def set_fields_set(
-    new_object: InstanceOrType["SQLModel"], fields: set["FieldInfo"]
-) -> None:
+def set_fields_set(new_object: InstanceOrType["SQLModel"], fields: set[str]) -> None:
     if IS_PYDANTIC_V2:
         object.__setattr__(new_object, "__pydantic_fields_set__", fields)
     else:
         object.__setattr__(new_object, "__fields_set__", fields)
 
 
+class _SharedEmptyFieldsSet(Set[str]):
+    # A single instance of this class is shared as the fields set of all the
+    # instances created without data, e.g. loaded from the database, until a field
+    # is set, so that they don't each need their own empty set. Pydantic requires
+    # a (mutable) set, so this is a set that refuses to be modified.
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("The shared empty fields set can't be modified")
+
+    add = discard = remove = pop = clear = _read_only  # type: ignore
+    update = difference_update = intersection_update = _read_only
+    symmetric_difference_update = _read_only
+    __ior__ = __iand__ = __isub__ = __ixor__ = _read_only  # type: ignore
+
+    def __copy__(self) -> Set[str]:
+        return set()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Set[str]:
+        return set()
+
+    def __reduce__(self) -> Any:
+        return (set, ())
+
+
+EMPTY_FIELDS_SET: Set[str] = _SharedEmptyFieldsSet()
+
+
+def get_mutable_fields_set(model: "SQLModel") -> Set[str]:
+    # Replace the shared empty fields set before a field is added to it
+    fields_set = get_fields_set(model)
+    if fields_set is EMPTY_FIELDS_SET:
+        fields_set = set()
+        set_fields_set(model, fields_set)
+    return fields_set
+
+
+def is_assignment_checked(model: Type["SQLModel"], name: str) -> bool:
+    # Pydantic has to handle assignments to the field if it validates them, or if
+    # it could reject them
+    field = get_model_fields(model)[name]
+    if IS_PYDANTIC_V2:
+        return bool(
+            get_config_value(model, "validate_assignment", False)
+            or get_config_value(model, "frozen", False)
+            or field.frozen
+        )
+    else:
+        return bool(
+            get_config_value(model, "validate_assignment", False)
+            or get_config_value(model, "frozen", False)
+            or not get_config_value(model, "allow_mutation", True)
+            or not field.field_info.allow_mutation  # type: ignore
+            or field.final  # type: ignore
+        )
+
+
+def get_field_default(field: "FieldInfo") -> Any:
+    if IS_PYDANTIC_V2:
+        return field.get_default(call_default_factory=True)
+    else:
+        return field.get_default()
+
+
+def is_field_required(field: "FieldInfo") -> bool:
+    if IS_PYDANTIC_V2:
+        return field.is_required()
+    else:
+        return field.required  # type: ignore
+
+
+def init_pydantic_private_attrs(new_object: "SQLModel") -> None:
+    # Replicate what Pydantic's model_construct() / construct() does after setting
+    # the __dict__ and the fields set
+    if IS_PYDANTIC_V2:
+        extra: Optional[Dict[str, Any]] = (
+            {} if new_object.model_config.get("extra") == "allow" else None
+        )
+        object.__setattr__(new_object, "__pydantic_extra__", extra)
+        if new_object.__pydantic_post_init__:
+            new_object.model_post_init(None)
+        else:
+            object.__setattr__(new_object, "__pydantic_private__", None)
+    else:
+        new_object._init_private_attributes()  # type: ignore
+
+
+def _get_list_adapter(model: Type["SQLModel"]) -> Any:
+    # A validator and serializer for a list of the model, built once per class, to
+    # validate or dump all the instances in a single call to pydantic-core
+    adapter: Any = model.__dict__.get("__sqlmodel_list_adapter__")
+    if adapter is None:
+        adapter = TypeAdapter(List[model])  # type: ignore
+        model.__sqlmodel_list_adapter__ = adapter
+    return adapter
+
+
+def validate_models(
+    model: Type[_TSQLModel], rows: Sequence[Mapping[str, Any]], partial: bool = False
+) -> List[_TSQLModel]:
+    # Validate many dicts at once, the errors have the index of each row. The new
+    # instances are created as in _sqlmodel_construct(), by SQLAlchemy for table
+    # models, as Pydantic doesn't instrument them. With partial, missing required
+    # fields are not errors, the same as always for table models in Pydantic v2
+    if IS_PYDANTIC_V2:
+        validated = _get_list_adapter(model).validate_python(rows)
+        return [
+            model._sqlmodel_construct(instance.__dict__, get_fields_set(instance))
+            for instance in validated
+        ]
+    else:
+        new_objects = []
+        for row in rows:
+            values, fields_set, validation_error = validate_model(model, row)
+            if validation_error and partial:
+                raw_errors = [
+                    error
+                    for error in validation_error.raw_errors
+                    if not isinstance(getattr(error, "exc", None), MissingError)
+                ]
+                validation_error = (
+                    ValidationError(raw_errors, model) if raw_errors else None
+                )
+            if validation_error:
+                raise validation_error
+            new_objects.append(model._sqlmodel_construct(values, fields_set))
+        return new_objects
+
+
+def dump_models(
+    model: Type["SQLModel"],
+    instances: Sequence["SQLModel"],
+    *,
+    mode: str,
+    include: Optional[AbstractSet[str]],
+    exclude: Optional[AbstractSet[str]],
+    by_alias: bool,
+    exclude_unset: bool,
+    exclude_defaults: bool,
+    exclude_none: bool,
+) -> Union[bytes, List[Dict[str, Any]]]:
+    if IS_PYDANTIC_V2:
+        adapter = _get_list_adapter(model)
+        kwargs: Dict[str, Any] = {
+            "include": {"__all__": include} if include is not None else None,
+            "exclude": {"__all__": exclude} if exclude is not None else None,
+            "by_alias": by_alias,
+            "exclude_unset": exclude_unset,
+            "exclude_defaults": exclude_defaults,
+            "exclude_none": exclude_none,
+        }
+        if mode == "json":
+            return cast(bytes, adapter.dump_json(instances, **kwargs))
+        return cast(List[Dict[str, Any]], adapter.dump_python(instances, **kwargs))
+    else:
+        data = [
+            instance.dict(
+                include=include,  # type: ignore[arg-type]
+                exclude=exclude,  # type: ignore[arg-type]
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+            )
+            for instance in instances
+        ]
+        if mode == "json":
+            v1_model: Any = model
+            json_data: str = v1_model.__config__.json_dumps(
+                data, default=v1_model.__json_encoder__
+            )
+            return json_data.encode()
+        return data
+
+
+def rebuild_model(model: Type["SQLModel"], *, raise_errors: bool = True) -> bool:
+    # Returns True if the model had a pending build and it was completed now
+    if IS_PYDANTIC_V2:
+        # Models created with defer_build=True, or with forward references that
+        # couldn't be resolved yet, get their core schema, validator and serializer
+        # on first use, build them now instead
+        if model.__pydantic_complete__:
+            return False
+        return bool(model.model_rebuild(raise_errors=raise_errors))
+    else:
+        # Pydantic v1 builds the validators when the class is created, only the
+        # forward references can be pending
+        v1_model: Any = model
+        if not any(
+            field.type_.__class__ == ForwardRef
+            for field in v1_model.__fields__.values()
+        ):
+            return False
+        try:
+            v1_model.update_forward_refs()
+        except NameError:
+            if raise_errors:
+                raise
+            return False
+        return True
+
+
 def set_attribute_mode(cls: Type["SQLModelMetaclass"]) -> None:
     if IS_PYDANTIC_V2:
         cls.model_config["read_from_attributes"] = True
@@ -279,49 +484,7 @@ def get_sqlalchemy_type(field: Any) -> Any:
 
     type_ = get_type_from_field(field)
     metadata = get_field_metadata(field)
-
-    # Check enums first as an enum can also be a str, needed by Pydantic/FastAPI
-    if issubclass(type_, Enum):
-        return sa_Enum(type_)
-    if issubclass(type_, str):
-        max_length = getattr(metadata, "max_length", None)
-        if max_length:
-            return AutoString(length=max_length)
-        return AutoString
-    if issubclass(type_, float):
-        return Float
-    if issubclass(type_, bool):
-        return Boolean
-    if issubclass(type_, int):
-        return Integer
-    if issubclass(type_, datetime):
-        return DateTime
-    if issubclass(type_, date):
-        return Date
-    if issubclass(type_, timedelta):
-        return Interval
-    if issubclass(type_, time):
-        return Time
-    if issubclass(type_, bytes):
-        return LargeBinary
-    if issubclass(type_, Decimal):
-        return Numeric(
-            precision=getattr(metadata, "max_digits", None),
-            scale=getattr(metadata, "decimal_places", None),
-        )
-    if issubclass(type_, ipaddress.IPv4Address):
-        return AutoString
-    if issubclass(type_, ipaddress.IPv4Network):
-        return AutoString
-    if issubclass(type_, ipaddress.IPv6Address):
-        return AutoString
-    if issubclass(type_, ipaddress.IPv6Network):
-        return AutoString
-    if issubclass(type_, Path):
-        return AutoString
-    if issubclass(type_, uuid.UUID):
-        return GUID
-    raise ValueError(f"{type_} has no matching SQLAlchemy type")
+    return get_sqlalchemy_type_for(type_, metadata)
 
 
 def get_type_from_field(field: Any) -> type:
@@ -425,3 +588,21 @@ def get_column_from_field(field: Any) -> Column:  # type: ignore
     if sa_column_kwargs is not PydanticUndefined:
         kwargs.update(cast(Dict[Any, Any], sa_column_kwargs))
     return Column(sa_type, *args, **kwargs)  # type: ignore
+
+
+def get_compiled_time(compiled: Any) -> Optional[float]:
+    # When SQLAlchemy compiled the statement, from time.perf_counter(), private
+    return getattr(compiled, "_gen_time", None)
+
+
+def prefetch_cursor_rows(context: Any, cursor: Any) -> bool:
+    # Fetch all the rows from the DBAPI cursor now, instead of when the result is
+    # read, unless the result is streamed or already has its own fetch strategy
+    if (
+        not HAS_CURSOR_FETCH_INTERNALS
+        or getattr(context, "_is_server_side", True)
+        or getattr(context, "cursor_fetch_strategy", None) is not _DEFAULT_FETCH
+    ):
+        return False
+    context.cursor_fetch_strategy = FullyBufferedCursorFetchStrategy(cursor)
+    return True
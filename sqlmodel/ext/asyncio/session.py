@@ -1,6 +1,9 @@
 from typing import (
     Any,
+    AsyncGenerator,
     Dict,
+    Iterable,
+    List,
     Mapping,
     Optional,
     Sequence,
@@ -16,23 +19,36 @@ from sqlalchemy.engine.interfaces import _CoreAnyExecuteParams
 from sqlalchemy.engine.result import Result, ScalarResult, TupleResult
 from sqlalchemy.ext.asyncio import AsyncSession as _AsyncSession
 from sqlalchemy.ext.asyncio.result import _ensure_sync_result
-from sqlalchemy.ext.asyncio.session import _EXECUTE_OPTIONS
+from sqlalchemy.ext.asyncio.session import _EXECUTE_OPTIONS, _STREAM_OPTIONS
 from sqlalchemy.orm._typing import OrmExecuteOptionsParameter
 from sqlalchemy.sql.base import Executable as _Executable
 from sqlalchemy.util.concurrency import greenlet_spawn
 from typing_extensions import deprecated
 
+from ...main import SQLModel
 from ...orm.session import Session
+from ...profiling import add_call_site
 from ...sql.base import Executable
 from ...sql.expression import Select, SelectOfScalar
+from ...sql.pagination import Page, Paginated
 
 _TSelectParam = TypeVar("_TSelectParam", bound=Any)
+_TSQLModel = TypeVar("_TSQLModel", bound=SQLModel)
 
 
 class AsyncSession(_AsyncSession):
     sync_session_class: Type[Session] = Session
     sync_session: Session
 
+    def enable_batch_lazy_loads(self) -> None:
+        """
+        Make the first lazy load of a relationship load it for all the objects of
+        the same class in the session, with one `IN` query.
+
+        See `Session.enable_batch_lazy_loads()`.
+        """
+        self.sync_session.enable_batch_lazy_loads()
+
     @overload
     async def exec(
         self,
@@ -59,12 +75,26 @@ class AsyncSession(_AsyncSession):
     ) -> ScalarResult[_TSelectParam]:
         ...
 
+    @overload
+    async def exec(
+        self,
+        statement: Paginated[_TSelectParam],
+        *,
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+        _parent_execute_state: Optional[Any] = None,
+        _add_event: Optional[Any] = None,
+    ) -> Page[_TSelectParam]:
+        ...
+
     async def exec(
         self,
         statement: Union[
             Select[_TSelectParam],
             SelectOfScalar[_TSelectParam],
             Executable[_TSelectParam],
+            Paginated[_TSelectParam],
         ],
         *,
         params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
@@ -72,13 +102,16 @@ class AsyncSession(_AsyncSession):
         bind_arguments: Optional[Dict[str, Any]] = None,
         _parent_execute_state: Optional[Any] = None,
         _add_event: Optional[Any] = None,
-    ) -> Union[TupleResult[_TSelectParam], ScalarResult[_TSelectParam]]:
+    ) -> Union[
+        TupleResult[_TSelectParam], ScalarResult[_TSelectParam], Page[_TSelectParam]
+    ]:
         if execution_options:
             execution_options = util.immutabledict(execution_options).union(
                 _EXECUTE_OPTIONS
             )
         else:
             execution_options = _EXECUTE_OPTIONS
+        execution_options = add_call_site(execution_options)
 
         result = await greenlet_spawn(
             self.sync_session.exec,
@@ -89,11 +122,206 @@ class AsyncSession(_AsyncSession):
             _parent_execute_state=_parent_execute_state,
             _add_event=_add_event,
         )
+        if isinstance(result, Page):
+            return result
         result_value = await _ensure_sync_result(
             cast(Result[_TSelectParam], result), self.exec
         )
         return result_value  # type: ignore
 
+    @overload
+    def exec_stream(
+        self,
+        statement: Select[_TSelectParam],
+        *,
+        batch_size: int = 1000,
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+    ) -> AsyncGenerator[Sequence[_TSelectParam], None]:
+        ...
+
+    @overload
+    def exec_stream(
+        self,
+        statement: SelectOfScalar[_TSelectParam],
+        *,
+        batch_size: int = 1000,
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+    ) -> AsyncGenerator[Sequence[_TSelectParam], None]:
+        ...
+
+    async def exec_stream(
+        self,
+        statement: Union[Select[_TSelectParam], SelectOfScalar[_TSelectParam]],
+        *,
+        batch_size: int = 1000,
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+    ) -> AsyncGenerator[Sequence[_TSelectParam], None]:
+        """
+        Execute a select and iterate asynchronously over the results in batches of
+        `batch_size`, using a server side cursor, without buffering the whole
+        result.
+
+        ```Python
+        async for heroes in session.exec_stream(select(Hero), batch_size=500):
+            for hero in heroes:
+                print(hero)
+        ```
+
+        See `Session.exec_stream()`.
+        """
+        execution_options = util.immutabledict(execution_options).union(_STREAM_OPTIONS)
+        execution_options = add_call_site(execution_options)
+        batches = self.sync_session.exec_stream(
+            statement,
+            batch_size=batch_size,
+            params=params,
+            execution_options=execution_options,
+            bind_arguments=bind_arguments,
+        )
+        try:
+            # Each batch is fetched in a greenlet, as AsyncResult does, so that the
+            # database driver can be awaited
+            while True:
+                batch: Optional[Sequence[_TSelectParam]] = await greenlet_spawn(
+                    next, batches, None
+                )
+                if batch is None:
+                    break
+                yield batch
+        finally:
+            await greenlet_spawn(batches.close)
+
+    @overload
+    async def exec_readonly(
+        self,
+        statement: SelectOfScalar[_TSelectParam],
+        *,
+        model: None = None,
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+    ) -> ScalarResult[_TSelectParam]:
+        ...
+
+    @overload
+    async def exec_readonly(
+        self,
+        statement: Union[Select[Any], SelectOfScalar[Any]],
+        *,
+        model: Type[_TSQLModel],
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+    ) -> ScalarResult[_TSQLModel]:
+        ...
+
+    async def exec_readonly(
+        self,
+        statement: Union[Select[Any], SelectOfScalar[Any]],
+        *,
+        model: Optional[Type[SQLModel]] = None,
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+    ) -> ScalarResult[Any]:
+        """
+        Execute a select and return plain model instances built directly from the
+        rows, without validation, not tracked by the session.
+
+        See `Session.exec_readonly()`.
+        """
+        if execution_options:
+            execution_options = util.immutabledict(execution_options).union(
+                _EXECUTE_OPTIONS
+            )
+        else:
+            execution_options = _EXECUTE_OPTIONS
+        execution_options = add_call_site(execution_options)
+
+        result = await greenlet_spawn(
+            self.sync_session.exec_readonly,
+            statement,
+            model=model,
+            params=params,
+            execution_options=execution_options,
+            bind_arguments=bind_arguments,
+        )
+        result_value = await _ensure_sync_result(
+            cast(Result[Any], result), self.exec_readonly
+        )
+        return result_value  # type: ignore
+
+    async def bulk_insert(
+        self,
+        model: Type[_TSQLModel],
+        rows: Iterable[Union[_TSQLModel, Mapping[str, Any]]],
+        *,
+        returning: bool = True,
+        chunk_size: int = 1000,
+    ) -> List[_TSQLModel]:
+        """
+        Insert many rows of a table model with a few statements, skipping the unit
+        of work.
+
+        See `Session.bulk_insert()`.
+        """
+        return await greenlet_spawn(
+            self.sync_session.bulk_insert,
+            model,
+            rows,
+            returning=returning,
+            chunk_size=chunk_size,
+        )
+
+    async def upsert(
+        self,
+        model: Type[_TSQLModel],
+        rows: Iterable[Union[_TSQLModel, Mapping[str, Any]]],
+        *,
+        conflict_on: Optional[Sequence[Any]] = None,
+        update: Optional[Sequence[Any]] = None,
+        returning: bool = True,
+        chunk_size: int = 1000,
+    ) -> List[_TSQLModel]:
+        """
+        Insert many rows of a table model, or update the existing ones, with
+        `INSERT ... ON CONFLICT`.
+
+        See `Session.upsert()`.
+        """
+        return await greenlet_spawn(
+            self.sync_session.upsert,
+            model,
+            rows,
+            conflict_on=conflict_on,
+            update=update,
+            returning=returning,
+            chunk_size=chunk_size,
+        )
+
+    async def bulk_update(
+        self,
+        model: Type[_TSQLModel],
+        rows: Iterable[Union[_TSQLModel, Mapping[str, Any]]],
+        *,
+        chunk_size: int = 1000,
+    ) -> int:
+        """
+        Update many rows of a table model by primary key, with only the columns
+        that changed, without loading them first.
+
+        See `Session.bulk_update()`.
+        """
+        return await greenlet_spawn(
+            self.sync_session.bulk_update, model, rows, chunk_size=chunk_size
+        )
+
     @deprecated(
         """
         🚨 You probably want to use `session.exec()` instead of `session.execute()`.
@@ -1,11 +1,16 @@
 import weakref
+from functools import partial
+from types import MappingProxyType
 from typing import (
     AbstractSet,
     Any,
     Callable,
     ClassVar,
     Dict,
+    Iterable,
+    Iterator,
     List,
+    Literal,
     Mapping,
     Optional,
     Sequence,
@@ -22,20 +27,27 @@ from pydantic import BaseModel
 from pydantic.fields import FieldInfo as PydanticFieldInfo
 from sqlalchemy import (
     Column,
+    event,
     inspect,
+    select,
+    tuple_,
 )
 from sqlalchemy.orm import (
+    Mapper,
     RelationshipProperty,
+    configure_mappers,
     declared_attr,
     registry,
     relationship,
 )
 from sqlalchemy.orm.attributes import set_attribute
+from sqlalchemy.orm.base import opt_manager_of_class
 from sqlalchemy.orm.decl_api import DeclarativeMeta
-from sqlalchemy.orm.instrumentation import is_instrumented
+from sqlalchemy.orm.state import InstanceState
 from sqlalchemy.sql.schema import MetaData
 
 from .compat import (
+    EMPTY_FIELDS_SET,
     IS_PYDANTIC_V2,
     ModelMetaclass,
     NoArgAnyCallable,
@@ -45,22 +57,32 @@ from .compat import (
     SQLModelConfig,
     class_dict_is_table,
     cls_is_table,
+    dump_models,
     get_annotations,
     get_column_from_field,
     get_config_value,
+    get_field_default,
+    get_fields_set,
     get_model_fields,
+    get_mutable_fields_set,
     get_relationship_to,
+    init_pydantic_private_attrs,
+    is_assignment_checked,
+    is_field_required,
+    rebuild_model,
     set_config_value,
     set_empty_defaults,
     set_fields_set,
 )
+from .orm.loading import RelationshipLoad, is_relationship_load
+from .profiling import profile_phase
 
 if not IS_PYDANTIC_V2:
     from pydantic.errors import ConfigError, DictError
     from pydantic.main import validate_model
     from pydantic.utils import ROOT_KEY, Representation
 else:
-    from pydantic.v1.utils import ROOT_KEY, Representation
+    from pydantic._internal._repr import Representation
 
 
 _T = TypeVar("_T")
@@ -145,6 +167,7 @@ class RelationshipInfo(Representation):
         sa_relationship: Optional[RelationshipProperty] = None,  # type: ignore
         sa_relationship_args: Optional[Sequence[Any]] = None,
         sa_relationship_kwargs: Optional[Mapping[str, Any]] = None,
+        load: Optional[RelationshipLoad] = None,
     ) -> None:
         if sa_relationship is not None:
             if sa_relationship_args is not None:
@@ -157,11 +180,25 @@ class RelationshipInfo(Representation):
                     "Passing sa_relationship_kwargs is not supported when "
                     "also passing a sa_relationship"
                 )
+            if load is not None:
+                raise RuntimeError(
+                    "Passing load is not supported when also passing a "
+                    "sa_relationship"
+                )
+        if load is not None:
+            if not is_relationship_load(load):
+                raise RuntimeError(f"Invalid relationship load: {load!r}")
+            if sa_relationship_kwargs and "lazy" in sa_relationship_kwargs:
+                raise RuntimeError(
+                    "Passing load is not supported when also passing lazy in "
+                    "sa_relationship_kwargs"
+                )
         self.back_populates = back_populates
         self.link_model = link_model
         self.sa_relationship = sa_relationship
         self.sa_relationship_args = sa_relationship_args
         self.sa_relationship_kwargs = sa_relationship_kwargs
+        self.load = load
 
 
 @overload
@@ -337,6 +374,7 @@ def Relationship(
     link_model: Optional[Any] = None,
     sa_relationship_args: Optional[Sequence[Any]] = None,
     sa_relationship_kwargs: Optional[Mapping[str, Any]] = None,
+    load: Optional[RelationshipLoad] = None,
 ) -> Any:
     ...
 
@@ -358,6 +396,7 @@ def Relationship(
     sa_relationship: Optional[RelationshipProperty] = None,
     sa_relationship_args: Optional[Sequence[Any]] = None,
     sa_relationship_kwargs: Optional[Mapping[str, Any]] = None,
+    load: Optional[RelationshipLoad] = None,
 ) -> Any:
     relationship_info = RelationshipInfo(
         back_populates=back_populates,
@@ -365,13 +404,203 @@ def Relationship(
         sa_relationship=sa_relationship,
         sa_relationship_args=sa_relationship_args,
         sa_relationship_kwargs=sa_relationship_kwargs,
+        load=load,
     )
     return relationship_info
 
 
+# How SQLModel.__setattr__ stores each attribute, computed once per class and name
+# Only in the instance __dict__, used for _sa_instance_state
+_SETATTR_DICT = 0
+# Only in SQLAlchemy, that stores it in the same instance __dict__ used by Pydantic,
+# and then mark it as set in Pydantic, for columns
+_SETATTR_SA_AND_FIELDS_SET = 1
+# In SQLAlchemy, to trigger events and updates, and then in Pydantic, for columns
+# that Pydantic validates (or could reject) on assignment
+_SETATTR_SA_AND_PYDANTIC = 2
+# Only in SQLAlchemy, for relationships and other instrumented attributes
+_SETATTR_SA = 3
+# Only in Pydantic, for non table models and non instrumented attributes
+_SETATTR_PYDANTIC = 4
+# Not stored, relationships in non table models
+_SETATTR_SKIP = 5
+
+
+def _get_setattr_strategy(cls: Type[Any], name: str) -> int:
+    if name == "_sa_instance_state":
+        return _SETATTR_DICT
+    manager = opt_manager_of_class(cls)
+    instrumented = (
+        get_config_value(cls, "table", False)
+        and manager is not None
+        and manager.is_instrumented(name, search=True)
+    )
+    if name in cls.__sqlmodel_relationships__:
+        return _SETATTR_SA if instrumented else _SETATTR_SKIP
+    if not instrumented:
+        return _SETATTR_PYDANTIC
+    # Instrumented attributes that are not fields, e.g. a backref, are not stored
+    # in Pydantic
+    if name not in get_model_fields(cls):
+        return _SETATTR_SA
+    if is_assignment_checked(cls, name):
+        return _SETATTR_SA_AND_PYDANTIC
+    return _SETATTR_SA_AND_FIELDS_SET
+
+
+def _build_setattr_dispatch(cls: Type[Any]) -> Mapping[str, int]:
+    names = {
+        "_sa_instance_state",
+        *get_model_fields(cls),
+        *cls.__sqlmodel_relationships__,
+    }
+    manager = opt_manager_of_class(cls)
+    if manager is not None:
+        names.update(manager.keys())
+    return MappingProxyType({name: _get_setattr_strategy(cls, name) for name in names})
+
+
+def _set_sa_attribute(instance: Any, name: str, value: Any) -> None:
+    try:
+        set_attribute(instance, name, value)
+    except AttributeError:
+        # Table model instances from read-only results have no SQLAlchemy state
+        if (
+            get_config_value(instance.__class__, "table", False)
+            and "_sa_instance_state" not in instance.__dict__
+        ):
+            raise TypeError(
+                f"Can't set {name!r}, {instance.__class__.__name__} instances from "
+                "read-only results are immutable, load them with session.exec() to "
+                "modify them"
+            ) from None
+        raise
+
+
+def _build_new_instance(cls: Type[Any]) -> Callable[..., Any]:
+    manager = cls._sa_class_manager
+    object_new = object.__new__
+
+    # The same as ClassManager.new_instance(), used by SQLAlchemy to create each
+    # instance loaded from the database, with the logic from SQLModel.__new__
+    # inlined and storing the state directly in the __dict__, without going
+    # through SQLModel.__setattr__
+    def new_instance(state: Optional[InstanceState[Any]] = None) -> Any:
+        instance = object_new(cls)
+        set_fields_set(instance, EMPTY_FIELDS_SET)
+        if state is None:
+            state = manager._state_constructor(instance, manager)
+        instance.__dict__["_sa_instance_state"] = state
+        return instance
+
+    return new_instance
+
+
+def _on_mapper_configured(mapper: Mapper[Any], cls: Type[Any]) -> None:
+    # Configuring the mappers can add new instrumented attributes, e.g. a backref
+    cls.__sqlmodel_setattr_dispatch__ = _build_setattr_dispatch(cls)
+    # Only if no class before SQLModel in the MRO defines __new__, as it would be
+    # skipped. ClassManager.new_instance() is private, SQLAlchemy calls it on the
+    # manager of the mapped class to load rows and in Session.merge(), with an
+    # optional state, and the manager is specific to this class, so replacing it
+    # in the instance only affects this class. Checked with SQLAlchemy 2.0 up to
+    # 2.0.54, test_load.py checks the factory is in place
+    mro = cls.__mro__
+    if not any("__new__" in vars(klass) for klass in mro[: mro.index(SQLModel)]):
+        cls._sa_class_manager.new_instance = _build_new_instance(cls)
+
+
+def _get_read_model_table(cls: Type[Any]) -> Type[Any]:
+    # The table model a non-table model reads its fields from, the only table model
+    # among the subclasses of its closest base, e.g. Hero for HeroRead, when both
+    # inherit from HeroBase
+    for base in cls.__mro__:
+        if base is SQLModel or not issubclass(base, SQLModel):
+            continue
+        tables = set()
+        pending = [base]
+        while pending:
+            subclass = pending.pop()
+            if get_config_value(subclass, "table", False):
+                tables.add(subclass)
+            pending.extend(subclass.__subclasses__())
+        if len(tables) == 1:
+            return tables.pop()
+        if tables:
+            names = ", ".join(sorted(table.__name__ for table in tables))
+            raise RuntimeError(
+                f"Can't select {cls.__name__}, it shares fields with more than one "
+                f"table model: {names}"
+            )
+    raise RuntimeError(
+        f"Can't select {cls.__name__}, it's not a table model and it doesn't share "
+        "fields with one"
+    )
+
+
+def _build_read_columns(cls: Type[Any]) -> Tuple[Any, ...]:
+    table = _get_read_model_table(cls)
+    mapper_columns = table.__mapper__.columns
+    columns: List[Any] = []
+    for name, field in get_model_fields(cls).items():
+        if name in mapper_columns:
+            column = mapper_columns[name]
+            columns.append(column if column.key == name else column.label(name))
+        elif is_field_required(field):
+            raise RuntimeError(
+                f"Can't select {cls.__name__}, the field {name} is not a column of "
+                f"{table.__name__}"
+            )
+    return tuple(columns)
+
+
+def _load_expired(cls: Type[Any], instances: Sequence[Any]) -> None:
+    # Load the expired attributes of the instances, e.g. after a commit, with one
+    # IN query per session (and per 500 objects) instead of one query per object.
+    # Loading rows for objects in the identity map fills only their unloaded
+    # attributes, keeping the changes not flushed yet
+    pending: Dict[Any, List[Tuple[Any, ...]]] = {}
+    for instance in instances:
+        state = instance.__dict__.get("_sa_instance_state")
+        if state is None or not state.expired_attributes:
+            continue
+        session = state.session
+        if session is None or state.key is None:
+            # Raises the same error as reading it, e.g. for a detached object
+            getattr(instance, next(iter(state.expired_attributes)))
+            continue
+        pending.setdefault(session, []).append(state.key[1])
+    primary_key = cls.__mapper__.primary_key
+    for session, identities in pending.items():
+        for start in range(0, len(identities), 500):
+            chunk = list(dict.fromkeys(identities[start : start + 500]))
+            if len(primary_key) == 1:
+                criteria = primary_key[0].in_([identity[0] for identity in chunk])
+            else:
+                criteria = tuple_(*primary_key).in_(chunk)
+            session.execute(select(cls).where(criteria)).all()
+
+
+# Duplicate logic from Pydantic to filter config kwargs because if they are passed
+# directly including the registry Pydantic will pass them over to the superclass
+# causing an error
+_allowed_config_kwargs: Set[str] = {
+    key
+    for key in dir(PydanticModelConfig)
+    if not (
+        key.startswith("__") and key.endswith("__")
+    )  # skip dunder methods and attributes
+}
+
+
+# The number of table models created, to invalidate the cached read model columns
+_table_models_created = [0]
+
+
 @__dataclass_transform__(kw_only_default=True, field_descriptors=(Field, FieldInfo))
 class SQLModelMetaclass(ModelMetaclass, DeclarativeMeta):
     __sqlmodel_relationships__: Dict[str, RelationshipInfo]
+    __sqlmodel_setattr_dispatch__: Mapping[str, int]
     if IS_PYDANTIC_V2:
         model_config: SQLModelConfig
         model_fields: Dict[str, FieldInfo]
@@ -415,31 +644,29 @@ class SQLModelMetaclass(ModelMetaclass, DeclarativeMeta):
                 relationship_annotations[k] = v
             else:
                 pydantic_annotations[k] = v
+        module = class_dict.get("__module__")
+        qualname = class_dict.get("__qualname__", name)
         dict_used = {
             **dict_for_pydantic,
             "__weakref__": None,
             "__sqlmodel_relationships__": relationships,
             "__annotations__": pydantic_annotations,
         }
-        # Duplicate logic from Pydantic to filter config kwargs because if they are
-        # passed directly including the registry Pydantic will pass them over to the
-        # superclass causing an error
-        allowed_config_kwargs: Set[str] = {
-            key
-            for key in dir(PydanticModelConfig)
-            if not (
-                key.startswith("__") and key.endswith("__")
-            )  # skip dunder methods and attributes
-        }
-        config_kwargs = {
-            key: kwargs[key] for key in kwargs.keys() & allowed_config_kwargs
-        }
-        if class_dict_is_table(class_dict, kwargs):
-            set_empty_defaults(pydantic_annotations, dict_used)
+        with profile_phase(module, qualname, "config"):
+            config_kwargs = {
+                key: kwargs[key] for key in kwargs.keys() & _allowed_config_kwargs
+            }
+            if IS_PYDANTIC_V2 and "defer_build" in kwargs:
+                # Allow class Hero(SQLModel, table=True, defer_build=True) to build
+                # the Pydantic schema on first use instead of at import time
+                config_kwargs["defer_build"] = kwargs["defer_build"]
+            if class_dict_is_table(class_dict, kwargs):
+                set_empty_defaults(pydantic_annotations, dict_used)
 
-        new_cls: Type["SQLModelMetaclass"] = super().__new__(
-            cls, name, bases, dict_used, **config_kwargs
-        )
+        with profile_phase(module, qualname, "pydantic"):
+            new_cls: Type["SQLModelMetaclass"] = super().__new__(
+                cls, name, bases, dict_used, **config_kwargs
+            )
         new_cls.__annotations__ = {
             **relationship_annotations,
             **pydantic_annotations,
@@ -459,9 +686,10 @@ class SQLModelMetaclass(ModelMetaclass, DeclarativeMeta):
         if config_table is True:
             # If it was passed by kwargs, ensure it's also set in config
             set_config_value(new_cls, "table", config_table)
-            for k, v in get_model_fields(new_cls).items():
-                col = get_column_from_field(v)
-                setattr(new_cls, k, col)
+            with profile_phase(module, qualname, "columns"):
+                for k, v in get_model_fields(new_cls).items():
+                    col = get_column_from_field(v)
+                    setattr(new_cls, k, col)
             # Set a config flag to tell FastAPI that this should be read with a field
             # in orm_mode instead of preemptively converting it to a dict.
             # This could be done by reading new_cls.model_config['table'] in FastAPI, but
@@ -489,6 +717,7 @@ class SQLModelMetaclass(ModelMetaclass, DeclarativeMeta):
         # this allows FastAPI cloning a SQLModel for the response_model without
         # trying to create a new SQLAlchemy, for a new table, with the same name, that
         # triggers an error
+        module, qualname = cls.__module__, cls.__qualname__
         base_is_table = any(cls_is_table(base) for base in bases)
         if cls_is_table(cls) and not base_is_table:
             for rel_name, rel_info in cls.__sqlmodel_relationships__.items():
@@ -498,12 +727,14 @@ class SQLModelMetaclass(ModelMetaclass, DeclarativeMeta):
                     setattr(cls, rel_name, rel_info.sa_relationship)  # Fix #315
                     continue
                 ann = cls.__annotations__[rel_name]
-                relationship_to = get_relationship_to(rel_name, rel_info, ann, cls)
+                with profile_phase(module, qualname, "relationships"):
+                    relationship_to = get_relationship_to(rel_name, rel_info, ann, cls)
                 rel_kwargs: Dict[str, Any] = {}
                 if rel_info.back_populates:
                     rel_kwargs["back_populates"] = rel_info.back_populates
                 if rel_info.link_model:
-                    ins = inspect(rel_info.link_model)
+                    with profile_phase(module, qualname, "link_models"):
+                        ins = inspect(rel_info.link_model)
                     local_table = getattr(ins, "local_table")  # noqa: B009
                     if local_table is None:
                         raise RuntimeError(
@@ -511,6 +742,8 @@ class SQLModelMetaclass(ModelMetaclass, DeclarativeMeta):
                             f"model {rel_info.link_model}"
                         )
                     rel_kwargs["secondary"] = local_table
+                if rel_info.load:
+                    rel_kwargs["lazy"] = rel_info.load
                 rel_args: List[Any] = []
                 if rel_info.sa_relationship_args:
                     rel_args.extend(rel_info.sa_relationship_args)
@@ -521,9 +754,13 @@ class SQLModelMetaclass(ModelMetaclass, DeclarativeMeta):
             # SQLAlchemy no longer uses dict_
             # Ref: https://github.com/sqlalchemy/sqlalchemy/commit/428ea01f00a9cc7f85e435018565eb6da7af1b77
             # Tag: 1.4.36
-            DeclarativeMeta.__init__(cls, classname, bases, dict_, **kw)
+            with profile_phase(module, qualname, "declarative"):
+                DeclarativeMeta.__init__(cls, classname, bases, dict_, **kw)
+            event.listen(cls, "mapper_configured", _on_mapper_configured)
+            _table_models_created[0] += 1
         else:
             ModelMetaclass.__init__(cls, classname, bases, dict_, **kw)
+        cls.__sqlmodel_setattr_dispatch__ = _build_setattr_dispatch(cls)
 
 
 class_registry = weakref.WeakValueDictionary()  # type: ignore
@@ -545,6 +782,9 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
     __slots__ = ("__weakref__",)
     __tablename__: ClassVar[Union[str, Callable[..., str]]]
     __sqlmodel_relationships__: ClassVar[Dict[str, RelationshipProperty]]
+    __sqlmodel_setattr_dispatch__: ClassVar[Mapping[str, int]]
+    __sqlmodel_read_columns__: ClassVar[Tuple[int, Tuple[Any, ...]]]
+    __sqlmodel_list_adapter__: ClassVar[Any]
     __name__: ClassVar[str]
     metadata: ClassVar[MetaData]
     __allow_unmapped__ = True  # https://docs.sqlalchemy.org/en/20/changelog/migration_20.html#migration-20-step-six
@@ -563,7 +803,8 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
         # Set __fields_set__ here, that would have been set when calling __init__
         # in the Pydantic model so that when SQLAlchemy sets attributes that are
         # added (e.g. when querying from DB) to the __fields_set__, this already exists
-        set_fields_set(new_object, set())
+        # It's a shared empty set, replaced by a new one when a field is set
+        set_fields_set(new_object, EMPTY_FIELDS_SET)
         return new_object
 
     def __init__(__pydantic_self__, **data: Any) -> None:
@@ -597,17 +838,25 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
                 setattr(__pydantic_self__, key, data[key])
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if name in {"_sa_instance_state"}:
-            self.__dict__[name] = value
-            return
-        else:
+        strategy = self.__sqlmodel_setattr_dispatch__.get(name)
+        if strategy is None:
+            strategy = _get_setattr_strategy(self.__class__, name)
+        if strategy == _SETATTR_SA_AND_FIELDS_SET:
+            _set_sa_attribute(self, name, value)
+            get_mutable_fields_set(self).add(name)
+        elif strategy == _SETATTR_SA_AND_PYDANTIC:
             # Set in SQLAlchemy, before Pydantic to trigger events and updates
-            if get_config_value(self, "table", False) and is_instrumented(self, name):
-                set_attribute(self, name, value)
-            # Set in Pydantic model to trigger possible validation changes, only for
-            # non relationship values
-            if name not in self.__sqlmodel_relationships__:
-                super().__setattr__(name, value)
+            _set_sa_attribute(self, name, value)
+            # Set in Pydantic model to trigger possible validation changes
+            get_mutable_fields_set(self)
+            super().__setattr__(name, value)
+        elif strategy == _SETATTR_PYDANTIC:
+            get_mutable_fields_set(self)
+            super().__setattr__(name, value)
+        elif strategy == _SETATTR_SA:
+            _set_sa_attribute(self, name, value)
+        elif strategy == _SETATTR_DICT:
+            self.__dict__[name] = value
 
     def __repr_args__(self) -> Sequence[Tuple[Optional[str], Any]]:
         # Don't show SQLAlchemy private attributes
@@ -621,6 +870,214 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
     def __tablename__(cls) -> str:
         return cls.__name__.lower()
 
+    @classmethod
+    def _sqlmodel_new_instance(cls: Type[_TSQLModel]) -> _TSQLModel:
+        # For table models, let SQLAlchemy create the instance, the same way it does
+        # when loading from the database, so that it has a _sa_instance_state
+        if get_config_value(cls, "table", False):
+            # The same SQLAlchemy does in __init__, before creating the first instance
+            cls.__mapper__._check_configure()  # type: ignore
+            return cls._sa_class_manager.new_instance()  # type: ignore
+        new_object: _TSQLModel = cls.__new__(cls)
+        return new_object
+
+    @classmethod
+    def _sqlmodel_construct(
+        cls: Type[_TSQLModel],
+        values: Mapping[str, Any],
+        fields_set: Optional[Set[str]] = None,
+    ) -> _TSQLModel:
+        new_object = cls._sqlmodel_new_instance()
+        fields = get_model_fields(cls)
+        fields_values: Dict[str, Any] = {}
+        relationship_values: Dict[str, Any] = {}
+        for key, value in values.items():
+            if key in fields:
+                fields_values[key] = value
+            elif key in cls.__sqlmodel_relationships__:
+                relationship_values[key] = value
+        if fields_set is None:
+            fields_set = set(fields_values)
+        if len(fields_values) < len(fields):
+            for name, field in fields.items():
+                if name not in fields_values and not is_field_required(field):
+                    fields_values[name] = get_field_default(field)
+        # Update instead of replacing the __dict__ to keep the _sa_instance_state
+        new_object.__dict__.update(fields_values)
+        set_fields_set(new_object, fields_set)
+        init_pydantic_private_attrs(new_object)
+        for key, value in relationship_values.items():
+            setattr(new_object, key, value)
+        return new_object
+
+    @classmethod
+    def _sqlmodel_construct_rows(
+        cls: Type[_TSQLModel],
+        rows: Iterable[Sequence[Any]],
+        names: Sequence[str],
+        instrumented: bool = True,
+    ) -> Iterator[_TSQLModel]:
+        # The same as _sqlmodel_construct() for many rows with the values of the
+        # same fields, in the order of names, checking the fields only once
+        fields = get_model_fields(cls)
+        names = tuple(names)
+        missing = [
+            (name, field)
+            for name, field in fields.items()
+            if name not in names and not is_field_required(field)
+        ]
+        if instrumented and get_config_value(cls, "table", False):
+            cls.__mapper__._check_configure()  # type: ignore
+            new_instance = cls._sa_class_manager.new_instance  # type: ignore
+        else:
+            new_instance = partial(cls.__new__, cls)
+        for row in rows:
+            new_object = new_instance()
+            new_object.__dict__.update(zip(names, row))
+            for name, field in missing:
+                new_object.__dict__[name] = get_field_default(field)
+            set_fields_set(new_object, set(names))
+            init_pydantic_private_attrs(new_object)
+            yield new_object
+
+    @classmethod
+    def _sqlmodel_read_columns(cls) -> Optional[Tuple[Any, ...]]:
+        # The columns select(cls) selects for a non-table model, only the ones for
+        # its fields, from the table model it shares them with
+        if get_config_value(cls, "table", False):
+            return None
+        # Cached until a new table model is created, as it could share the fields
+        cached: Optional[Tuple[int, Tuple[Any, ...]]] = cls.__dict__.get(
+            "__sqlmodel_read_columns__"
+        )
+        if cached is not None and cached[0] == _table_models_created[0]:
+            return cached[1]
+        columns = _build_read_columns(cls)
+        cls.__sqlmodel_read_columns__ = (_table_models_created[0], columns)
+        return columns
+
+    @classmethod
+    def construct_many(
+        cls: Type[_TSQLModel],
+        rows: Iterable[Union[Mapping[str, Any], Sequence[Any]]],
+        *,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[_TSQLModel]:
+        """Create many instances from trusted data, without validation.
+
+        Each row can be a dict with field names as keys, or a tuple with the values
+        in the order of `fields` (by default, the order of the model fields).
+
+        As with `model_construct()`, only the fields passed are included in the
+        fields set, and missing fields take their default values. For table models
+        the instances are instrumented by SQLAlchemy, so they can be added to a
+        session directly.
+        """
+        names = tuple(fields) if fields is not None else tuple(get_model_fields(cls))
+        construct = cls._sqlmodel_construct
+        instances = []
+        for row in rows:
+            if not isinstance(row, Mapping):
+                row = dict(zip(names, row))
+            instances.append(construct(row))
+        return instances
+
+    @overload
+    @classmethod
+    def dump_many(
+        cls: Type[_TSQLModel],
+        instances: Iterable[_TSQLModel],
+        *,
+        mode: Literal["json"] = "json",
+        include: Optional[AbstractSet[str]] = None,
+        exclude: Optional[AbstractSet[str]] = None,
+        by_alias: bool = False,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+    ) -> bytes:
+        ...
+
+    @overload
+    @classmethod
+    def dump_many(
+        cls: Type[_TSQLModel],
+        instances: Iterable[_TSQLModel],
+        *,
+        mode: Literal["python"],
+        include: Optional[AbstractSet[str]] = None,
+        exclude: Optional[AbstractSet[str]] = None,
+        by_alias: bool = False,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+    ) -> List[Dict[str, Any]]:
+        ...
+
+    @classmethod
+    def dump_many(
+        cls: Type[_TSQLModel],
+        instances: Iterable[_TSQLModel],
+        *,
+        mode: Literal["json", "python"] = "json",
+        include: Optional[AbstractSet[str]] = None,
+        exclude: Optional[AbstractSet[str]] = None,
+        by_alias: bool = False,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+    ) -> Union[bytes, List[Dict[str, Any]]]:
+        """Dump many instances at once, e.g. for a list endpoint.
+
+        With `mode="json"` (the default) it returns a single JSON array as bytes,
+        with `mode="python"` a list of dicts. Only the model fields are included,
+        not relationships. `include` and `exclude` take field names and apply to
+        each instance.
+
+        For table models, instances expired by the session, e.g. after a commit,
+        are loaded from the database first, with one query for all of them.
+        """
+        instances = list(instances)
+        if get_config_value(cls, "table", False):
+            _load_expired(cls, instances)
+        return dump_models(
+            cls,
+            instances,
+            mode=mode,
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+        )
+
+    @classmethod
+    def rebuild_all(cls, *, raise_errors: bool = True) -> List[Type["SQLModel"]]:
+        """Complete the pending builds of this model and all its subclasses.
+
+        Models declared with `defer_build=True` (Pydantic v2), or with forward
+        references that couldn't be resolved when they were created, build their
+        validators and serializers on first use. Call this once all the models are
+        imported, e.g. while a worker warms up, to build them all in one go. It
+        also configures the SQLAlchemy mappers.
+
+        Returns the models that were built.
+        """
+        rebuilt: List[Type[SQLModel]] = []
+        pending: List[Type[SQLModel]] = [cls]
+        seen: Set[Type[SQLModel]] = set()
+        while pending:
+            model = pending.pop()
+            if model in seen:
+                continue
+            seen.add(model)
+            if rebuild_model(model, raise_errors=raise_errors):
+                rebuilt.append(model)
+            pending.extend(reversed(model.__subclasses__()))
+        configure_mappers()
+        return rebuilt
+
     if IS_PYDANTIC_V2:
 
         @classmethod
@@ -632,11 +1089,36 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
             from_attributes: bool | None = None,
             context: dict[str, Any] | None = None,
         ) -> _TSQLModel:
-            # Somehow model validate doesn't call __init__ so it would remove our init logic
-            validated = super().model_validate(
-                obj, strict=strict, from_attributes=from_attributes, context=context
+            if not get_config_value(cls, "table", False):
+                return super().model_validate(
+                    obj, strict=strict, from_attributes=from_attributes, context=context
+                )
+            # Pydantic's model_validate doesn't call __init__, and the instance it
+            # creates is not instrumented by SQLAlchemy, so validate directly into a
+            # new instance created by SQLAlchemy instead, the same as __init__ does
+            new_object = cls._sqlmodel_new_instance()
+            old_dict = new_object.__dict__.copy()
+            cls.__pydantic_validator__.validate_python(
+                obj,
+                strict=strict,
+                from_attributes=from_attributes,
+                context=context,
+                self_instance=new_object,
             )
-            return cls(**validated.model_dump(exclude_unset=True))
+            # Pydantic replaces the __dict__, keep the _sa_instance_state
+            new_object.__dict__.update(old_dict)
+            if isinstance(obj, cls):
+                # Keep the fields set of the original instance, not all its attributes
+                set_fields_set(new_object, set(get_fields_set(obj)))
+            return new_object
+
+        @classmethod
+        def model_construct(
+            cls: Type[_TSQLModel],
+            _fields_set: Optional[Set[str]] = None,
+            **values: Any,
+        ) -> _TSQLModel:
+            return cls._sqlmodel_construct(values, _fields_set)
 
     else:
 
@@ -658,26 +1140,21 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
             if update is not None:
                 obj = {**obj, **update}
             # End SQLModel support dict
-            if not getattr(cls.__config__, "table", False):  # noqa
-                # If not table, normal Pydantic code
-                m: _TSQLModel = cls.__new__(cls)
-            else:
-                # If table, create the new instance normally to make SQLAlchemy create
-                # the _sa_instance_state attribute
-                m = cls()
             values, fields_set, validation_error = validate_model(cls, obj)
             if validation_error:
                 raise validation_error
-            # Updated to trigger SQLAlchemy internal handling
-            if not getattr(cls.__config__, "table", False):  # noqa
-                object.__setattr__(m, "__dict__", values)
-            else:
-                for key, value in values.items():
-                    setattr(m, key, value)
-            # Continue with standard Pydantic logic
-            object.__setattr__(m, "__fields_set__", fields_set)
-            m._init_private_attributes()  # noqa
-            return m
+            # If table, the new instance is created by SQLAlchemy, with the
+            # _sa_instance_state attribute, and the validated values are stored
+            # directly, without validating them again
+            return cls._sqlmodel_construct(values, fields_set)
+
+        @classmethod
+        def construct(
+            cls: Type[_TSQLModel],
+            _fields_set: Optional[Set[str]] = None,
+            **values: Any,
+        ) -> _TSQLModel:
+            return cls._sqlmodel_construct(values, _fields_set)
 
         @classmethod
         def parse_obj(
@@ -705,10 +1182,9 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
                 values, fields_set, validation_error = validate_model(cls, value)
                 if validation_error:
                     raise validation_error
-                model = cls(**value)
-                # Reset fields set, this would have been done in Pydantic in __init__
-                object.__setattr__(model, "__fields_set__", fields_set)
-                return model
+                # Store the validated values directly instead of calling __init__,
+                # that would validate them again
+                return cls._sqlmodel_construct(values, fields_set)
             elif cls.__config__.orm_mode:  # noqa
                 return cls.from_orm(value)
             elif cls.__custom_root_type__:  # noqa
@@ -0,0 +1,222 @@
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from sqlalchemy import Column, Table, UniqueConstraint
+from sqlalchemy.orm import Mapper, class_mapper
+from sqlalchemy.orm.attributes import instance_state, set_committed_value
+from sqlalchemy.orm.session import make_transient_to_detached
+
+from ..compat import get_fields_set, validate_models
+from ..main import SQLModel
+
+_TSQLModel = TypeVar("_TSQLModel", bound=SQLModel)
+
+# The params for the primary key in bulk updates, not to clash with the columns set
+PK_PARAM_PREFIX = "_pk_"
+# The dialects with INSERT ... ON CONFLICT or ON DUPLICATE KEY UPDATE
+UPSERT_DIALECTS = ("postgresql", "sqlite", "mysql", "mariadb")
+# The columns of the table by attribute name, as (attribute name, column) pairs
+TableColumns = List[Tuple[str, "Column[Any]"]]
+# The instances with the same keys in their insert params, as (instance, params)
+RowGroups = Dict[Tuple[str, ...], List[Tuple[_TSQLModel, Dict[str, Any]]]]
+
+
+def get_table_columns(model: Type[SQLModel]) -> Tuple[Mapper[Any], Table, TableColumns]:
+    mapper = class_mapper(model)
+    table = cast(Table, mapper.local_table)
+    columns = [
+        (prop.key, cast("Column[Any]", prop.columns[0]))
+        for prop in mapper.column_attrs
+        if prop.columns[0].table is table
+    ]
+    return mapper, table, columns
+
+
+def validate_rows(
+    model: Type[_TSQLModel],
+    rows: Iterable[Union[_TSQLModel, Mapping[str, Any]]],
+    partial: bool = False,
+) -> List[_TSQLModel]:
+    # Keep the instances, and validate all the dicts at once
+    rows = list(rows)
+    for index, row in enumerate(rows):
+        if not isinstance(row, (Mapping, model)):
+            raise TypeError(
+                f"Row {index} should be a dict or a {model.__name__} instance, "
+                f"not {type(row).__name__}"
+            )
+    dicts = [row for row in rows if isinstance(row, Mapping)]
+    validated = iter(validate_models(model, dicts, partial=partial))
+    return [row if isinstance(row, model) else next(validated) for row in rows]
+
+
+def insert_params(instance: SQLModel, columns: TableColumns) -> Dict[str, Any]:
+    # The same values the unit of work inserts, None is left out for primary keys
+    # and columns with defaults, to let the database (or SQLAlchemy) generate them
+    params: Dict[str, Any] = {}
+    for key, column in columns:
+        value = instance.__dict__.get(key)
+        if value is None and (
+            column.primary_key
+            or column.default is not None
+            or column.server_default is not None
+        ):
+            continue
+        params[column.key] = value
+    return params
+
+
+def group_rows(
+    instances: Sequence[_TSQLModel], columns: TableColumns
+) -> "RowGroups[_TSQLModel]":
+    # Statements with executemany need the same keys in all the rows, so group
+    # them by the keys they have
+    groups: RowGroups[_TSQLModel] = {}
+    for instance in instances:
+        params = insert_params(instance, columns)
+        groups.setdefault(tuple(params), []).append((instance, params))
+    return groups
+
+
+def set_returned_values(
+    instance: SQLModel,
+    columns: TableColumns,
+    values: Mapping[Any, Any],
+    params: Mapping[str, Any],
+) -> None:
+    # Set the values from the database (by column) as loaded, and make the instance
+    # detached, so that it's persistent when added to the session, with no INSERT
+    for key, column in columns:
+        if column in values:
+            set_committed_value(instance, key, values[column])
+        elif column.key not in params:
+            # Generated by the database, not returned, load it on access
+            instance.__dict__.pop(key, None)
+    make_transient_to_detached(instance)
+
+
+def update_params(
+    instance: SQLModel, mapper: Mapper[Any], columns: TableColumns
+) -> Tuple[Tuple[Any, ...], List[Tuple[str, "Column[Any]"]], Dict[str, Any]]:
+    # The primary key, the changed columns, and the params to update them, with the
+    # primary key in PK_PARAM_PREFIX params. The changes come from the attribute
+    # history of loaded instances, or else from the fields set
+    state = instance_state(instance)
+    if state.key is not None:
+        identity = state.key[1]
+        changed = [
+            (key, column)
+            for key, column in columns
+            if not column.primary_key and state.attrs[key].history.added
+        ]
+    else:
+        identity = tuple(
+            instance.__dict__.get(mapper.get_property_by_column(column).key)
+            for column in mapper.primary_key
+        )
+        fields_set = get_fields_set(instance)
+        changed = [
+            (key, column)
+            for key, column in columns
+            if not column.primary_key and key in fields_set
+        ]
+    if any(value is None for value in identity):
+        raise ValueError(f"Missing the primary key to update {instance!r}")
+    params = {
+        f"{PK_PARAM_PREFIX}{column.key}": value
+        for column, value in zip(mapper.primary_key, identity)
+    }
+    for key, column in changed:
+        params[column.key] = instance.__dict__[key]
+    return identity, changed, params
+
+
+def get_column(mapper: Mapper[Any], column: Any) -> "Column[Any]":
+    # A column from its attribute name or the class attribute, as in Hero.name
+    if isinstance(column, str):
+        return mapper.columns[column]
+    return cast("Column[Any]", column.property.columns[0])
+
+
+def get_conflict_columns(
+    table: Table, key_sets: Iterable[Sequence[str]]
+) -> List["Column[Any]"]:
+    # The primary key, or else the first unique column, constraint or index, with
+    # values in all the rows
+    candidates: List[List[Column[Any]]] = [list(table.primary_key.columns)]
+    candidates.extend([column] for column in table.columns if column.unique)
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            candidates.append(list(constraint.columns))
+    for index in sorted(table.indexes, key=lambda index: str(index.name)):
+        if index.unique:
+            candidates.append(list(index.columns))
+    all_keys = [set(keys) for keys in key_sets]
+    for candidate in candidates:
+        if candidate and all(
+            column.key in keys for keys in all_keys for column in candidate
+        ):
+            return candidate
+    raise ValueError(
+        f"Couldn't find a primary key or unique constraint of {table.name} with "
+        "values in all the rows, pass conflict_on"
+    )
+
+
+def check_upsert_dialect(dialect_name: str) -> None:
+    if dialect_name not in UPSERT_DIALECTS:
+        raise ValueError(
+            f"Upsert is not supported for the {dialect_name} dialect, only for "
+            f"{', '.join(UPSERT_DIALECTS)}"
+        )
+
+
+def upsert_statement(
+    dialect_name: str,
+    table: Table,
+    conflict_columns: Sequence["Column[Any]"],
+    update_columns: Sequence["Column[Any]"],
+) -> Any:
+    # INSERT ... ON CONFLICT for each dialect, updating the columns with the values
+    # of the row that conflicted, or doing nothing without update columns
+    check_upsert_dialect(dialect_name)
+    if dialect_name in ("postgresql", "sqlite"):
+        statement: Any
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+
+            statement = postgresql_insert(table)
+        else:
+            from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+            statement = sqlite_insert(table)
+        if not update_columns:
+            return statement.on_conflict_do_nothing(index_elements=conflict_columns)
+        return statement.on_conflict_do_update(
+            index_elements=conflict_columns,
+            set_={
+                column.key: statement.excluded[column.key] for column in update_columns
+            },
+        )
+    from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+    # MySQL uses any unique key for the conflict, ignoring conflict_on
+    mysql_statement = mysql_insert(table)
+    if not update_columns:
+        # Set a column to itself to leave the row unchanged
+        column = conflict_columns[0]
+        return mysql_statement.on_duplicate_key_update({column.key: column})
+    return mysql_statement.on_duplicate_key_update(
+        {column.key: mysql_statement.inserted[column.key] for column in update_columns}
+    )
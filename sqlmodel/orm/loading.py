@@ -0,0 +1,121 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.engine.result import IteratorResult, Result, SimpleResultMetaData
+from sqlalchemy.orm import (
+    ORMExecuteState,
+    immediateload,
+    joinedload,
+    lazyload,
+    noload,
+    raiseload,
+    selectinload,
+    subqueryload,
+)
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.state import InstanceState
+from typing_extensions import Literal
+
+# How to load a relationship, the same values as the lazy parameter of SQLAlchemy's
+# relationship() that have an equivalent loader option for a single query
+RelationshipLoad = Literal[
+    "select",
+    "selectin",
+    "joined",
+    "subquery",
+    "immediate",
+    "raise",
+    "raise_on_sql",
+    "noload",
+]
+
+_loader_options: Dict[str, Callable[[Any], Any]] = {
+    "select": lazyload,
+    "selectin": selectinload,
+    "joined": joinedload,
+    "subquery": subqueryload,
+    "immediate": immediateload,
+    "raise": raiseload,
+    "raise_on_sql": lambda attribute: raiseload(attribute, sql_only=True),
+    "noload": noload,
+}
+
+
+def is_relationship_load(value: Any) -> bool:
+    return value in _loader_options
+
+
+def get_loader_option(attribute: Any, load: RelationshipLoad) -> Any:
+    # The loader option (e.g. selectinload(Hero.team)) to load the attribute, or
+    # all the relationships not set by other options with "*"
+    if load not in _loader_options:
+        raise ValueError(
+            f"Invalid relationship load {load!r}, it should be one of: "
+            + ", ".join(repr(name) for name in _loader_options)
+        )
+    return _loader_options[load](attribute)
+
+
+# The most objects loaded with a single IN query, the rest are loaded by the next
+# batch, when one of them is accessed
+BATCH_LAZY_LOAD_SIZE = 500
+
+
+def batch_lazy_load(orm_execute_state: ORMExecuteState) -> Optional[Result[Any]]:
+    # A do_orm_execute listener added by session.enable_batch_lazy_loads(). On a
+    # lazy load of a relationship, load it with one IN query for all the objects of
+    # the same class in the identity map that didn't load it yet, and return the
+    # value for the object that triggered it, so that N+1 queries become 2
+    state = orm_execute_state.lazy_loaded_from
+    path = orm_execute_state.loader_strategy_path
+    if state is None or path is None or state.key is None:
+        return None
+    prop = path.prop  # type: ignore[attr-defined]
+    parent, key = prop.parent, prop.key
+    if prop.mapper.common_parent(parent):
+        # Self-referential, the join would need an alias, use the default lazy load
+        return None
+    session = orm_execute_state.session
+    states: List[InstanceState[Any]] = [state]
+    for other in session.identity_map.all_states():
+        if len(states) == BATCH_LAZY_LOAD_SIZE:
+            break
+        if (
+            other is not state
+            and other.key is not None
+            and key not in other.dict
+            and other.mapper.isa(parent)
+        ):
+            states.append(other)
+    if len(states) == 1:
+        return None
+    pk_columns = parent.primary_key
+    identities = [other.key[1] for other in states]  # type: ignore[index]
+    if len(pk_columns) == 1:
+        criteria = pk_columns[0].in_([identity[0] for identity in identities])
+    else:
+        criteria = tuple_(*pk_columns).in_(identities)
+    statement = (
+        select(*pk_columns, prop.mapper)
+        .select_from(parent)
+        .join(getattr(parent.class_, key))
+        .where(criteria)
+    )
+    if prop.order_by:
+        statement = statement.order_by(*prop.order_by)
+    values: Dict[Tuple[Any, ...], List[Any]] = {identity: [] for identity in identities}
+    size = len(pk_columns)
+    for row in session.execute(statement):
+        values[tuple(row[:size])].append(row[size])
+    for other in states[1:]:
+        instance = other.obj()
+        if instance is not None:
+            value = values[other.key[1]]  # type: ignore[index]
+            set_committed_value(
+                instance, key, value if prop.uselist else (value or [None])[0]
+            )
+    # The lazy loader sets the value for the object that triggered it
+    return IteratorResult(
+        SimpleResultMetaData([key], _unique_filters=[id]),
+        iter([(value,) for value in values[identities[0]]]),
+    )
@@ -1,30 +1,127 @@
 from typing import (
     Any,
     Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
     Mapping,
     Optional,
     Sequence,
+    Tuple,
+    Type,
     TypeVar,
     Union,
     overload,
 )
 
-from sqlalchemy import util
+from sqlalchemy import (
+    bindparam,
+    event,
+    insert,
+    inspect,
+    select,
+    tuple_,
+    update,
+    util,
+)
 from sqlalchemy.engine.interfaces import _CoreAnyExecuteParams
-from sqlalchemy.engine.result import Result, ScalarResult, TupleResult
+from sqlalchemy.engine.result import (
+    IteratorResult,
+    Result,
+    ScalarResult,
+    SimpleResultMetaData,
+    TupleResult,
+)
 from sqlalchemy.orm import Query as _Query
 from sqlalchemy.orm import Session as _Session
 from sqlalchemy.orm._typing import OrmExecuteOptionsParameter
+from sqlalchemy.orm.attributes import instance_state, set_committed_value
 from sqlalchemy.sql._typing import _ColumnsClauseArgument
 from sqlalchemy.sql.base import Executable as _Executable
+from sqlmodel.compat import get_model_fields
+from sqlmodel.main import SQLModel
+from sqlmodel.orm.bulk import (
+    PK_PARAM_PREFIX,
+    check_upsert_dialect,
+    get_column,
+    get_conflict_columns,
+    get_table_columns,
+    group_rows,
+    set_returned_values,
+    update_params,
+    upsert_statement,
+    validate_rows,
+)
+from sqlmodel.orm.loading import batch_lazy_load
+from sqlmodel.profiling import ExecTimings
 from sqlmodel.sql.base import Executable
 from sqlmodel.sql.expression import Select, SelectOfScalar
+from sqlmodel.sql.pagination import Page, Paginated
 from typing_extensions import deprecated
 
 _TSelectParam = TypeVar("_TSelectParam", bound=Any)
+_TSQLModel = TypeVar("_TSQLModel", bound=SQLModel)
+
+
+def _get_selected_entity(
+    statement: Union[Select[Any], SelectOfScalar[Any]],
+) -> Optional[Any]:
+    # The mapped class (or alias) when the statement selects a single model,
+    # as in select(Hero)
+    descriptions = statement.column_descriptions
+    if len(descriptions) == 1:
+        entity = descriptions[0].get("entity")
+        if entity is not None and descriptions[0]["expr"] is entity:
+            return entity
+    return None
+
+
+def _readonly_rows(
+    result: Result[Any], model: Type[_TSQLModel], entity: Optional[Any]
+) -> Iterator[Tuple[_TSQLModel]]:
+    # Map the result columns to the model fields once, going through the mapper
+    # when a table model was selected, as its attribute names can differ from the
+    # column names
+    attribute_names: Dict[str, str] = {}
+    if entity is not None:
+        for prop in inspect(entity).mapper.column_attrs:
+            attribute_names[prop.columns[0].key] = prop.key
+    fields = get_model_fields(model)
+    columns: Dict[str, int] = {}
+    keys = result.keys()
+    for index, key in enumerate(keys):
+        name = attribute_names.get(key, key)
+        if name in fields and name not in columns:
+            columns[name] = index
+    rows: Iterable[Sequence[Any]]
+    if len(columns) == len(keys):
+        # All the columns, in order
+        rows = result
+    elif columns:
+        rows = result.columns(*columns.values())
+    else:
+        rows = (() for _ in result)
+    for new_object in model._sqlmodel_construct_rows(rows, tuple(columns), False):
+        yield (new_object,)
 
 
 class Session(_Session):
+    # Set by sqlmodel.profiling.track_exec_timings()
+    _sqlmodel_exec_timings: Optional[ExecTimings] = None
+
+    def enable_batch_lazy_loads(self) -> None:
+        """
+        Make the first lazy load of a relationship load it for all the objects of
+        the same class in the session that didn't load it yet, with one `IN`
+        query, so that reading `hero.team` in a loop runs 2 queries instead of N+1.
+
+        To enable it for all the sessions of a `sessionmaker`, listen to its
+        `do_orm_execute` event with `sqlmodel.orm.loading.batch_lazy_load`.
+        """
+        if not event.contains(self, "do_orm_execute", batch_lazy_load):
+            event.listen(self, "do_orm_execute", batch_lazy_load)
+
     @overload
     def exec(
         self,
@@ -51,12 +148,26 @@ class Session(_Session):
     ) -> ScalarResult[_TSelectParam]:
         ...
 
+    @overload
+    def exec(
+        self,
+        statement: Paginated[_TSelectParam],
+        *,
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+        _parent_execute_state: Optional[Any] = None,
+        _add_event: Optional[Any] = None,
+    ) -> Page[_TSelectParam]:
+        ...
+
     def exec(
         self,
         statement: Union[
             Select[_TSelectParam],
             SelectOfScalar[_TSelectParam],
             Executable[_TSelectParam],
+            Paginated[_TSelectParam],
         ],
         *,
         params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
@@ -64,19 +175,523 @@ class Session(_Session):
         bind_arguments: Optional[Dict[str, Any]] = None,
         _parent_execute_state: Optional[Any] = None,
         _add_event: Optional[Any] = None,
-    ) -> Union[TupleResult[_TSelectParam], ScalarResult[_TSelectParam]]:
+    ) -> Union[
+        TupleResult[_TSelectParam], ScalarResult[_TSelectParam], Page[_TSelectParam]
+    ]:
+        # A paginated statement runs with the cursor columns, and returns a Page
+        paginated = None
+        executable: Union[
+            Select[_TSelectParam],
+            SelectOfScalar[_TSelectParam],
+            Executable[_TSelectParam],
+        ]
+        if isinstance(statement, Paginated):
+            paginated = statement
+            executable = statement.statement
+        else:
+            executable = statement
+        readonly = execution_options.get(
+            "sqlmodel_readonly"
+        ) or executable.get_execution_options().get("sqlmodel_readonly")
+        if readonly and paginated is not None and paginated.read_model is None:
+            raise ValueError(
+                "Can't paginate a read-only statement, only the columns of a "
+                "non-table model, e.g. select(HeroRead)"
+            )
+        if (
+            readonly
+            and paginated is None
+            and isinstance(executable, (Select, SelectOfScalar))
+        ):
+            model: Any = None if readonly is True else readonly
+            return self.exec_readonly(
+                executable,
+                model=model,
+                params=params,
+                execution_options=execution_options,
+                bind_arguments=bind_arguments,
+            )
+        timing = None
+        if self._sqlmodel_exec_timings is not None:
+            timing, execution_options = self._sqlmodel_exec_timings.start(
+                executable, execution_options
+            )
         results = super().execute(
-            statement,
+            executable,
             params=params,
             execution_options=execution_options,
             bind_arguments=bind_arguments,
             _parent_execute_state=_parent_execute_state,
             _add_event=_add_event,
         )
-        if isinstance(statement, SelectOfScalar):
+        if timing is not None and self._sqlmodel_exec_timings is not None:
+            results = self._sqlmodel_exec_timings.finish(timing, results)
+        if paginated is not None:
+            return paginated.get_page(results)
+        if isinstance(executable, SelectOfScalar):
             return results.scalars()
         return results  # type: ignore
 
+    @overload
+    def exec_stream(
+        self,
+        statement: Select[_TSelectParam],
+        *,
+        batch_size: int = 1000,
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+    ) -> Generator[Sequence[_TSelectParam], None, None]:
+        ...
+
+    @overload
+    def exec_stream(
+        self,
+        statement: SelectOfScalar[_TSelectParam],
+        *,
+        batch_size: int = 1000,
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+    ) -> Generator[Sequence[_TSelectParam], None, None]:
+        ...
+
+    def exec_stream(
+        self,
+        statement: Union[Select[_TSelectParam], SelectOfScalar[_TSelectParam]],
+        *,
+        batch_size: int = 1000,
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+    ) -> Generator[Sequence[_TSelectParam], None, None]:
+        """
+        Execute a select and iterate over the results in batches of `batch_size`,
+        the same objects `session.exec()` would return: model objects for
+        `select(Hero)` and tuples for `select(Hero, Team)`.
+
+        The rows are fetched from the database as they are needed, and the objects
+        of each batch are removed from the session after the next one is requested,
+        so that the memory used doesn't grow with the size of the result. Objects
+        that were already in the session, or that were modified, are kept.
+
+        ```Python
+        for heroes in session.exec_stream(select(Hero), batch_size=500):
+            for hero in heroes:
+                print(hero)
+        ```
+        """
+        existing = set(self.identity_map.keys())
+        result = self.exec(
+            statement,
+            params=params,
+            execution_options=util.immutabledict(execution_options).union(
+                {"yield_per": batch_size}
+            ),
+            bind_arguments=bind_arguments,
+        )
+        scalars = isinstance(statement, SelectOfScalar)
+        try:
+            for partition in result.partitions(batch_size):
+                yield partition
+                for item in partition:
+                    values: Sequence[Any] = (item,) if scalars else item  # type: ignore
+                    for value in values:
+                        state = getattr(value, "_sa_instance_state", None)
+                        if (
+                            state is not None
+                            and state.session_id == self.hash_key
+                            and state.key not in existing
+                            and not state.modified
+                        ):
+                            self.expunge(value)
+        finally:
+            result.close()
+
+    @overload
+    def exec_readonly(
+        self,
+        statement: SelectOfScalar[_TSelectParam],
+        *,
+        model: None = None,
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+    ) -> ScalarResult[_TSelectParam]:
+        ...
+
+    @overload
+    def exec_readonly(
+        self,
+        statement: Union[Select[Any], SelectOfScalar[Any]],
+        *,
+        model: Type[_TSQLModel],
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+    ) -> ScalarResult[_TSQLModel]:
+        ...
+
+    def exec_readonly(
+        self,
+        statement: Union[Select[Any], SelectOfScalar[Any]],
+        *,
+        model: Optional[Type[SQLModel]] = None,
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+    ) -> ScalarResult[Any]:
+        """
+        Execute a select and return plain model instances built directly from the
+        rows, without validation.
+
+        The instances are not tracked by the session: they skip the identity map and
+        the unit of work, and table models are not instrumented by SQLAlchemy, so
+        they can't be modified and flushed, and relationships can't be loaded.
+
+        By default, the instances are of the model selected, as in `select(Hero)`.
+        Pass `model` to build instances of another model instead, for example a
+        non-table read model, from the result columns with the same names as its
+        fields:
+
+        ```Python
+        heroes = session.exec_readonly(select(Hero), model=HeroRead).all()
+        ```
+
+        The same is available with `session.exec()` with the `sqlmodel_readonly`
+        execution option, set to `True` or to a model.
+        """
+        timing = None
+        if self._sqlmodel_exec_timings is not None:
+            timing, execution_options = self._sqlmodel_exec_timings.start(
+                statement, execution_options
+            )
+        entity = _get_selected_entity(statement)
+        if model is None:
+            if entity is None:
+                raise ValueError(
+                    "exec_readonly() needs a model to build the instances when the "
+                    "statement doesn't select a single table model"
+                )
+            model = inspect(entity).mapper.class_
+        if self.autoflush:
+            self.flush()
+        bind_arguments = {"clause": statement, **(bind_arguments or {})}
+        if entity is not None and "mapper" not in bind_arguments:
+            bind_arguments["mapper"] = inspect(entity).mapper
+        connection = self.connection(bind_arguments=bind_arguments)
+        result = connection.execute(
+            statement, params, execution_options=execution_options
+        )
+        rows = _readonly_rows(result, model, entity)
+        readonly_result: Result[Any] = IteratorResult(
+            SimpleResultMetaData([model.__name__]), rows
+        )
+        if timing is not None and self._sqlmodel_exec_timings is not None:
+            readonly_result = self._sqlmodel_exec_timings.finish(
+                timing, readonly_result
+            )
+        return readonly_result.scalars()
+
+    def bulk_insert(
+        self,
+        model: Type[_TSQLModel],
+        rows: Iterable[Union[_TSQLModel, Mapping[str, Any]]],
+        *,
+        returning: bool = True,
+        chunk_size: int = 1000,
+    ) -> List[_TSQLModel]:
+        """
+        Insert many rows of a table model with a few statements, skipping the unit
+        of work.
+
+        `rows` can be instances of the model or dicts, the dicts are validated all
+        at once, and the errors include the index of each invalid row.
+
+        The rows are sent in chunks of `chunk_size`, as a single `INSERT` with
+        multiple `VALUES` per chunk (SQLAlchemy's "insertmanyvalues"). With
+        `RETURNING`, databases that can't return the rows in the same order, as
+        SQLite, get them one at a time instead.
+
+        With `returning=True`, each statement uses `RETURNING` to get the generated
+        primary keys and server defaults, and the instances returned have them set
+        and are added to the session, as if they were loaded, with no need to
+        `session.refresh()` them:
+
+        ```Python
+        heroes = session.bulk_insert(Hero, [{"name": "Deadpond"}, {"name": "Rusty"}])
+        print(heroes[0].id)
+        ```
+
+        With `returning=False`, the instances returned are not updated nor added
+        to the session.
+
+        Only the columns of the table are inserted, relationships and ORM events
+        (e.g. `before_insert`) are not processed. The pending changes in the
+        session are flushed first, as with `session.exec()`.
+        """
+        mapper, table, columns = get_table_columns(model)
+        instances = validate_rows(model, rows)
+        groups = group_rows(instances, columns)
+        self._autoflush()
+        connection = self.connection(bind_arguments={"mapper": mapper})
+        dialect = connection.dialect
+        statement = insert(table)
+        one_by_one = False
+        if returning:
+            if dialect.insert_executemany_returning_sort_by_parameter_order:
+                statement = statement.returning(
+                    *table.columns, sort_by_parameter_order=True
+                )
+            else:
+                # Without support for RETURNING with many rows in order, insert them
+                # one by one, and get the primary key or the defaults available
+                one_by_one = True
+                chunk_size = 1
+                statement = statement.return_defaults()
+        for group in groups.values():
+            for start in range(0, len(group), chunk_size):
+                chunk = group[start : start + chunk_size]
+                if not returning:
+                    connection.execute(statement, [params for _, params in chunk])
+                    continue
+                returned: List[Mapping[Any, Any]]
+                if one_by_one:
+                    result = connection.execute(statement, chunk[0][1])
+                    defaults: Dict[Any, Any] = dict(
+                        zip(table.primary_key, result.inserted_primary_key or ())
+                    )
+                    if result.returned_defaults is not None:
+                        defaults.update(result.returned_defaults._mapping)
+                    returned = [defaults]
+                else:
+                    result = connection.execute(
+                        statement, [params for _, params in chunk]
+                    )
+                    returned = [row._mapping for row in result]
+                for (instance, params), values in zip(chunk, returned):
+                    set_returned_values(instance, columns, values, params)
+        if returning:
+            self.add_all(instances)
+        return instances
+
+    def upsert(
+        self,
+        model: Type[_TSQLModel],
+        rows: Iterable[Union[_TSQLModel, Mapping[str, Any]]],
+        *,
+        conflict_on: Optional[Sequence[Any]] = None,
+        update: Optional[Sequence[Any]] = None,
+        returning: bool = True,
+        chunk_size: int = 1000,
+    ) -> List[_TSQLModel]:
+        """
+        Insert many rows of a table model, or update the existing ones, with
+        `INSERT ... ON CONFLICT` (or `ON DUPLICATE KEY UPDATE` in MySQL), in
+        chunks of `chunk_size` rows per statement.
+
+        `rows` can be instances of the model or dicts, validated as in
+        `session.bulk_insert()`.
+
+        `conflict_on` is the list of columns (as names or class attributes, e.g.
+        `Hero.name`) of the primary key or unique constraint that identifies the
+        existing rows. By default it's the primary key, if all the rows have it,
+        or else the first unique column (`Field(unique=True)`), constraint or
+        index that all the rows have.
+
+        `update` is the list of columns to update in the existing rows, by default
+        all the ones in the rows except the `conflict_on` ones. With an empty list
+        the existing rows are not modified, for a "get or create":
+
+        ```Python
+        teams = session.upsert(Team, [{"name": "Preventers"}], update=[])
+        ```
+
+        With `returning=True`, it returns the instance for each row, in the same
+        order, with the values in the database, and added to the session. Objects
+        already in the session are reused, and updated unless `update=[]`. It uses
+        `RETURNING` when available, rows not returned are read with one `SELECT`
+        per chunk.
+
+        The pending changes in the session are flushed first, as with
+        `session.exec()`. With autoflush disabled, the attributes of the objects in
+        the session with changes not flushed yet keep those changes.
+
+        With `returning=False`, the instances returned are not updated nor added
+        to the session.
+        """
+        mapper, table, columns = get_table_columns(model)
+        connection = self.connection(bind_arguments={"mapper": mapper})
+        dialect = connection.dialect
+        check_upsert_dialect(dialect.name)
+        instances = validate_rows(model, rows)
+        self._autoflush()
+        groups = group_rows(instances, columns)
+        if conflict_on is None:
+            conflict_columns = get_conflict_columns(table, groups)
+        else:
+            conflict_columns = [get_column(mapper, column) for column in conflict_on]
+        conflict_keys = [column.key for column in conflict_columns]
+        use_returning = returning and dialect.insert_returning
+        found: Dict[Tuple[Any, ...], Mapping[Any, Any]] = {}
+
+        def get_identity(values: Mapping[Any, Any]) -> Tuple[Any, ...]:
+            return tuple(values[column] for column in conflict_columns)
+
+        for keys, group in groups.items():
+            missing_keys = [key for key in conflict_keys if key not in keys]
+            if missing_keys:
+                raise ValueError(
+                    f"Missing values for {', '.join(missing_keys)}, in conflict_on"
+                )
+            if update is None:
+                update_columns = [
+                    table.c[key] for key in keys if key not in conflict_keys
+                ]
+            else:
+                update_columns = [get_column(mapper, column) for column in update]
+            statement = upsert_statement(
+                dialect.name, table, conflict_columns, update_columns
+            )
+            if use_returning:
+                statement = statement.returning(*table.columns)
+            for start in range(0, len(group), chunk_size):
+                chunk = group[start : start + chunk_size]
+                result = connection.execute(statement, [params for _, params in chunk])
+                if use_returning:
+                    for row in result:
+                        found[get_identity(row._mapping)] = row._mapping
+        if not returning:
+            return instances
+        row_params = {
+            id(instance): params
+            for group in groups.values()
+            for instance, params in group
+        }
+        identities = [
+            tuple(row_params[id(instance)][key] for key in conflict_keys)
+            for instance in instances
+        ]
+        # The rows not returned, with no update or without RETURNING
+        pending = list(
+            dict.fromkeys(identity for identity in identities if identity not in found)
+        )
+        for start in range(0, len(pending), chunk_size):
+            chunk_identities = pending[start : start + chunk_size]
+            if len(conflict_columns) == 1:
+                criteria = conflict_columns[0].in_(
+                    [identity[0] for identity in chunk_identities]
+                )
+            else:
+                criteria = tuple_(*conflict_columns).in_(chunk_identities)
+            for row in connection.execute(select(*table.columns).where(criteria)):
+                found[get_identity(row._mapping)] = row._mapping
+        results: List[_TSQLModel] = []
+        populate_existing = update is None or len(update) > 0
+        for instance, identity in zip(instances, identities):
+            loaded = found.get(identity)
+            if loaded is None:
+                # The database has different values than the params, e.g. with a
+                # case insensitive collation or converting types, let it compare
+                conditions = [
+                    column == value for column, value in zip(conflict_columns, identity)
+                ]
+                loaded = (
+                    connection.execute(select(*table.columns).where(*conditions))
+                    .one()
+                    ._mapping
+                )
+                found[identity] = loaded
+            identity_key = mapper.identity_key_from_primary_key(
+                tuple(loaded[column] for column in mapper.primary_key)
+            )
+            existing = self.identity_map.get(identity_key)
+            if existing is not None:
+                if populate_existing:
+                    modified = instance_state(existing).committed_state
+                    for key, column in columns:
+                        if key not in modified:
+                            set_committed_value(existing, key, loaded[column])
+                results.append(existing)
+                continue
+            set_returned_values(instance, columns, loaded, row_params[id(instance)])
+            self.add(instance)
+            results.append(instance)
+        return results
+
+    def bulk_update(
+        self,
+        model: Type[_TSQLModel],
+        rows: Iterable[Union[_TSQLModel, Mapping[str, Any]]],
+        *,
+        chunk_size: int = 1000,
+    ) -> int:
+        """
+        Update many rows of a table model by primary key, with only the columns
+        that changed, without loading them first.
+
+        `rows` can be dicts or instances of the model, with the primary key:
+
+        * Dicts are validated as in `session.bulk_insert()`, and only the keys in
+          each dict are updated.
+        * Instances loaded from the database (even if they are not in the session
+          anymore) update only the attributes modified since they were loaded.
+        * Other instances, e.g. `Hero(id=1, age=32)`, update only the fields set
+          when creating them.
+
+        The rows are grouped by the columns they change, and each group is sent
+        as an `UPDATE ... WHERE` the primary key, with many parameters, in chunks
+        of `chunk_size` rows.
+
+        Objects in the session for the same rows are updated to the new values,
+        as if they were loaded, and so are the loaded instances passed, so they
+        are not updated again by the next flush. Then the other pending changes in
+        the session are flushed, as with `session.exec()`.
+
+        Returns the number of rows matched, when the database driver reports it.
+        """
+        mapper, table, columns = get_table_columns(model)
+        instances = validate_rows(model, rows, partial=True)
+        statement = update(table).where(
+            *(
+                column == bindparam(f"{PK_PARAM_PREFIX}{column.key}")
+                for column in mapper.primary_key
+            )
+        )
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        updated = []
+        for instance in instances:
+            identity, changed, params = update_params(instance, mapper, columns)
+            if changed:
+                groups.setdefault(tuple(params), []).append(params)
+                updated.append((instance, identity, changed))
+        # Before the autoflush, so that it doesn't send the same changes
+        for instance, identity, changed in updated:
+            targets = [
+                self.identity_map.get(mapper.identity_key_from_primary_key(identity))
+            ]
+            if instance_state(instance).key is not None:
+                targets.append(instance)
+            for target in targets:
+                if target is None:
+                    continue
+                for key, _ in changed:
+                    set_committed_value(target, key, instance.__dict__[key])
+                state = instance_state(target)
+                if not state.committed_state:
+                    # No other changes, it's not dirty anymore
+                    state._commit_all(state.dict, self.identity_map)
+        self._autoflush()
+        connection = self.connection(bind_arguments={"mapper": mapper})
+        matched = 0
+        for group in groups.values():
+            for start in range(0, len(group), chunk_size):
+                result = connection.execute(
+                    statement, group[start : start + chunk_size]
+                )
+                matched += max(result.rowcount, 0)
+        return matched
+
     @deprecated(
         """
         🚨 You probably want to use `session.exec()` instead of `session.execute()`.
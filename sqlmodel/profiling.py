@@ -0,0 +1,617 @@
+import hashlib
+import os
+import sys
+import time
+import warnings
+import weakref
+from contextlib import contextmanager, nullcontext
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+import sqlalchemy
+from sqlalchemy import event, util
+from sqlalchemy.engine import CursorResult, Engine, Result
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS, DefaultExecutionContext
+from sqlalchemy.exc import UnboundExecutionError
+from sqlalchemy.orm import Mapper, ORMExecuteState
+from sqlalchemy.orm import Session as SASession
+
+from .compat import get_compiled_time, prefetch_cursor_rows
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from .ext.asyncio.session import AsyncSession
+    from .orm.session import Session
+
+# The phases of the creation of a model class, in order, "configure" happens later,
+# when the mappers are configured, e.g. on the first query
+CLASS_CREATION_PHASES = (
+    "config",
+    "pydantic",
+    "columns",
+    "relationships",
+    "link_models",
+    "declarative",
+    "configure",
+)
+
+
+class ClassCreationProfile:
+    """The time spent creating each model class, by phase.
+
+    Phases: `config` (filtering the class keyword arguments), `pydantic` (the
+    Pydantic model class, fields and schema), `columns` (the SQLAlchemy columns from
+    the fields), `relationships` (resolving the `Relationship()` targets),
+    `link_models` (the secondary tables of many-to-many relationships),
+    `declarative` (the SQLAlchemy declarative mapping) and `configure` (the mapper
+    configuration, that SQLAlchemy runs later for all the mappers at once).
+    """
+
+    def __init__(self) -> None:
+        # Model name -> phase -> seconds
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self._configure_start: Dict[Mapper[Any], float] = {}
+
+    def record(self, model: str, phase: str, seconds: float) -> None:
+        phases = self.timings.setdefault(model, {})
+        phases[phase] = phases.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, model: str, phase: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(model, phase, time.perf_counter() - start)
+
+    def totals(self) -> Dict[str, float]:
+        # Phase -> seconds, for all the models
+        totals = dict.fromkeys(CLASS_CREATION_PHASES, 0.0)
+        for phases in self.timings.values():
+            for phase, seconds in phases.items():
+                totals[phase] = totals.get(phase, 0.0) + seconds
+        return totals
+
+    def slowest(self, limit: int = 10) -> List[Tuple[str, float]]:
+        # The models that took the longest to create, in total for all the phases
+        models = [
+            (model, sum(phases.values())) for model, phases in self.timings.items()
+        ]
+        return sorted(models, key=lambda item: item[1], reverse=True)[:limit]
+
+    def report(self, limit: int = 10) -> str:
+        lines = [f"{len(self.timings)} models"]
+        for phase, seconds in self.totals().items():
+            lines.append(f"  {phase:<14}{seconds * 1000:10.1f} ms")
+        if self.timings:
+            lines.append(f"slowest {min(limit, len(self.timings))}:")
+            for model, seconds in self.slowest(limit):
+                lines.append(f"  {model:<40}{seconds * 1000:10.1f} ms")
+        return "\n".join(lines)
+
+    def _before_configured(self, mapper: Mapper[Any], cls: Type[Any]) -> None:
+        self._configure_start[mapper] = time.perf_counter()
+
+    def _after_configured(self, mapper: Mapper[Any], cls: Type[Any]) -> None:
+        start = self._configure_start.pop(mapper, None)
+        if start is not None:
+            self.record(
+                _model_name(cls.__module__, cls.__qualname__),
+                "configure",
+                time.perf_counter() - start,
+            )
+
+
+_active_profile: Optional[ClassCreationProfile] = None
+
+
+@contextmanager
+def profile_class_creation() -> Iterator[ClassCreationProfile]:
+    """Record the time spent on each phase of the creation of the model classes.
+
+    Only the classes created, and the mappers configured, inside of the `with` block
+    are recorded, e.g.:
+
+        with profile_class_creation() as profile:
+            import app.models
+            configure_mappers()
+        print(profile.report())
+    """
+    global _active_profile
+    previous = _active_profile
+    profile = ClassCreationProfile()
+    _active_profile = profile
+    event.listen(Mapper, "before_mapper_configured", profile._before_configured)
+    event.listen(Mapper, "mapper_configured", profile._after_configured)
+    try:
+        yield profile
+    finally:
+        event.remove(Mapper, "before_mapper_configured", profile._before_configured)
+        event.remove(Mapper, "mapper_configured", profile._after_configured)
+        _active_profile = previous
+
+
+def _model_name(module: Optional[str], qualname: str) -> str:
+    return f"{module}.{qualname}" if module else qualname
+
+
+_no_profile: ContextManager[None] = nullcontext()
+
+
+def profile_phase(
+    module: Optional[str], qualname: str, phase: str
+) -> ContextManager[None]:
+    # Used by SQLModelMetaclass, a no-op unless a profile is active
+    profile = _active_profile
+    if profile is None:
+        return _no_profile
+    return profile.phase(_model_name(module, qualname), phase)
+
+
+# Execution option with the code that called an AsyncSession method, the stack of
+# the greenlet that runs the statement doesn't include it
+CALL_SITE_OPTION = "sqlmodel_call_site"
+
+# Frames in these packages are skipped to find the call site
+_internal_paths = (
+    os.path.dirname(os.path.abspath(__file__)) + os.sep,
+    os.path.dirname(os.path.abspath(sqlalchemy.__file__ or "")) + os.sep,
+)
+
+
+def get_call_site() -> Optional[str]:
+    # The first frame in the stack outside of SQLModel and SQLAlchemy, and of the
+    # functions SQLAlchemy generates from strings, e.g. for its decorators
+    frame = sys._getframe(1)
+    while frame is not None:
+        code = frame.f_code
+        if not code.co_filename.startswith(_internal_paths + ("<",)):
+            return f"{code.co_filename}:{frame.f_lineno} in {code.co_name}"
+        frame = frame.f_back  # type: ignore[assignment]
+    return None
+
+
+class CompiledCacheEntry:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        # Compiled each time, e.g. a statement without a cache key
+        self.uncached = 0
+        # Seconds spent compiling, for the misses and the uncached
+        self.compile_time = 0.0
+
+    @property
+    def executions(self) -> int:
+        return self.hits + self.misses + self.uncached
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.hits / self.executions if self.executions else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"CompiledCacheEntry(hits={self.hits}, misses={self.misses}, "
+            f"uncached={self.uncached}, compile_time={self.compile_time:.6f})"
+        )
+
+
+class CompiledCacheStats:
+    """Hits and misses of SQLAlchemy's compiled statement cache.
+
+    `entries` has a `CompiledCacheEntry` per call site, the first line of code
+    outside of SQLModel and SQLAlchemy that executed the statement, and per
+    statement, its SQL. Many different statements from the same call site, each
+    with its own cache misses, mean the code there builds a new statement shape on
+    each call, e.g. with literal values instead of parameters.
+
+    The compile time is measured as SQLAlchemy does for its logs ("generated in"),
+    from the moment the statement was compiled to the moment it's sent to the
+    database.
+    """
+
+    def __init__(self) -> None:
+        self.entries: Dict[Tuple[Optional[str], str], CompiledCacheEntry] = {}
+        self._last_context: Optional[weakref.ref[DefaultExecutionContext]] = None
+
+    def by_call_site(self) -> Dict[Optional[str], CompiledCacheEntry]:
+        call_sites: Dict[Optional[str], CompiledCacheEntry] = {}
+        for (call_site, _), entry in self.entries.items():
+            total = call_sites.setdefault(call_site, CompiledCacheEntry())
+            total.hits += entry.hits
+            total.misses += entry.misses
+            total.uncached += entry.uncached
+            total.compile_time += entry.compile_time
+        return call_sites
+
+    def report(self, limit: int = 10) -> str:
+        statements: Dict[Optional[str], int] = {}
+        for call_site, _ in self.entries:
+            statements[call_site] = statements.get(call_site, 0) + 1
+        call_sites = sorted(
+            self.by_call_site().items(),
+            key=lambda item: item[1].misses + item[1].uncached,
+            reverse=True,
+        )
+        lines = []
+        for call_site, entry in call_sites[:limit]:
+            lines.append(
+                f"{call_site or '<unknown>'}: {entry.executions} executions, "
+                f"{entry.hit_ratio:.0%} hits, {entry.misses} misses, "
+                f"{entry.uncached} uncached, {statements[call_site]} statements, "
+                f"{entry.compile_time * 1000:.1f} ms compiling"
+            )
+        return "\n".join(lines)
+
+    def _before_cursor_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Optional[DefaultExecutionContext],
+        executemany: bool,
+    ) -> None:
+        if context is None or context.compiled is None:
+            return
+        # A statement can be sent in several batches, count it once
+        if self._last_context is not None and self._last_context() is context:
+            return
+        self._last_context = weakref.ref(context)
+        call_site = context.execution_options.get(CALL_SITE_OPTION) or get_call_site()
+        key = (call_site, context.compiled.string)
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = CompiledCacheEntry()
+        if context.cache_hit is CACHE_HIT:
+            entry.hits += 1
+            return
+        if context.cache_hit is CACHE_MISS:
+            entry.misses += 1
+        else:
+            entry.uncached += 1
+        compiled_time = get_compiled_time(context.compiled)
+        if compiled_time is not None:
+            entry.compile_time += time.perf_counter() - compiled_time
+
+
+_tracking_call_sites = 0
+
+
+@contextmanager
+def track_compiled_cache(
+    bind: Union[Engine, "AsyncEngine", None] = None,
+) -> Iterator[CompiledCacheStats]:
+    """Record the compiled statement cache hits and misses by call site.
+
+    Only the statements executed inside of the `with` block, with the given
+    engine, or with any engine if not given, are recorded, e.g.:
+
+        with track_compiled_cache(engine) as stats:
+            run_load_test()
+        print(stats.report())
+    """
+    global _tracking_call_sites
+    target: Any = Engine
+    if bind is not None:
+        # The sync engine of an AsyncEngine
+        target = getattr(bind, "sync_engine", bind)
+    stats = CompiledCacheStats()
+    event.listen(target, "before_cursor_execute", stats._before_cursor_execute)
+    _tracking_call_sites += 1
+    try:
+        yield stats
+    finally:
+        _tracking_call_sites -= 1
+        event.remove(target, "before_cursor_execute", stats._before_cursor_execute)
+
+
+def add_call_site(execution_options: Mapping[str, Any]) -> Mapping[str, Any]:
+    # Used by AsyncSession, a no-op unless the call sites are being tracked
+    if not _tracking_call_sites or CALL_SITE_OPTION in execution_options:
+        return execution_options
+    return util.immutabledict(execution_options).union(
+        {CALL_SITE_OPTION: get_call_site()}
+    )
+
+
+# Execution option with the ExecTiming of the statement run by Session.exec()
+EXEC_TIMING_OPTION = "sqlmodel_exec_timing"
+
+
+class ExecTiming:
+    """The time spent in each step of a `Session.exec()` call, in seconds.
+
+    `compile` is only measured on compiled cache misses, as in the SQLAlchemy logs.
+    `execute` is the database round trip, `fetch` the time to fetch the rows from
+    the DBAPI cursor, and `hydrate` the time to build the model instances, or rows,
+    from them. `total` also includes the rest, e.g. the autoflush before the query.
+    `rows` is the number of rows returned, or affected by an UPDATE or DELETE.
+    """
+
+    def __init__(self, call_site: Optional[str]) -> None:
+        self.call_site = call_site
+        self.sql: Optional[str] = None
+        self.fingerprint: Optional[str] = None
+        self.rows = 0
+        self.compile = 0.0
+        self.execute = 0.0
+        self.fetch = 0.0
+        self.hydrate = 0.0
+        self.total = 0.0
+        self._start = time.perf_counter()
+        self._cursor_start = 0.0
+        self._last = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"ExecTiming(fingerprint={self.fingerprint!r}, rows={self.rows}, "
+            f"compile={self.compile:.6f}, execute={self.execute:.6f}, "
+            f"fetch={self.fetch:.6f}, hydrate={self.hydrate:.6f}, "
+            f"total={self.total:.6f})"
+        )
+
+
+class ExecTimings:
+    """The `ExecTiming` of each `Session.exec()` call, in `records`."""
+
+    def __init__(self, on_record: Optional[Callable[[ExecTiming], None]]) -> None:
+        self.records: List[ExecTiming] = []
+        self.on_record = on_record
+
+    def totals(self) -> Dict[str, float]:
+        steps = ("compile", "execute", "fetch", "hydrate", "total")
+        return {
+            step: sum(getattr(record, step) for record in self.records)
+            for step in steps
+        }
+
+    def report(self, limit: int = 10) -> str:
+        # The statements that took the longest in total, by fingerprint
+        statements: Dict[Optional[str], List[ExecTiming]] = {}
+        for record in self.records:
+            statements.setdefault(record.fingerprint, []).append(record)
+        lines = []
+        for fingerprint, records in sorted(
+            statements.items(),
+            key=lambda item: sum(record.total for record in item[1]),
+            reverse=True,
+        )[:limit]:
+            steps = "  ".join(
+                f"{step} {sum(getattr(record, step) for record in records) * 1000:.1f}"
+                for step in ("compile", "execute", "fetch", "hydrate", "total")
+            )
+            lines.append(
+                f"{fingerprint}: {len(records)} calls, "
+                f"{sum(record.rows for record in records)} rows, {steps} (ms)  "
+                f"{' '.join((records[0].sql or '').split())[:80]}"
+            )
+        return "\n".join(lines)
+
+    def start(
+        self, statement: Any, execution_options: Mapping[str, Any]
+    ) -> Tuple[Optional[ExecTiming], Mapping[str, Any]]:
+        # Streamed results are not buffered to measure them
+        options = {**statement.get_execution_options(), **execution_options}
+        if options.get("yield_per") or options.get("stream_results"):
+            return None, execution_options
+        timing = ExecTiming(options.get(CALL_SITE_OPTION) or get_call_site())
+        return timing, util.immutabledict(execution_options).union(
+            {EXEC_TIMING_OPTION: timing, "prebuffer_rows": True}
+        )
+
+    def finish(self, timing: ExecTiming, result: Result[Any]) -> Result[Any]:
+        if isinstance(result, CursorResult) and not result.returns_rows:
+            timing.rows = max(result.rowcount, 0)
+            end = time.perf_counter()
+        else:
+            # Already buffered by the ORM with prebuffer_rows, this buffers the
+            # rows of the other results, e.g. exec_readonly()
+            frozen = result.freeze()
+            timing.rows = len(frozen.data)
+            result = frozen()
+            end = time.perf_counter()
+            if timing._last:
+                timing.hydrate = end - timing._last
+        timing.total = end - timing._start
+        self.records.append(timing)
+        if self.on_record is not None:
+            self.on_record(timing)
+        return result
+
+
+def _timing_before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Optional[DefaultExecutionContext],
+    executemany: bool,
+) -> None:
+    timing = context.execution_options.get(EXEC_TIMING_OPTION) if context else None
+    if timing is None:
+        return
+    now = time.perf_counter()
+    compiled = context.compiled if context else None
+    if timing.sql is None and compiled is not None:
+        timing.sql = compiled.string
+        timing.fingerprint = hashlib.sha1(compiled.string.encode()).hexdigest()[:16]
+        compiled_time = get_compiled_time(compiled)
+        if compiled_time is not None and context and context.cache_hit is not CACHE_HIT:
+            timing.compile += now - compiled_time
+    timing._cursor_start = now
+
+
+def _timing_after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Optional[DefaultExecutionContext],
+    executemany: bool,
+) -> None:
+    timing = context.execution_options.get(EXEC_TIMING_OPTION) if context else None
+    if timing is None or context is None:
+        return
+    now = time.perf_counter()
+    timing.execute += now - timing._cursor_start
+    timing._last = now
+    if (
+        not (context.is_crud or context.is_text or context.isddl)
+        and cursor.description is not None
+        and prefetch_cursor_rows(context, cursor)
+    ):
+        # Fetched all the rows now, to measure it apart from building the instances
+        timing._last = time.perf_counter()
+        timing.fetch += timing._last - now
+
+
+# The number of sessions tracked by engine (or by the Engine class), to remove the
+# listeners after the last one
+_tracking_exec_timings: Dict[Any, int] = {}
+
+
+@contextmanager
+def track_exec_timings(
+    session: Union["Session", "AsyncSession"],
+    on_record: Optional[Callable[[ExecTiming], None]] = None,
+) -> Iterator[ExecTimings]:
+    """Record the time spent in each step of the `exec()` calls of a session.
+
+    Each record has the compile, database round trip, fetch and hydration times,
+    the number of rows and a fingerprint of the SQL, to tell if a slow call is
+    bound by the database or by building the objects. `on_record` is called with
+    each record, e.g. to send it to a metrics system. While tracking, results are
+    fully buffered (the same as with `.all()`), except for `exec_stream()`.
+
+        with track_exec_timings(session) as timings:
+            heroes = session.exec(select(Hero)).all()
+        print(timings.report())
+    """
+    global _tracking_call_sites
+    sync_session: Any = getattr(session, "sync_session", session)
+    # Listen on the engine of the session, or on all the engines for a session
+    # with a bind per model
+    target: Any = Engine
+    try:
+        target = sync_session.get_bind().engine
+    except UnboundExecutionError:
+        pass
+    timings = ExecTimings(on_record)
+    previous = sync_session._sqlmodel_exec_timings
+    sync_session._sqlmodel_exec_timings = timings
+    if target not in _tracking_exec_timings:
+        event.listen(target, "before_cursor_execute", _timing_before_cursor_execute)
+        event.listen(target, "after_cursor_execute", _timing_after_cursor_execute)
+    _tracking_exec_timings[target] = _tracking_exec_timings.get(target, 0) + 1
+    _tracking_call_sites += 1
+    try:
+        yield timings
+    finally:
+        _tracking_call_sites -= 1
+        _tracking_exec_timings[target] -= 1
+        if not _tracking_exec_timings[target]:
+            del _tracking_exec_timings[target]
+            event.remove(target, "before_cursor_execute", _timing_before_cursor_execute)
+            event.remove(target, "after_cursor_execute", _timing_after_cursor_execute)
+        sync_session._sqlmodel_exec_timings = previous
+
+
+class NPlusOneWarning(UserWarning):
+    pass
+
+
+class NPlusOneError(RuntimeError):
+    pass
+
+
+class LazyLoadStats:
+    """The lazy loads of each relationship attribute, e.g. `Hero.team`, in `loads`.
+
+    `call_sites` has the code that triggered the first lazy load of each one.
+    """
+
+    def __init__(self, policy: Literal["count", "warn", "raise"], threshold: int):
+        self.policy = policy
+        self.threshold = threshold
+        self.loads: Dict[str, int] = {}
+        self.call_sites: Dict[str, Optional[str]] = {}
+
+    def report(self) -> str:
+        lines = []
+        for attribute, count in sorted(
+            self.loads.items(), key=lambda item: item[1], reverse=True
+        ):
+            lines.append(
+                f"{attribute}: {count} lazy loads, first from "
+                f"{self.call_sites[attribute] or '<unknown>'}"
+            )
+        return "\n".join(lines)
+
+    def _do_orm_execute(self, orm_execute_state: ORMExecuteState) -> None:
+        path = orm_execute_state.loader_strategy_path
+        if orm_execute_state.lazy_loaded_from is None or path is None:
+            return
+        prop = path.prop  # type: ignore[attr-defined]
+        attribute = f"{prop.parent.class_.__name__}.{prop.key}"
+        count = self.loads.get(attribute, 0) + 1
+        self.loads[attribute] = count
+        if count == 1:
+            self.call_sites[attribute] = get_call_site()
+        if count <= self.threshold or self.policy == "count":
+            return
+        if self.policy == "warn" and count > self.threshold + 1:
+            # Warn only once per attribute
+            return
+        message = (
+            f"{attribute} was lazy loaded {count} times, one query per object, "
+            f"first from {self.call_sites[attribute] or '<unknown>'}. Load it for "
+            f"all the objects at once, e.g. with selectinload({attribute})"
+        )
+        if self.policy == "raise":
+            raise NPlusOneError(message)
+        if self.policy == "warn":
+            warnings.warn(message, NPlusOneWarning, stacklevel=2)
+
+
+@contextmanager
+def detect_lazy_loads(
+    session: Union["Session", "AsyncSession", None] = None,
+    *,
+    policy: Literal["count", "warn", "raise"] = "warn",
+    threshold: int = 1,
+) -> Iterator[LazyLoadStats]:
+    """Count the lazy loads of each relationship attribute, to find N+1 queries.
+
+    Only the lazy loads that run a query are counted, in the given session, or in
+    any session if not given, inside of the `with` block, e.g. a request or a test.
+    When an attribute is lazy loaded more than `threshold` times, the `"warn"`
+    policy emits an `NPlusOneWarning` (once per attribute) and the `"raise"`
+    policy raises an `NPlusOneError` instead of running the query.
+
+        with detect_lazy_loads(session, policy="raise"):
+            for hero in session.exec(select(Hero)):
+                print(hero.team)
+    """
+    target: Any = SASession
+    if session is not None:
+        target = getattr(session, "sync_session", session)
+    stats = LazyLoadStats(policy, threshold)
+    event.listen(target, "do_orm_execute", stats._do_orm_execute)
+    try:
+        yield stats
+    finally:
+        event.remove(target, "do_orm_execute", stats._do_orm_execute)
@@ -0,0 +1,131 @@
+import hashlib
+from typing import Any, List, Optional, Set, Tuple, Union
+
+from sqlalchemy import (
+    Column,
+    MetaData,
+    String,
+    Table,
+    delete,
+    insert,
+    inspect,
+    select,
+)
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.engine.interfaces import Dialect
+
+# Where bootstrap_schema() stores the fingerprint of the last schema it created, in
+# its own metadata so that it's not created with the models
+_fingerprints = Table(
+    "sqlmodel_schema_fingerprint",
+    MetaData(),
+    Column("name", String(255), primary_key=True),
+    Column("fingerprint", String(64), nullable=False),
+)
+
+
+def get_schema_fingerprint(metadata: MetaData, dialect: Dialect) -> str:
+    # A hash of what create_all() would create, stable across processes: the
+    # tables, their columns (with the types compiled for the dialect), constraints
+    # and indexes, sorted by name. Cheaper than compiling all the DDL
+    digest = hashlib.sha256()
+    for table in sorted(metadata.tables.values(), key=lambda table: table.key):
+        parts: List[Any] = [table.key]
+        for column in table.columns:
+            parts.append(
+                (
+                    column.name,
+                    column.type.compile(dialect=dialect),
+                    column.nullable,
+                    column.primary_key,
+                    column.unique,
+                    str(getattr(column.server_default, "arg", None)),
+                    sorted(key.target_fullname for key in column.foreign_keys),
+                )
+            )
+        # The constraints and indexes are sets, hashed by identity, so their order
+        # changes from one process to the next
+        parts.extend(
+            sorted(
+                (
+                    type(constraint).__name__,
+                    str(constraint.name),
+                    sorted(
+                        column.name for column in getattr(constraint, "columns", ())
+                    ),
+                    str(getattr(constraint, "sqltext", "")),
+                )
+                for constraint in table.constraints
+            )
+        )
+        parts.extend(
+            sorted(
+                (
+                    str(index.name),
+                    index.unique,
+                    [column.name for column in index.columns],
+                )
+                for index in table.indexes
+            )
+        )
+        digest.update(repr(parts).encode())
+    return digest.hexdigest()
+
+
+def bootstrap_schema(
+    bind: Union[Engine, Connection],
+    metadata: Optional[MetaData] = None,
+    *,
+    name: str = "default",
+) -> List[str]:
+    """Create the missing tables, with a fixed number of queries.
+
+    `metadata.create_all()` checks each table with a separate query on every
+    start. This compares a fingerprint of the metadata (`SQLModel.metadata` by
+    default) with the one stored in the database, under `name`, by the last
+    bootstrap. If it matches, it does nothing else. Otherwise it reads the
+    existing tables with one query (per database schema used), creates only the
+    missing tables, with their indexes, and stores the new fingerprint.
+
+    As with `create_all()`, existing tables are not altered, use migrations for
+    that. Tables dropped by other means are not created again while the
+    fingerprint matches, delete the stored one to check them.
+
+    Returns the names of the tables created.
+    """
+    if metadata is None:
+        from .main import SQLModel
+
+        metadata = SQLModel.metadata
+    if isinstance(bind, Engine):
+        with bind.begin() as connection:
+            return bootstrap_schema(connection, metadata, name=name)
+    connection = bind
+    fingerprint = get_schema_fingerprint(metadata, connection.dialect)
+    inspector = inspect(connection)
+    has_fingerprints = inspector.has_table(_fingerprints.name)
+    stored = None
+    if has_fingerprints:
+        stored = connection.execute(
+            select(_fingerprints.c.fingerprint).where(_fingerprints.c.name == name)
+        ).scalar_one_or_none()
+        if stored == fingerprint:
+            return []
+    existing: Set[Tuple[Optional[str], str]] = set()
+    for schema in {None} | {table.schema for table in metadata.tables.values()}:
+        existing.update(
+            (schema, table_name)
+            for table_name in inspector.get_table_names(schema=schema)
+        )
+    missing = [
+        table
+        for table in metadata.tables.values()
+        if (table.schema, table.name) not in existing
+    ]
+    metadata.create_all(connection, tables=missing, checkfirst=False)
+    if not has_fingerprints:
+        _fingerprints.create(connection, checkfirst=False)
+    if stored is not None:
+        connection.execute(delete(_fingerprints).where(_fingerprints.c.name == name))
+    connection.execute(insert(_fingerprints).values(name=name, fingerprint=fingerprint))
+    return [table.fullname for table in missing]
@@ -48,6 +48,16 @@ from sqlalchemy.sql.roles import TypedColumnsClauseRole
 from sqlalchemy.sql.type_api import TypeEngine
 from typing_extensions import Literal, Self
 
+from ..orm.loading import RelationshipLoad, get_loader_option
+from .pagination import (
+    CURSOR_LABEL_PREFIX,
+    Paginated,
+    decode_cursor,
+    get_keyset_columns,
+    get_keyset_criteria,
+    get_read_model,
+)
+
 _T = TypeVar("_T")
 
 _TypeEngineArgument = Union[Type[TypeEngine[_T]], TypeEngine[_T]]
@@ -230,6 +240,74 @@ class SelectBase(_Select[Tuple[_T]]):
         """
         return super().having(*having)  # type: ignore[arg-type]
 
+    def load(
+        self,
+        strategy: RelationshipLoad,
+        *attributes: Union[InstrumentedAttribute[Any], Any],
+    ) -> Self:
+        """Return a new `Select` construct that loads the given relationship
+        attributes with `strategy` (e.g. `"selectin"`), overriding the one set in
+        `Relationship(load=...)` for this query. Pass `"*"` to apply it to all the
+        other relationships, e.g. `.load("raise", "*")`.
+        """
+        return self.options(
+            *(get_loader_option(attribute, strategy) for attribute in attributes)
+        )
+
+    def paginate(
+        self,
+        *,
+        limit: int,
+        after: Optional[str] = None,
+        order_by: Union[Any, Sequence[Any]] = (),
+    ) -> "Paginated[_T]":
+        """Return a statement for a page of `limit` rows, after the `next_cursor` of
+        the previous page (or the first page), to run with `session.exec()`, that
+        returns a `Page`.
+
+        The rows are sorted by `order_by` (or the `ORDER BY` of the statement), and
+        by the primary key of the first model selected, and the next pages are
+        filtered with `WHERE` on those columns instead of `OFFSET`, so deep pages are
+        as fast as the first one with an index. The ordering columns should not be
+        `NULL`, and `after` should come from a statement with the same ordering.
+
+        With a non-table model, as in `select(HeroRead)`, the items are instances of
+        it, sorted at the end by the primary key of the table model it reads from.
+        """
+        if limit < 1:
+            raise ValueError("The limit of a page should be at least 1")
+        if not isinstance(order_by, (list, tuple)):
+            order_by = [order_by]
+        read_model = get_read_model(
+            self.get_execution_options().get("sqlmodel_readonly"),
+            self.column_descriptions,
+        )
+        columns = get_keyset_columns(
+            list(order_by) or list(self._order_by_clauses),
+            self.column_descriptions,
+            read_model,
+        )
+        statement = self.order_by(None).order_by(
+            *(column.desc() if descending else column for column, descending in columns)
+        )
+        if after is not None:
+            values = decode_cursor(after, columns)
+            statement = statement.where(get_keyset_criteria(columns, values))
+        # The values of the cursor, after the selected columns
+        page_statement = statement.add_columns(
+            *(
+                column.label(f"{CURSOR_LABEL_PREFIX}{index}")
+                for index, (column, _) in enumerate(columns)
+            )
+        ).limit(limit + 1)
+        return Paginated(
+            page_statement,
+            limit=limit,
+            width=len(self.column_descriptions),
+            scalar=isinstance(self, SelectOfScalar),
+            read_model=read_model,
+        )
+
 
 class Select(SelectBase[_T]):
     inherit_cache = True
@@ -609,6 +687,15 @@ def select(  # type: ignore
 
 def select(*entities: Any) -> Union[Select, SelectOfScalar]:  # type: ignore
     if len(entities) == 1:
+        entity = entities[0]
+        # A non-table model, e.g. HeroRead, selects only the columns for its fields
+        # and is built from them when executed
+        if isinstance(entity, type) and hasattr(entity, "_sqlmodel_read_columns"):
+            columns = entity._sqlmodel_read_columns()
+            if columns is not None:
+                return SelectOfScalar(*columns).execution_options(
+                    sqlmodel_readonly=entity
+                )
         return SelectOfScalar(*entities)
     return Select(*entities)
 
@@ -0,0 +1,230 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from typing import (
+    Any,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from sqlalchemy import and_, inspect, or_
+from sqlalchemy.engine.result import Result
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import ColumnElement, UnaryExpression
+
+from ..main import _get_read_model_table
+
+_T = TypeVar("_T")
+
+# The labels of the columns added to get the cursor values of the last row
+CURSOR_LABEL_PREFIX = "sqlmodel_cursor_"
+
+# An ordering column, and if it's descending
+KeysetColumn = Tuple[ColumnElement[Any], bool]
+
+
+class Page(Generic[_T]):
+    """A page of results from `session.exec(select(...).paginate(...))`.
+
+    `items` has the rows (or objects) of the page, and `next_cursor` the token to
+    pass in `paginate(after=...)` to get the next page, or `None` if this is the
+    last one.
+    """
+
+    def __init__(self, items: List[_T], next_cursor: Optional[str]) -> None:
+        self.items = items
+        self.next_cursor = next_cursor
+
+    def __iter__(self) -> Iterator[_T]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __repr__(self) -> str:
+        return f"Page(items={self.items!r}, next_cursor={self.next_cursor!r})"
+
+
+class Paginated(Generic[_T]):
+    """A statement built by `select(...).paginate(...)`, run it with
+    `session.exec()` to get a `Page`.
+    """
+
+    def __init__(
+        self,
+        statement: Any,
+        limit: int,
+        width: int,
+        scalar: bool,
+        read_model: Optional[Type[Any]] = None,
+    ) -> None:
+        # The statement with the keyset criteria, LIMIT limit + 1 to know if there
+        # are more pages, and the cursor columns after the width selected ones
+        self.statement = statement
+        self.limit = limit
+        self.width = width
+        self.scalar = scalar
+        # The non-table model to build from the selected columns, e.g. HeroRead
+        self.read_model = read_model
+
+    def get_page(self, result: Result[Any]) -> Page[_T]:
+        items: Sequence[Any]
+        if self.read_model is not None:
+            names = tuple(result.keys())[: self.width]
+            rows = result.all()
+            items = list(
+                self.read_model._sqlmodel_construct_rows(
+                    (row[: self.width] for row in rows[: self.limit]), names, False
+                )
+            )
+        elif self.scalar:
+            rows = result.all()
+            items = [row[0] for row in rows]
+        else:
+            # Rows without the cursor columns, from the same fetched data
+            frozen = result.freeze()
+            rows = frozen().all()
+            items = frozen().columns(*range(self.width)).all()
+        next_cursor = None
+        if len(rows) > self.limit:
+            next_cursor = encode_cursor(tuple(rows[self.limit - 1][self.width :]))
+        return Page(list(items[: self.limit]), next_cursor)
+
+
+def get_read_model(readonly: Any, descriptions: Sequence[Any]) -> Optional[Type[Any]]:
+    # The model to build the items with, for the sqlmodel_readonly option that
+    # select() sets for a non-table model, e.g. select(HeroRead)
+    if not readonly:
+        return None
+    if (
+        isinstance(readonly, type)
+        and hasattr(readonly, "_sqlmodel_read_columns")
+        and readonly._sqlmodel_read_columns() is not None
+        and not any(description.get("entity") for description in descriptions)
+    ):
+        return readonly
+    raise ValueError(
+        "Can't paginate a read-only statement, only the columns of a non-table "
+        "model, e.g. select(HeroRead)"
+    )
+
+
+def get_keyset_columns(
+    order_by: Sequence[Any],
+    descriptions: Sequence[Any],
+    read_model: Optional[Type[Any]] = None,
+) -> List[KeysetColumn]:
+    # The ordering columns, with the primary key of the first selected model (or
+    # of the table model of the read model) at the end, if not there already, to
+    # make the order unique
+    columns: List[KeysetColumn] = []
+    for clause in order_by:
+        descending = False
+        if isinstance(clause, UnaryExpression) and clause.modifier in (
+            operators.desc_op,
+            operators.asc_op,
+        ):
+            descending = clause.modifier is operators.desc_op
+            clause = clause.element
+        if isinstance(clause, UnaryExpression) and clause.modifier is not None:
+            raise ValueError(f"Can't paginate ordering by {clause}, e.g. NULLS FIRST")
+        if hasattr(clause, "__clause_element__"):
+            clause = clause.__clause_element__()
+        columns.append((clause, descending))
+    pk_columns: List[ColumnElement[Any]] = []
+    entities = [description.get("entity") for description in descriptions]
+    entity = next((entity for entity in entities if entity is not None), None)
+    if entity is not None:
+        mapper = inspect(entity).mapper
+        for pk_column in mapper.primary_key:
+            key = mapper.get_property_by_column(pk_column).key
+            pk_columns.append(getattr(entity, key).__clause_element__())
+    elif read_model is not None:
+        # The same table columns the read model selects
+        pk_columns.extend(_get_read_model_table(read_model).__table__.primary_key)
+    for column in pk_columns:
+        if not any(column.compare(other) for other, _ in columns):
+            columns.append((column, False))
+    if not columns:
+        raise ValueError("Pass order_by to paginate a statement without a model")
+    return columns
+
+
+def get_keyset_criteria(
+    columns: Sequence[KeysetColumn], values: Sequence[Any]
+) -> ColumnElement[bool]:
+    # The rows after the cursor values in the order of the columns, as in:
+    # a >= :a AND (a > :a OR (a = :a AND b > :b)), with < for descending columns.
+    # Portable, and the first condition lets the database use an index on a to
+    # start at the cursor, instead of skipping the previous pages as with OFFSET
+    clauses = []
+    for index, (column, descending) in enumerate(columns):
+        after = column < values[index] if descending else column > values[index]
+        equal = [
+            previous == value for (previous, _), value in zip(columns, values[:index])
+        ]
+        clauses.append(and_(*equal, after))
+    if len(clauses) == 1:
+        return clauses[0]
+    first, descending = columns[0]
+    start = first <= values[0] if descending else first >= values[0]
+    return and_(start, or_(*clauses))
+
+
+def _to_json(value: Any) -> Any:
+    if value is None or type(value) in (bool, int, float, str):
+        return value
+    if isinstance(value, Enum):
+        # By name, as SQLAlchemy stores them
+        return value.name
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode()
+    return str(value)
+
+
+def encode_cursor(values: Tuple[Any, ...]) -> str:
+    # Opaque for the clients, URL safe, JSON of the values inside
+    data = json.dumps([_to_json(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def _from_json(value: Any, column: ColumnElement[Any]) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is str:
+        return value
+    if python_type in (datetime, date, time):
+        return python_type.fromisoformat(value)
+    if python_type is bytes:
+        return base64.b64decode(value)
+    if issubclass(python_type, Enum):
+        return python_type[value]
+    # e.g. Decimal or UUID
+    return python_type(value)
+
+
+def decode_cursor(cursor: str, columns: Sequence[KeysetColumn]) -> List[Any]:
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(data)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError
+        return [
+            _from_json(value, column) for value, (column, _) in zip(values, columns)
+        ]
+    except (ValueError, TypeError, KeyError, binascii.Error):
+        raise ValueError(f"Invalid pagination cursor {cursor!r}") from None
@@ -1,8 +1,12 @@
+import ipaddress
 import uuid
-from typing import Any, Optional, cast
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple, cast
 
 from sqlalchemy import CHAR, types
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.engine.interfaces import Dialect
 from sqlalchemy.sql.type_api import TypeEngine
 
@@ -34,6 +38,9 @@ class GUID(types.TypeDecorator):  # type: ignore
 
     def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
         if dialect.name == "postgresql":
+            # Imported here to not import the PostgreSQL dialect with sqlmodel
+            from sqlalchemy.dialects.postgresql import UUID
+
             return dialect.type_descriptor(UUID())
         else:
             return dialect.type_descriptor(CHAR(32))
@@ -57,3 +64,95 @@ class GUID(types.TypeDecorator):  # type: ignore
             if not isinstance(value, uuid.UUID):
                 value = uuid.UUID(value)
             return cast(uuid.UUID, value)
+
+
+# The SQLAlchemy type for each Python type, a TypeEngine class or instance, or a
+# function that takes the Python type and the field metadata (with max_length,
+# max_digits and decimal_places) and returns one
+_sqlalchemy_types: Dict[type, Any] = {}
+# The entry found for each Python type walking its MRO, and if it's a factory
+_resolved_sqlalchemy_types: Dict[type, Tuple[Any, bool]] = {}
+
+
+def register_sqlalchemy_type(python_type: type, sa_type: Any) -> None:
+    """Use `sa_type` for the fields of type `python_type`, or a subclass of it.
+
+    `sa_type` can be a SQLAlchemy type (a class or an instance), or a function
+    that takes the Python type of the field and its metadata, with `max_length`,
+    `max_digits` and `decimal_places`, and returns a SQLAlchemy type.
+
+    ```Python
+    register_sqlalchemy_type(Money, Numeric(12, 2))
+    ```
+
+    A type registered for a subclass takes precedence over the one for its base.
+    """
+    _sqlalchemy_types[python_type] = sa_type
+    _resolved_sqlalchemy_types.clear()
+
+
+def _is_sqlalchemy_type(sa_type: Any) -> bool:
+    return isinstance(sa_type, TypeEngine) or (
+        isinstance(sa_type, type) and issubclass(sa_type, TypeEngine)
+    )
+
+
+def _lookup_sqlalchemy_type(python_type: type) -> Any:
+    if not isinstance(python_type, type):
+        return None
+    mro: Sequence[type] = python_type.__mro__
+    # Enum bases are checked before the other bases, as an enum can also be a str,
+    # needed by Pydantic/FastAPI
+    if issubclass(python_type, Enum):
+        mro = sorted(mro, key=lambda base: not issubclass(base, Enum))
+    for base in mro:
+        if base in _sqlalchemy_types:
+            return _sqlalchemy_types[base]
+    return None
+
+
+def get_sqlalchemy_type_for(python_type: type, metadata: Any) -> Any:
+    try:
+        sa_type, is_factory = _resolved_sqlalchemy_types[python_type]
+    except KeyError:
+        sa_type = _lookup_sqlalchemy_type(python_type)
+        is_factory = sa_type is not None and not _is_sqlalchemy_type(sa_type)
+        _resolved_sqlalchemy_types[python_type] = (sa_type, is_factory)
+    if sa_type is None:
+        raise ValueError(f"{python_type} has no matching SQLAlchemy type")
+    if is_factory:
+        return sa_type(python_type, metadata)
+    return sa_type
+
+
+def _string_type(python_type: type, metadata: Any) -> Any:
+    max_length = getattr(metadata, "max_length", None)
+    if max_length:
+        return AutoString(length=max_length)
+    return AutoString
+
+
+def _numeric_type(python_type: type, metadata: Any) -> Any:
+    return types.Numeric(
+        precision=getattr(metadata, "max_digits", None),
+        scale=getattr(metadata, "decimal_places", None),
+    )
+
+
+register_sqlalchemy_type(Enum, lambda python_type, metadata: types.Enum(python_type))
+register_sqlalchemy_type(str, _string_type)
+register_sqlalchemy_type(float, types.Float)
+register_sqlalchemy_type(bool, types.Boolean)
+register_sqlalchemy_type(int, types.Integer)
+register_sqlalchemy_type(datetime, types.DateTime)
+register_sqlalchemy_type(date, types.Date)
+register_sqlalchemy_type(timedelta, types.Interval)
+register_sqlalchemy_type(time, types.Time)
+register_sqlalchemy_type(bytes, types.LargeBinary)
+register_sqlalchemy_type(Decimal, _numeric_type)
+register_sqlalchemy_type(ipaddress.IPv4Address, AutoString)
+register_sqlalchemy_type(ipaddress.IPv4Network, AutoString)
+register_sqlalchemy_type(ipaddress.IPv6Address, AutoString)
+register_sqlalchemy_type(ipaddress.IPv6Network, AutoString)
+register_sqlalchemy_type(Path, AutoString)
+register_sqlalchemy_type(uuid.UUID, GUID)
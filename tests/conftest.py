@@ -1,12 +1,15 @@
 import shutil
 import subprocess
 import sys
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import pytest
 from pydantic import BaseModel
-from sqlmodel import SQLModel
+from sqlalchemy import Column, DateTime, UniqueConstraint, event, func
+from sqlalchemy.engine import Engine
+from sqlmodel import Field, Relationship, SQLModel, create_engine
 from sqlmodel.compat import IS_PYDANTIC_V2
 from sqlmodel.main import default_registry
 
@@ -25,6 +28,64 @@ def clear_sqlmodel():
     default_registry.dispose()
 
 
+@pytest.fixture()
+def engine() -> Iterator[Engine]:
+    # An in-memory SQLite database, without tables
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def hero_models(clear_sqlmodel, engine: Engine) -> Tuple[Any, Any]:
+    # The Team and Hero table models, created in the engine, without rows
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str = Field(unique=True)
+        headquarters: Optional[str] = None
+        heroes: List["Hero"] = Relationship(back_populates="team")
+
+    class Hero(SQLModel, table=True):
+        __table_args__ = (UniqueConstraint("name", "secret_name"),)
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        secret_name: Optional[str] = None
+        age: Optional[int] = None
+        created_at: Optional[datetime] = Field(
+            default=None,
+            sa_column=Column(DateTime, server_default=func.current_timestamp()),
+        )
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+        team: Optional[Team] = Relationship(back_populates="heroes")
+
+    SQLModel.metadata.create_all(engine)
+    return Team, Hero
+
+
+@pytest.fixture()
+def count_queries() -> Iterator[Callable[..., List[Any]]]:
+    # Record the SQL statements an engine runs from the call on, or the
+    # (statement, parameters) pairs with parameters=True
+    listeners: List[Tuple[Any, Callable[..., None]]] = []
+
+    def count(engine: Any, *, parameters: bool = False) -> List[Any]:
+        statements: List[Any] = []
+
+        def before_cursor_execute(
+            conn: Any, cursor: Any, statement: str, params: Any, *args: Any
+        ) -> None:
+            statement = statement.strip()
+            statements.append((statement, params) if parameters else statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        listeners.append((engine, before_cursor_execute))
+        return statements
+
+    yield count
+    for engine, listener in listeners:
+        event.remove(engine, "before_cursor_execute", listener)
+
+
 @pytest.fixture()
 def cov_tmp_path(tmp_path: Path):
     yield tmp_path
@@ -0,0 +1,55 @@
+import asyncio
+from typing import Optional
+
+import pytest
+from sqlmodel import Field, SQLModel, insert, select
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+from sqlmodel.ext.asyncio.session import AsyncSession  # noqa: E402
+
+
+def test_async_exec_stream(clear_sqlmodel):
+    class HeroBase(SQLModel):
+        name: str
+
+    class Hero(HeroBase, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+
+    class HeroRead(HeroBase):
+        id: int
+
+    async def main() -> None:
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+            await connection.execute(
+                insert(Hero), [{"name": f"Hero {i}"} for i in range(25)]
+            )
+        async with AsyncSession(engine) as session:
+            names = []
+            async for heroes in session.exec_stream(
+                select(Hero).order_by(Hero.id), batch_size=10
+            ):
+                assert len(session.sync_session.identity_map) == len(heroes)
+                names.extend(hero.name for hero in heroes)
+            assert names == [f"Hero {i}" for i in range(25)]
+            assert len(session.sync_session.identity_map) == 0
+
+            batches = [
+                heroes
+                async for heroes in session.exec_stream(select(HeroRead), batch_size=10)
+            ]
+            assert [len(heroes) for heroes in batches] == [10, 10, 5]
+            assert batches[0][0] == HeroRead(id=1, name="Hero 0")
+
+            stream = session.exec_stream(select(Hero), batch_size=3)
+            async for _ in stream:
+                break
+            await stream.aclose()
+            hero = (await session.exec(select(Hero).where(Hero.id == 3))).one()
+            assert hero.name == "Hero 2"
+        await engine.dispose()
+
+    asyncio.run(main())
@@ -0,0 +1,178 @@
+import asyncio
+from typing import Any, List, Optional
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import Field, Relationship, Session, SQLModel, select
+from sqlmodel.orm.loading import batch_lazy_load
+from sqlmodel.profiling import detect_lazy_loads
+
+
+def create_models() -> Any:
+    class HeroPowerLink(SQLModel, table=True):
+        hero_id: Optional[int] = Field(
+            default=None, foreign_key="hero.id", primary_key=True
+        )
+        power_id: Optional[int] = Field(
+            default=None, foreign_key="power.id", primary_key=True
+        )
+
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        heroes: List["Hero"] = Relationship(back_populates="team")
+
+    class Power(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+        team: Optional[Team] = Relationship(back_populates="heroes")
+        powers: List[Power] = Relationship(link_model=HeroPowerLink)
+        mentor_id: Optional[int] = Field(default=None, foreign_key="hero.id")
+        mentor: Optional["Hero"] = Relationship(
+            sa_relationship_kwargs={"remote_side": "Hero.id"}
+        )
+
+    return Team, Hero, Power
+
+
+def add_heroes(engine: Any, team_model: Any, hero_model: Any, power_model: Any):
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        powers = [power_model(name=f"Power {i}") for i in range(3)]
+        for i in range(3):
+            team = team_model(name=f"Team {i}")
+            for j in range(2):
+                hero = hero_model(name=f"Hero {i}.{j}", team=team, powers=powers[i:])
+                session.add(hero)
+        session.add(hero_model(name="Solo"))
+        session.commit()
+
+
+def test_batch_lazy_loads_many_to_one(clear_sqlmodel, engine, count_queries):
+    Team, Hero, Power = create_models()
+    add_heroes(engine, Team, Hero, Power)
+    statements = count_queries(engine)
+    with Session(engine) as session:
+        session.enable_batch_lazy_loads()
+        heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+        with detect_lazy_loads(session, policy="count") as stats:
+            names = [hero.team.name if hero.team else None for hero in heroes]
+    assert names == ["Team 0", "Team 0", "Team 1", "Team 1", "Team 2", "Team 2", None]
+    assert len(statements) == 2
+    assert " IN " in statements[1]
+    # The batch runs instead of the lazy load query
+    assert stats.loads == {}
+
+
+def test_batch_lazy_loads_one_to_many(clear_sqlmodel, engine, count_queries):
+    Team, Hero, Power = create_models()
+    add_heroes(engine, Team, Hero, Power)
+    statements = count_queries(engine)
+    with Session(engine) as session:
+        session.enable_batch_lazy_loads()
+        teams = session.exec(select(Team).order_by(Team.id)).all()
+        heroes = [[hero.name for hero in team.heroes] for team in teams]
+        assert heroes == [
+            ["Hero 0.0", "Hero 0.1"],
+            ["Hero 1.0", "Hero 1.1"],
+            ["Hero 2.0", "Hero 2.1"],
+        ]
+        assert len(statements) == 2
+        # The loaded collections are tracked as any other
+        teams[1].heroes.append(teams[0].heroes.pop())
+        team_id = teams[1].id
+        session.commit()
+    with Session(engine) as session:
+        team = session.get(Team, team_id)
+        assert team is not None
+        assert len(team.heroes) == 3
+
+
+def test_batch_lazy_loads_many_to_many(clear_sqlmodel, engine, count_queries):
+    Team, Hero, Power = create_models()
+    add_heroes(engine, Team, Hero, Power)
+    statements = count_queries(engine)
+    with Session(engine) as session:
+        session.enable_batch_lazy_loads()
+        heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+        assert [len(hero.powers) for hero in heroes] == [3, 3, 2, 2, 1, 1, 0]
+        assert len(statements) == 2
+
+
+def test_batch_lazy_loads_self_referential(clear_sqlmodel, engine, count_queries):
+    Team, Hero, Power = create_models()
+    add_heroes(engine, Team, Hero, Power)
+    with Session(engine) as session:
+        heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+        for hero in heroes[1:]:
+            hero.mentor = heroes[0]
+        session.commit()
+    statements = count_queries(engine)
+    with Session(engine) as session:
+        session.enable_batch_lazy_loads()
+        heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+        # Not batched, the default lazy load, from the identity map
+        assert [hero.mentor is heroes[0] for hero in heroes[1:]] == [True] * 6
+        assert heroes[0].mentor is None
+        assert len(statements) == 1
+
+
+def test_batch_lazy_loads_sessionmaker(clear_sqlmodel, engine, count_queries):
+    Team, Hero, Power = create_models()
+    add_heroes(engine, Team, Hero, Power)
+    make_session = sessionmaker(engine, class_=Session)
+    event.listen(make_session, "do_orm_execute", batch_lazy_load)
+    statements = count_queries(engine)
+    with make_session() as session:
+        heroes = session.exec(select(Hero)).all()
+        assert len({hero.team.name for hero in heroes if hero.team}) == 3
+        # Enabling it again doesn't add another listener
+        session.enable_batch_lazy_loads()
+        session.enable_batch_lazy_loads()
+    assert len(statements) == 2
+
+
+def test_batch_lazy_loads_disabled(clear_sqlmodel, engine, count_queries):
+    Team, Hero, Power = create_models()
+    add_heroes(engine, Team, Hero, Power)
+    statements = count_queries(engine)
+    with Session(engine) as session:
+        teams = session.exec(select(Team)).all()
+        assert all(len(team.heroes) == 2 for team in teams)
+        assert len(statements) == 4
+
+
+def test_batch_lazy_loads_async(clear_sqlmodel, count_queries):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    Team, Hero, Power = create_models()
+    results: List[Any] = []
+
+    async def main() -> None:
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            for i in range(3):
+                session.add(Hero(name=f"Hero {i}", team=Team(name=f"Team {i}")))
+            await session.commit()
+        statements = count_queries(engine.sync_engine)
+        async with AsyncSession(engine) as session:
+            session.enable_batch_lazy_loads()
+            heroes = (await session.exec(select(Hero).order_by(Hero.id))).all()
+            results.append(
+                await session.run_sync(lambda _: [hero.team.name for hero in heroes])
+            )
+        results.append(len(statements))
+        await engine.dispose()
+
+    asyncio.run(main())
+    assert results == [["Team 0", "Team 1", "Team 2"], 2]
@@ -0,0 +1,141 @@
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import inspect, text
+from sqlmodel import Field, SQLModel, bootstrap_schema
+from sqlmodel.schema import get_schema_fingerprint
+
+
+def test_bootstrap_schema(clear_sqlmodel, engine, count_queries):
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str = Field(index=True)
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+
+    assert sorted(bootstrap_schema(engine)) == ["hero", "team"]
+    inspector = inspect(engine)
+    assert set(inspector.get_table_names()) == {
+        "hero",
+        "team",
+        "sqlmodel_schema_fingerprint",
+    }
+    assert [index["name"] for index in inspector.get_indexes("team")] == [
+        "ix_team_name"
+    ]
+
+    statements = count_queries(engine)
+    assert bootstrap_schema(engine) == []
+    # Only the fingerprint is read, without listing the tables
+    assert len(statements) == 2
+    assert not any("sqlite_master" in statement for statement in statements)
+    assert not any(statement.startswith("CREATE") for statement in statements)
+
+    # A table dropped by hand is not checked while the fingerprint matches, it's
+    # created again after deleting the fingerprint
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE hero"))
+    assert bootstrap_schema(engine) == []
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM sqlmodel_schema_fingerprint"))
+    statements.clear()
+    assert bootstrap_schema(engine) == ["hero"]
+    assert [
+        statement.split("(")[0].strip()
+        for statement in statements
+        if statement.startswith("CREATE")
+    ] == ["CREATE TABLE hero"]
+
+
+def test_bootstrap_schema_new_model(clear_sqlmodel, engine):
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+
+    with engine.connect() as connection:
+        assert bootstrap_schema(connection, SQLModel.metadata) == ["team"]
+        connection.commit()
+    fingerprint = get_schema_fingerprint(SQLModel.metadata, engine.dialect)
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+
+    assert get_schema_fingerprint(SQLModel.metadata, engine.dialect) != fingerprint
+    assert bootstrap_schema(engine) == ["hero"]
+    assert bootstrap_schema(engine) == []
+    with engine.connect() as connection:
+        stored = connection.execute(
+            text("SELECT name, fingerprint FROM sqlmodel_schema_fingerprint")
+        ).all()
+    assert stored == [
+        ("default", get_schema_fingerprint(SQLModel.metadata, engine.dialect))
+    ]
+
+
+def test_bootstrap_schema_existing_tables(clear_sqlmodel, engine, count_queries):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    SQLModel.metadata.create_all(engine)
+    # Only the fingerprint is stored, the tables created before are kept
+    statements = count_queries(engine)
+    assert bootstrap_schema(engine, name="heroes") == []
+    assert [
+        statement.split("(")[0].strip()
+        for statement in statements
+        if statement.startswith("CREATE")
+    ] == ["CREATE TABLE sqlmodel_schema_fingerprint"]
+    statements.clear()
+    assert bootstrap_schema(engine, name="heroes") == []
+    assert len(statements) == 2
+
+
+FINGERPRINT_CODE = """
+from typing import Optional
+
+from sqlalchemy import CheckConstraint, UniqueConstraint
+from sqlalchemy.dialects import sqlite
+from sqlmodel import Field, SQLModel
+from sqlmodel.schema import get_schema_fingerprint
+
+
+class Team(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(index=True, unique=True)
+
+
+class Hero(SQLModel, table=True):
+    __table_args__ = (
+        UniqueConstraint("name", "secret_name"),
+        CheckConstraint("age > 0", name="positive_age"),
+    )
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(index=True)
+    secret_name: str = Field(index=True)
+    age: Optional[int] = Field(default=None, index=True)
+    team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+
+
+print(get_schema_fingerprint(SQLModel.metadata, sqlite.dialect()))
+"""
+
+
+def test_schema_fingerprint_across_processes():
+    # The constraints and indexes are sets, their order changes between processes
+    root = Path(__file__).resolve().parent.parent
+    fingerprints = {
+        subprocess.run(
+            [sys.executable, "-c", FINGERPRINT_CODE],
+            check=True,
+            cwd=root,
+            capture_output=True,
+            encoding="utf-8",
+        ).stdout.strip()
+        for _ in range(4)
+    }
+    assert len(fingerprints) == 1
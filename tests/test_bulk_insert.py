@@ -0,0 +1,140 @@
+import asyncio
+from datetime import datetime
+from typing import Any, List
+
+import pytest
+from pydantic import ValidationError
+from sqlmodel import Session, SQLModel, select
+
+from .conftest import needs_pydanticv2
+
+
+def test_bulk_insert_returning(engine, hero_models, count_queries):
+    _, Hero = hero_models
+    with Session(engine) as session:
+        rusty = Hero(name="Rusty-Man", age=48)
+        heroes = session.bulk_insert(
+            Hero, [{"name": "Deadpond"}, rusty, {"name": "Spider-Boy", "age": "16"}]
+        )
+        assert heroes[1] is rusty
+        statements = count_queries(engine)
+        assert [hero.id for hero in heroes] == [1, 2, 3]
+        assert [hero.age for hero in heroes] == [None, 48, 16]
+        assert all(isinstance(hero.created_at, datetime) for hero in heroes)
+        # Loaded, without refreshing them
+        assert statements == []
+        assert all(hero in session for hero in heroes)
+        assert not session.new
+        assert not session.dirty
+        heroes[0].age = 32
+        session.commit()
+        assert statements == ["UPDATE hero SET age=? WHERE hero.id = ?"]
+    with Session(engine) as session:
+        db_heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+        assert [(hero.name, hero.age) for hero in db_heroes] == [
+            ("Deadpond", 32),
+            ("Rusty-Man", 48),
+            ("Spider-Boy", 16),
+        ]
+
+
+def test_bulk_insert_without_returning(engine, hero_models, count_queries):
+    _, Hero = hero_models
+    statements = count_queries(engine)
+    with Session(engine) as session:
+        heroes = session.bulk_insert(
+            Hero,
+            [{"name": f"Hero {i}"} for i in range(5)],
+            returning=False,
+            chunk_size=2,
+        )
+        assert len(statements) == 3
+        assert "RETURNING" not in statements[0]
+        assert [hero.id for hero in heroes] == [None] * 5
+        assert not any(hero in session for hero in heroes)
+        session.commit()
+    with Session(engine) as session:
+        db_heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+        assert [hero.name for hero in db_heroes] == [f"Hero {i}" for i in range(5)]
+        assert all(isinstance(hero.created_at, datetime) for hero in db_heroes)
+
+
+def test_bulk_insert_one_by_one(engine, hero_models):
+    _, Hero = hero_models
+    # As with dialects without RETURNING for many rows in order
+    engine.dialect.insert_executemany_returning_sort_by_parameter_order = False
+    with Session(engine) as session:
+        heroes = session.bulk_insert(
+            Hero, [{"name": "Deadpond"}, {"name": "Rusty-Man", "age": 48}]
+        )
+        assert [hero.id for hero in heroes] == [1, 2]
+        assert all(isinstance(hero.created_at, datetime) for hero in heroes)
+        assert all(hero in session for hero in heroes)
+
+
+def test_bulk_insert_chunk_size_one(engine, hero_models, count_queries):
+    _, Hero = hero_models
+    statements = count_queries(engine)
+    with Session(engine) as session:
+        heroes = session.bulk_insert(
+            Hero, [{"name": "Deadpond"}, {"name": "Rusty-Man"}], chunk_size=1
+        )
+        assert [hero.id for hero in heroes] == [1, 2]
+        assert all(isinstance(hero.created_at, datetime) for hero in heroes)
+        assert len(statements) == 2
+        assert all("RETURNING" in statement for statement in statements)
+
+
+def test_bulk_insert_invalid_row(engine, hero_models):
+    _, Hero = hero_models
+
+    class HeroCreate(SQLModel):
+        name: str
+
+    with Session(engine) as session:
+        with pytest.raises(TypeError, match="Row 1 should be a dict or a Hero"):
+            session.bulk_insert(Hero, [{"name": "Deadpond"}, HeroCreate(name="X")])
+        assert session.exec(select(Hero)).all() == []
+
+
+@needs_pydanticv2
+def test_bulk_insert_validation_error(engine, hero_models):
+    _, Hero = hero_models
+    with Session(engine) as session:
+        with pytest.raises(ValidationError) as exc_info:
+            session.bulk_insert(Hero, [{"name": "Deadpond"}, {"name": "X", "age": "a"}])
+        assert exc_info.value.errors()[0]["loc"] == (1, "age")
+        assert session.exec(select(Hero)).all() == []
+
+
+def test_bulk_insert_async(hero_models):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    _, Hero = hero_models
+    results: List[Any] = []
+
+    async def main() -> None:
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            heroes = await session.bulk_insert(Hero, [{"name": "Deadpond"}])
+            results.append((heroes[0].id, heroes[0].name))
+            await session.commit()
+        await engine.dispose()
+
+    asyncio.run(main())
+    assert results == [(1, "Deadpond")]
+
+
+def test_bulk_insert_flushes_pending(engine, hero_models):
+    _, Hero = hero_models
+    with Session(engine) as session:
+        pending = Hero(name="Deadpond")
+        session.add(pending)
+        heroes = session.bulk_insert(Hero, [{"name": "Rusty-Man"}])
+        # Inserted by the autoflush before the bulk insert
+        assert pending.id == 1
+        assert heroes[0].id == 2
@@ -0,0 +1,161 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+from sqlmodel import Session, SQLModel, select
+
+
+def add_heroes(engine: Any, hero_model: Any) -> None:
+    with Session(engine) as session:
+        session.add(hero_model(name="Deadpond", secret_name="Dive Wilson"))
+        session.add(hero_model(name="Spider-Boy", secret_name="Pedro Parqueador"))
+        session.add(hero_model(name="Rusty-Man", secret_name="Tommy Sharp", age=48))
+        session.commit()
+
+
+def get_heroes(engine: Any, hero_model: Any) -> List[Any]:
+    with Session(engine) as session:
+        heroes = session.exec(select(hero_model).order_by(hero_model.id)).all()
+        return [(hero.name, hero.secret_name, hero.age) for hero in heroes]
+
+
+def test_bulk_update_dicts(engine, hero_models, count_queries):
+    _, Hero = hero_models
+    add_heroes(engine, Hero)
+    statements = count_queries(engine, parameters=True)
+    with Session(engine) as session:
+        matched = session.bulk_update(
+            Hero,
+            [
+                {"id": 1, "age": 30},
+                {"id": 2, "name": "Spider-Man"},
+                {"id": 3, "age": 49},
+                {"id": 4, "age": 20},
+            ],
+        )
+        session.commit()
+    assert matched == 3
+    # One statement per group of changed columns, no SELECT
+    assert [statement for statement, _ in statements] == [
+        "UPDATE hero SET age=? WHERE hero.id = ?",
+        "UPDATE hero SET name=? WHERE hero.id = ?",
+    ]
+    assert statements[0][1] == [(30, 1), (49, 3), (20, 4)]
+    assert get_heroes(engine, Hero) == [
+        ("Deadpond", "Dive Wilson", 30),
+        ("Spider-Man", "Pedro Parqueador", None),
+        ("Rusty-Man", "Tommy Sharp", 49),
+    ]
+
+
+def test_bulk_update_instances(engine, hero_models, count_queries):
+    _, Hero = hero_models
+    add_heroes(engine, Hero)
+    with Session(engine) as session:
+        heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+    heroes[0].age = 30
+    heroes[2].name = "Rusty-Woman"
+    statements = count_queries(engine, parameters=True)
+    with Session(engine) as session:
+        # Loaded instances update their modified attributes, new ones their fields set
+        matched = session.bulk_update(
+            Hero, [heroes[0], heroes[1], heroes[2], Hero(id=2, age=16)]
+        )
+        session.commit()
+    assert matched == 3
+    assert sorted(statement for statement, _ in statements) == [
+        "UPDATE hero SET age=? WHERE hero.id = ?",
+        "UPDATE hero SET name=? WHERE hero.id = ?",
+    ]
+    assert get_heroes(engine, Hero) == [
+        ("Deadpond", "Dive Wilson", 30),
+        ("Spider-Boy", "Pedro Parqueador", 16),
+        ("Rusty-Woman", "Tommy Sharp", 48),
+    ]
+
+
+def test_bulk_update_session_objects(engine, hero_models, count_queries):
+    _, Hero = hero_models
+    add_heroes(engine, Hero)
+    with Session(engine) as session:
+        deadpond = session.get(Hero, 1)
+        spider_boy = session.get(Hero, 2)
+        spider_boy.age = 16
+        statements = count_queries(engine)
+        session.bulk_update(Hero, [{"id": 1, "age": 30}, spider_boy])
+        assert len(statements) == 1
+        # The objects have the new values, with no pending changes to flush
+        assert deadpond.age == 30
+        assert spider_boy.age == 16
+        assert not session.dirty
+        session.commit()
+        assert len(statements) == 1
+    assert get_heroes(engine, Hero)[:2] == [
+        ("Deadpond", "Dive Wilson", 30),
+        ("Spider-Boy", "Pedro Parqueador", 16),
+    ]
+
+
+def test_bulk_update_chunks_and_unchanged(engine, hero_models, count_queries):
+    _, Hero = hero_models
+    add_heroes(engine, Hero)
+    statements = count_queries(engine)
+    with Session(engine) as session:
+        matched = session.bulk_update(
+            Hero,
+            [{"id": 1, "age": 1}, {"id": 2}, {"id": 3, "age": 3}],
+            chunk_size=1,
+        )
+        session.commit()
+    assert matched == 2
+    assert len(statements) == 2
+
+
+def test_bulk_update_missing_primary_key(engine, hero_models):
+    _, Hero = hero_models
+    add_heroes(engine, Hero)
+    with Session(engine) as session:
+        with pytest.raises(ValueError, match="Missing the primary key to update"):
+            session.bulk_update(Hero, [{"name": "Deadpond", "age": 30}])
+
+
+def test_bulk_update_async(hero_models):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    _, Hero = hero_models
+    results: List[Any] = []
+
+    async def main() -> None:
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            session.add(Hero(name="Deadpond", secret_name="Dive Wilson"))
+            await session.commit()
+            results.append(await session.bulk_update(Hero, [{"id": 1, "age": 30}]))
+            await session.commit()
+            hero = await session.get(Hero, 1)
+            results.append(hero.age)
+        await engine.dispose()
+
+    asyncio.run(main())
+    assert results == [1, 30]
+
+
+def test_bulk_update_flushes_pending(engine, hero_models):
+    _, Hero = hero_models
+    add_heroes(engine, Hero)
+    with Session(engine) as session:
+        session.add(Hero(name="Tarantula", secret_name="Natalia Roman-on"))
+        deadpond = session.get(Hero, 1)
+        assert deadpond is not None
+        deadpond.name = "Deadpool"
+        deadpond.age = 30
+        assert session.bulk_update(Hero, [{"id": 4, "age": 32}, deadpond]) == 2
+        assert not session.new
+        assert not session.dirty
+        session.commit()
+    assert get_heroes(engine, Hero)[0] == ("Deadpool", "Dive Wilson", 30)
+    assert get_heroes(engine, Hero)[3] == ("Tarantula", "Natalia Roman-on", 32)
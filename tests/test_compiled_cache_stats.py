@@ -0,0 +1,92 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+from sqlmodel import Session, SQLModel, select, text
+from sqlmodel.profiling import track_compiled_cache
+
+
+def select_by_age(session: Session, hero_model: Any, age: int) -> List[Any]:
+    return list(session.exec(select(hero_model).where(hero_model.age == age)).all())
+
+
+def select_by_age_literal(session: Session, hero_model: Any, age: int) -> List[Any]:
+    # Builds a new statement shape on each call
+    return list(session.exec(select(hero_model).where(text(f"age = {age}"))).all())
+
+
+def test_track_compiled_cache(engine, hero_models):
+    _, Hero = hero_models
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond", age=1))
+        session.commit()
+        select_by_age(session, Hero, 0)
+
+        with track_compiled_cache(engine) as stats:
+            for age in range(5):
+                select_by_age(session, Hero, age)
+                select_by_age_literal(session, Hero, age)
+        select_by_age(session, Hero, 0)
+
+    call_sites = stats.by_call_site()
+    assert len(call_sites) == 2
+    cached_site, busted_site = sorted(call_sites, key=lambda site: str(site))
+    assert cached_site is not None and busted_site is not None
+    assert cached_site.startswith(f"{__file__}:")
+    assert cached_site.endswith(" in select_by_age")
+    assert busted_site.endswith(" in select_by_age_literal")
+
+    cached = call_sites[cached_site]
+    assert (cached.hits, cached.misses, cached.uncached) == (5, 0, 0)
+    assert cached.hit_ratio == 1.0
+    assert cached.compile_time == 0.0
+
+    busted = call_sites[busted_site]
+    assert (busted.hits, busted.misses, busted.uncached) == (0, 5, 0)
+    assert busted.executions == 5
+    assert busted.compile_time > 0
+    busted_statements = [
+        statement for call_site, statement in stats.entries if call_site == busted_site
+    ]
+    assert len(busted_statements) == 5
+    assert all("age = " in statement for statement in busted_statements)
+
+    report = stats.report().splitlines()
+    assert report[0].startswith(busted_site)
+    assert "5 misses" in report[0]
+    assert "5 statements" in report[0]
+    assert "100% hits" in report[1]
+
+
+def test_track_compiled_cache_any_engine(engine, hero_models):
+    _, Hero = hero_models
+    with track_compiled_cache() as stats:
+        with Session(engine) as session:
+            select_by_age(session, Hero, 1)
+    assert [entry.misses + entry.hits for entry in stats.entries.values()] == [1]
+
+
+def test_track_compiled_cache_async(hero_models):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    _, Hero = hero_models
+    call_sites: Any = {}
+
+    async def main() -> None:
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+        with track_compiled_cache(engine) as stats:
+            async with AsyncSession(engine) as session:
+                for age in range(3):
+                    await session.exec(select(Hero).where(Hero.age == age))
+        call_sites.update(stats.by_call_site())
+        await engine.dispose()
+
+    asyncio.run(main())
+    [(call_site, entry)] = call_sites.items()
+    assert call_site.startswith(f"{__file__}:")
+    assert call_site.endswith(" in main")
+    assert (entry.hits, entry.misses) == (2, 1)
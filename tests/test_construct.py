@@ -0,0 +1,120 @@
+from typing import List, Optional
+
+from sqlalchemy import inspect
+from sqlmodel import Field, Relationship, Session, SQLModel, create_engine, select
+from sqlmodel.compat import get_fields_set
+
+from .conftest import needs_pydanticv1, needs_pydanticv2
+
+
+def test_construct_many_table_models(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        secret_name: str
+        age: Optional[int] = None
+
+    heroes = Hero.construct_many(
+        [
+            {"name": "Deadpond", "secret_name": "Dive Wilson"},
+            {"name": "Rusty-Man", "secret_name": "Tommy Sharp", "age": 48},
+        ]
+    )
+    heroes += Hero.construct_many(
+        [("Spider-Boy", "Pedro Parqueador")], fields=["name", "secret_name"]
+    )
+    heroes += Hero.construct_many([(None, "Tarantula", "Natalia Roman-on", 32)])
+
+    assert [hero.name for hero in heroes] == [
+        "Deadpond",
+        "Rusty-Man",
+        "Spider-Boy",
+        "Tarantula",
+    ]
+    assert heroes[0].age is None
+    assert get_fields_set(heroes[0]) == {"name", "secret_name"}
+    assert get_fields_set(heroes[1]) == {"name", "secret_name", "age"}
+    assert get_fields_set(heroes[2]) == {"name", "secret_name"}
+    assert get_fields_set(heroes[3]) == {"id", "name", "secret_name", "age"}
+    for hero in heroes:
+        assert inspect(hero).transient
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(heroes)
+        session.commit()
+        db_heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+        assert [(hero.id, hero.name, hero.age) for hero in db_heroes] == [
+            (1, "Deadpond", None),
+            (2, "Rusty-Man", 48),
+            (3, "Spider-Boy", None),
+            (4, "Tarantula", 32),
+        ]
+
+
+def test_construct_many_relationships(clear_sqlmodel):
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        heroes: List["Hero"] = Relationship(back_populates="team")
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+        team: Optional[Team] = Relationship(back_populates="heroes")
+
+    team = Team(name="Preventers")
+    heroes = Hero.construct_many([{"name": "Rusty-Man", "team": team}])
+    assert heroes[0].team is team
+    assert team.heroes == heroes
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(heroes)
+        session.commit()
+        hero = session.exec(select(Hero)).one()
+        assert hero.team_id == hero.team.id
+        assert hero.team.name == "Preventers"
+
+
+@needs_pydanticv2
+def test_model_construct_table_model(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+
+    hero = Hero.model_construct(name="Deadpond")
+    assert hero.name == "Deadpond"
+    assert hero.age is None
+    assert get_fields_set(hero) == {"name"}
+    assert inspect(hero).transient
+
+
+@needs_pydanticv1
+def test_construct_table_model(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+
+    hero = Hero.construct(name="Deadpond")
+    assert hero.name == "Deadpond"
+    assert hero.age is None
+    assert get_fields_set(hero) == {"name"}
+    assert inspect(hero).transient
+
+
+def test_construct_many_non_table_models():
+    class Hero(SQLModel):
+        name: str
+        age: Optional[int] = None
+
+    heroes = Hero.construct_many([{"name": "Deadpond"}, ("Rusty-Man", 48)])
+    assert [(hero.name, hero.age) for hero in heroes] == [
+        ("Deadpond", None),
+        ("Rusty-Man", 48),
+    ]
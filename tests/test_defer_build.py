@@ -0,0 +1,79 @@
+from typing import List, Optional
+
+from sqlmodel import Field, Relationship, Session, SQLModel, create_engine, select
+
+from .conftest import needs_pydanticv2
+
+
+@needs_pydanticv2
+def test_defer_build_table(clear_sqlmodel):
+    class Hero(SQLModel, table=True, defer_build=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+
+    assert not Hero.__pydantic_complete__
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond"))
+        session.commit()
+        hero = session.exec(select(Hero)).one()
+        assert (hero.id, hero.name, hero.age) == (1, "Deadpond", None)
+    assert Hero.__pydantic_complete__
+    assert Hero.model_validate({"name": "Rusty-Man", "age": "48"}).age == 48
+
+
+@needs_pydanticv2
+def test_defer_build_config(clear_sqlmodel):
+    class Base(SQLModel):
+        model_config = {"defer_build": True}
+
+    class Hero(Base, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    assert not Hero.__pydantic_complete__
+    assert Hero.model_validate({"name": "Deadpond"}).name == "Deadpond"
+    assert Hero.__pydantic_complete__
+
+
+@needs_pydanticv2
+def test_rebuild_all(clear_sqlmodel):
+    class Base(SQLModel):
+        model_config = {"defer_build": True}
+
+    class Team(Base, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        heroes: List["Hero"] = Relationship(back_populates="team")
+
+    class HeroBase(Base):
+        name: str
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+
+    class Hero(HeroBase, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        team: Optional[Team] = Relationship(back_populates="heroes")
+
+    models = [Base, Team, HeroBase, Hero]
+    assert not any(model.__pydantic_complete__ for model in models)
+    assert set(Base.rebuild_all()) == set(models)
+    assert all(model.__pydantic_complete__ for model in models)
+    assert Hero.__mapper__.configured
+    assert Base.rebuild_all() == []
+    hero = Hero(name="Deadpond", team=Team(name="Preventers"))
+    assert hero.team.name == "Preventers"
+
+
+def test_rebuild_all_without_pending_builds(clear_sqlmodel):
+    class Base(SQLModel):
+        pass
+
+    class Hero(Base, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    assert Base.rebuild_all() == []
+    assert Hero.__mapper__.configured
+    assert Hero(name="Deadpond").name == "Deadpond"
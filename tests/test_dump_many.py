@@ -0,0 +1,64 @@
+import json
+from typing import List, Optional
+
+from sqlmodel import Field, Relationship, Session, SQLModel, create_engine, select
+
+
+def test_dump_many(clear_sqlmodel, count_queries):
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        heroes: List["Hero"] = Relationship(back_populates="team")
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+        team: Optional[Team] = Relationship(back_populates="heroes")
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        team = Team(name="Preventers")
+        heroes = [
+            Hero(name="Deadpond", team=team),
+            Hero(name="Rusty-Man", age=48, team=team),
+        ]
+        session.add_all(heroes)
+        session.commit()
+        statements = count_queries(engine)
+        # Expired by the commit, loaded again to dump them, in a single query
+        payload = Hero.dump_many(heroes)
+        assert len(statements) == 1
+        assert " IN " in statements[0]
+        assert isinstance(payload, bytes)
+        assert json.loads(payload) == [
+            {"id": 1, "name": "Deadpond", "age": None, "team_id": 1},
+            {"id": 2, "name": "Rusty-Man", "age": 48, "team_id": 1},
+        ]
+        loaded = session.exec(select(Hero).order_by(Hero.id)).all()
+        assert Hero.dump_many(loaded, mode="python", exclude={"team_id"}) == [
+            {"id": 1, "name": "Deadpond", "age": None},
+            {"id": 2, "name": "Rusty-Man", "age": 48},
+        ]
+        assert json.loads(
+            Hero.dump_many(iter(loaded), include={"name", "age"}, exclude_none=True)
+        ) == [{"name": "Deadpond"}, {"name": "Rusty-Man", "age": 48}]
+        assert json.loads(Hero.dump_many([])) == []
+
+
+def test_dump_many_non_table(clear_sqlmodel):
+    class Hero(SQLModel):
+        name: str
+        age: Optional[int] = None
+
+    heroes = [Hero(name="Deadpond"), Hero(name="Rusty-Man", age=48)]
+    assert json.loads(Hero.dump_many(heroes)) == [
+        {"name": "Deadpond", "age": None},
+        {"name": "Rusty-Man", "age": 48},
+    ]
+    assert Hero.dump_many(heroes, mode="python", exclude_unset=True) == [
+        {"name": "Deadpond"},
+        {"name": "Rusty-Man", "age": 48},
+    ]
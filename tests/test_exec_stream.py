@@ -0,0 +1,94 @@
+from typing import Optional
+
+from sqlmodel import Field, Session, SQLModel, create_engine, insert, select
+
+
+def create_heroes(total: int):
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    class HeroBase(SQLModel):
+        name: str
+
+    class Hero(HeroBase, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+
+    class HeroRead(HeroBase):
+        id: int
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(Team), [{"name": "Preventers"}])
+        connection.execute(
+            insert(Hero), [{"name": f"Hero {i}", "team_id": 1} for i in range(total)]
+        )
+    return engine, Team, Hero, HeroRead
+
+
+def test_exec_stream(clear_sqlmodel):
+    engine, Team, Hero, HeroRead = create_heroes(25)
+    with Session(engine) as session:
+        names = []
+        sizes = []
+        for heroes in session.exec_stream(
+            select(Hero).order_by(Hero.id), batch_size=10
+        ):
+            sizes.append(len(heroes))
+            assert len(session.identity_map) == len(heroes)
+            for hero in heroes:
+                assert isinstance(hero, Hero)
+                assert hero in session
+                names.append(hero.name)
+        assert sizes == [10, 10, 5]
+        assert names == [f"Hero {i}" for i in range(25)]
+        assert len(session.identity_map) == 0
+
+
+def test_exec_stream_tuples(clear_sqlmodel):
+    engine, Team, Hero, HeroRead = create_heroes(5)
+    with Session(engine) as session:
+        rows = []
+        for batch in session.exec_stream(
+            select(Hero, Team).join(Team).order_by(Hero.id), batch_size=2
+        ):
+            for hero, team in batch:
+                rows.append((hero.name, team.name))
+        assert rows == [(f"Hero {i}", "Preventers") for i in range(5)]
+        assert len(session.identity_map) == 0
+
+
+def test_exec_stream_keeps_existing_and_modified(clear_sqlmodel):
+    engine, Team, Hero, HeroRead = create_heroes(6)
+    with Session(engine) as session:
+        existing = session.get(Hero, 1)
+        for heroes in session.exec_stream(select(Hero), batch_size=2):
+            for hero in heroes:
+                if hero.id == 4:
+                    hero.name = "Deadpond"
+        assert existing in session
+        assert len(session.identity_map) == 2
+        session.commit()
+    with Session(engine) as session:
+        assert session.get(Hero, 4).name == "Deadpond"
+
+
+def test_exec_stream_read_model(clear_sqlmodel):
+    engine, Team, Hero, HeroRead = create_heroes(5)
+    with Session(engine) as session:
+        batches = list(session.exec_stream(select(HeroRead), batch_size=2))
+        assert [len(heroes) for heroes in batches] == [2, 2, 1]
+        assert batches[0][0] == HeroRead(id=1, name="Hero 0")
+        assert len(session.identity_map) == 0
+
+
+def test_exec_stream_close_early(clear_sqlmodel):
+    engine, Team, Hero, HeroRead = create_heroes(5)
+    with Session(engine) as session:
+        batches = session.exec_stream(select(Hero), batch_size=2)
+        heroes = next(batches)
+        batches.close()
+        assert [hero.id for hero in heroes] == [1, 2]
+        assert session.exec(select(Hero).where(Hero.id == 5)).one().name == "Hero 4"
@@ -0,0 +1,170 @@
+import asyncio
+import time
+from typing import Any, List
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.cursor import FullyBufferedCursorFetchStrategy
+from sqlmodel import Session, SQLModel, create_engine, insert, select, update
+from sqlmodel.compat import (
+    HAS_CURSOR_FETCH_INTERNALS,
+    get_compiled_time,
+    prefetch_cursor_rows,
+)
+from sqlmodel.profiling import (
+    ExecTiming,
+    _timing_after_cursor_execute,
+    track_exec_timings,
+)
+
+
+def add_heroes(engine: Any, hero_model: Any) -> None:
+    with Session(engine) as session:
+        session.exec(
+            insert(hero_model),
+            params=[{"name": f"Hero {i}", "age": i} for i in range(10)],
+        )
+        session.commit()
+
+
+def test_track_exec_timings(engine, hero_models):
+    _, Hero = hero_models
+    add_heroes(engine, Hero)
+    with Session(engine) as session:
+        with track_exec_timings(session) as timings:
+            heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+            hero = session.exec(select(Hero).order_by(Hero.id)).first()
+            rows = session.exec(select(Hero.id, Hero.name).where(Hero.age < 2)).all()
+            readonly = session.exec_readonly(select(Hero)).all()
+            result = session.exec(update(Hero).where(Hero.age < 3).values(age=0))
+        assert session._sqlmodel_exec_timings is None
+        session.exec(select(Hero)).all()
+
+    assert [hero.name for hero in heroes] == [f"Hero {i}" for i in range(10)]
+    assert hero is heroes[0]
+    assert rows == [(1, "Hero 0"), (2, "Hero 1")]
+    assert len(readonly) == 10
+    assert result.rowcount == 3
+
+    assert len(timings.records) == 5
+    select_all, select_first, select_tuples, select_readonly, update_ = timings.records
+    assert [record.rows for record in timings.records] == [10, 10, 2, 10, 3]
+    assert select_all.fingerprint == select_first.fingerprint
+    assert select_all.fingerprint != select_tuples.fingerprint
+    assert select_all.sql is not None
+    assert select_all.sql.startswith(
+        "SELECT hero.id, hero.name, hero.secret_name, hero.age"
+    )
+    assert update_.sql is not None and update_.sql.startswith("UPDATE hero")
+    assert select_all.compile > 0
+    assert select_first.compile == 0
+    for record in timings.records:
+        assert record.call_site is not None
+        assert record.call_site.startswith(f"{__file__}:")
+        assert record.call_site.endswith(" in test_track_exec_timings")
+        assert record.execute > 0
+        assert record.total >= (
+            record.compile + record.execute + record.fetch + record.hydrate
+        )
+    for record in (select_all, select_tuples, select_readonly):
+        assert record.fetch > 0
+        assert record.hydrate > 0
+    assert update_.fetch == update_.hydrate == 0
+
+    totals = timings.totals()
+    assert totals["execute"] == sum(record.execute for record in timings.records)
+    report = timings.report().splitlines()
+    assert len(report) == 4
+    assert any(
+        line.startswith(f"{select_all.fingerprint}: 2 calls, 20 rows")
+        for line in report
+    )
+
+
+def test_track_exec_timings_on_record(engine, hero_models):
+    _, Hero = hero_models
+    add_heroes(engine, Hero)
+    records: List[ExecTiming] = []
+    with Session(engine) as session:
+        with track_exec_timings(session, on_record=records.append) as timings:
+            # Streamed results are not measured
+            batches = list(session.exec_stream(select(Hero), batch_size=4))
+            assert session.exec(select(Hero).where(Hero.id == 1)).one().id == 1
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert records == timings.records
+    assert [record.rows for record in records] == [1]
+
+
+def test_track_exec_timings_session_engine(engine, hero_models):
+    _, Hero = hero_models
+    other_engine = create_engine("sqlite://")
+    add_heroes(engine, Hero)
+    with Session(engine) as session:
+        with track_exec_timings(session):
+            # Only the engine of the session has the listeners
+            assert event.contains(
+                engine, "after_cursor_execute", _timing_after_cursor_execute
+            )
+            assert not event.contains(
+                other_engine, "after_cursor_execute", _timing_after_cursor_execute
+            )
+            assert not event.contains(
+                Engine, "after_cursor_execute", _timing_after_cursor_execute
+            )
+    assert not event.contains(
+        engine, "after_cursor_execute", _timing_after_cursor_execute
+    )
+
+
+def test_sqlalchemy_timing_internals(engine, hero_models):
+    # The private SQLAlchemy APIs used to measure the compile and fetch times, if
+    # this fails, update sqlmodel.compat for the new SQLAlchemy version
+    _, Hero = hero_models
+    add_heroes(engine, Hero)
+    assert HAS_CURSOR_FETCH_INTERNALS
+    contexts: List[Any] = []
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        compiled_time = get_compiled_time(context.compiled)
+        assert isinstance(compiled_time, float)
+        assert compiled_time <= time.perf_counter()
+        assert prefetch_cursor_rows(context, cursor)
+        contexts.append(context)
+
+    with Session(engine) as session:
+        heroes = session.exec(select(Hero)).all()
+    assert len(heroes) == 10
+    [context] = contexts
+    assert isinstance(context.cursor_fetch_strategy, FullyBufferedCursorFetchStrategy)
+
+
+def test_track_exec_timings_async(hero_models):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    _, Hero = hero_models
+    records: List[ExecTiming] = []
+
+    async def main() -> None:
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            session.add(Hero(name="Deadpond"))
+            await session.commit()
+            with track_exec_timings(session) as timings:
+                heroes = (await session.exec(select(Hero))).all()
+                assert [hero.name for hero in heroes] == ["Deadpond"]
+            records.extend(timings.records)
+        await engine.dispose()
+
+    asyncio.run(main())
+    [record] = records
+    assert record.rows == 1
+    assert record.call_site is not None
+    assert record.call_site.startswith(f"{__file__}:")
+    assert record.call_site.endswith(" in main")
+    assert record.execute > 0
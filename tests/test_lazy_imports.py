@@ -0,0 +1,57 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import sqlmodel
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def run_python(code: str) -> None:
+    # Run in a fresh interpreter, this test session already imported everything
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=ROOT)
+
+
+def test_import_does_not_load_dependencies():
+    run_python(
+        "import sys\n"
+        "import sqlmodel\n"
+        "loaded = {name.split('.')[0] for name in sys.modules}\n"
+        "assert 'sqlalchemy' not in loaded, 'sqlalchemy'\n"
+        "assert 'pydantic' not in loaded, 'pydantic'\n"
+        "assert 'sqlmodel.main' not in sys.modules\n"
+    )
+
+
+def test_first_use_loads_only_needed_modules():
+    run_python(
+        "import sys\n"
+        "from sqlmodel import SQLModel, create_engine\n"
+        "assert 'sqlalchemy.dialects.postgresql' not in sys.modules\n"
+        "assert 'pydantic.v1' not in sys.modules\n"
+    )
+
+
+def test_lazy_attributes():
+    from sqlmodel import main
+    from sqlmodel.sql import expression
+
+    assert sqlmodel.SQLModel is main.SQLModel
+    assert sqlmodel.select is expression.select
+    assert sqlmodel.main is main
+    assert "select" in dir(sqlmodel)
+    assert set(sqlmodel.__all__) <= set(dir(sqlmodel))
+
+
+def test_star_import():
+    namespace: dict = {}
+    exec("from sqlmodel import *", namespace)
+    assert namespace["SQLModel"] is sqlmodel.SQLModel
+    assert namespace["Column"] is sqlmodel.Column
+    assert set(sqlmodel.__all__) <= set(namespace)
+
+
+def test_missing_attribute():
+    with pytest.raises(AttributeError, match="not_a_name"):
+        sqlmodel.not_a_name  # type: ignore[attr-defined]  # noqa: B018
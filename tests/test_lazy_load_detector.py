@@ -0,0 +1,92 @@
+import asyncio
+from typing import Any
+
+import pytest
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, SQLModel, select
+from sqlmodel.profiling import NPlusOneError, NPlusOneWarning, detect_lazy_loads
+
+
+def add_heroes(engine: Any, team_model: Any, hero_model: Any) -> None:
+    with Session(engine) as session:
+        for i in range(3):
+            team = team_model(name=f"Team {i}")
+            session.add(hero_model(name=f"Hero {i}", team=team))
+        session.commit()
+
+
+def test_detect_lazy_loads_count(engine, hero_models):
+    Team, Hero = hero_models
+    add_heroes(engine, Team, Hero)
+    with Session(engine) as session:
+        with detect_lazy_loads(session, policy="count") as stats:
+            for hero in session.exec(select(Hero)).all():
+                assert hero.team is not None
+            for team in session.exec(select(Team)).all():
+                assert len(team.heroes) == 1
+    assert stats.loads == {"Hero.team": 3, "Team.heroes": 3}
+    assert stats.call_sites["Hero.team"] is not None
+    assert stats.call_sites["Hero.team"].startswith(f"{__file__}:")
+    assert stats.report().splitlines()[0].startswith("Hero.team: 3 lazy loads")
+
+
+def test_detect_lazy_loads_warn(engine, hero_models):
+    Team, Hero = hero_models
+    add_heroes(engine, Team, Hero)
+    with Session(engine) as session:
+        with detect_lazy_loads(session, threshold=2) as stats:
+            with pytest.warns(NPlusOneWarning, match="Hero.team was lazy loaded 3"):
+                for hero in session.exec(select(Hero)).all():
+                    assert hero.team is not None
+    assert stats.loads == {"Hero.team": 3}
+
+
+def test_detect_lazy_loads_raise(engine, hero_models):
+    Team, Hero = hero_models
+    add_heroes(engine, Team, Hero)
+    with Session(engine) as session:
+        heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+        with detect_lazy_loads(session, policy="raise"):
+            assert heroes[0].team is not None
+            with pytest.raises(NPlusOneError, match="selectinload"):
+                assert heroes[1].team is not None
+        # Not tracked outside of the block
+        assert heroes[2].team is not None
+
+
+def test_detect_lazy_loads_eager_loading(engine, hero_models):
+    Team, Hero = hero_models
+    add_heroes(engine, Team, Hero)
+    # In any session
+    with detect_lazy_loads(policy="raise") as stats:
+        with Session(engine) as session:
+            statement = select(Hero).options(selectinload(Hero.team))
+            for hero in session.exec(statement).all():
+                assert hero.team is not None
+    assert stats.loads == {}
+
+
+def test_detect_lazy_loads_async(hero_models):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    Team, Hero = hero_models
+    loads: Any = {}
+
+    async def main() -> None:
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            for i in range(2):
+                session.add(Hero(name=f"Hero {i}", team=Team(name=f"Team {i}")))
+            await session.commit()
+            with detect_lazy_loads(session, policy="count") as stats:
+                for hero in (await session.exec(select(Hero))).all():
+                    await session.run_sync(lambda _, hero=hero: hero.team)
+            loads.update(stats.loads)
+        await engine.dispose()
+
+    asyncio.run(main())
+    assert loads == {"Hero.team": 2}
@@ -0,0 +1,129 @@
+import copy
+import pickle
+from typing import Any, Optional
+
+import pytest
+from sqlalchemy import inspect
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+from sqlmodel.compat import EMPTY_FIELDS_SET, get_fields_set
+
+from .conftest import needs_pydanticv1, needs_pydanticv2
+
+
+def test_load_instances(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond"))
+        session.add(Hero(name="Rusty-Man", age=48))
+        session.commit()
+    with Session(engine) as session:
+        heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+        assert [(hero.id, hero.name, hero.age) for hero in heroes] == [
+            (1, "Deadpond", None),
+            (2, "Rusty-Man", 48),
+        ]
+        for hero in heroes:
+            assert inspect(hero).persistent
+            assert get_fields_set(hero) == set()
+        # Loaded with the SQLModel factory set in the private SQLAlchemy manager
+        manager = inspect(Hero).class_manager
+        assert "new_instance" in vars(manager)
+        assert manager.new_instance.__module__ == "sqlmodel.main"
+        heroes[0].age = 32
+        assert get_fields_set(heroes[0]) == {"age"}
+        assert get_fields_set(heroes[1]) == set()
+        session.commit()
+        session.refresh(heroes[0])
+        assert heroes[0].age == 32
+
+
+def test_load_instances_custom_new(clear_sqlmodel):
+    created = []
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+        def __new__(cls, *args: Any, **kwargs: Any) -> Any:
+            new_object = super().__new__(cls, *args, **kwargs)
+            created.append(new_object)
+            return new_object
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond"))
+        session.commit()
+    created.clear()
+    with Session(engine) as session:
+        hero = session.exec(select(Hero)).one()
+        assert created == [hero]
+
+
+def test_shared_empty_fields_set():
+    assert EMPTY_FIELDS_SET == set()
+    with pytest.raises(TypeError):
+        EMPTY_FIELDS_SET.add("name")
+    with pytest.raises(TypeError):
+        EMPTY_FIELDS_SET.update({"name"})
+    for new_set in [
+        copy.copy(EMPTY_FIELDS_SET),
+        copy.deepcopy(EMPTY_FIELDS_SET),
+        pickle.loads(pickle.dumps(EMPTY_FIELDS_SET)),
+        EMPTY_FIELDS_SET.copy(),
+    ]:
+        new_set.add("name")
+        assert new_set == {"name"}
+    assert EMPTY_FIELDS_SET == set()
+
+
+def create_heroes(engine: Any, hero_model: Any) -> None:
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(hero_model(name="Deadpond"))
+        session.add(hero_model(name="Rusty-Man", age=48))
+        session.commit()
+
+
+@needs_pydanticv2
+def test_loaded_instances_exclude_unset_pydantic_v2(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+
+    engine = create_engine("sqlite://")
+    create_heroes(engine, Hero)
+    with Session(engine) as session:
+        hero_1, hero_2 = session.exec(select(Hero).order_by(Hero.id)).all()
+        assert hero_1.model_dump(exclude_unset=True) == {}
+        assert hero_1.model_dump() == {"id": 1, "name": "Deadpond", "age": None}
+        hero_1.age = 32
+        assert hero_1.model_dump(exclude_unset=True) == {"age": 32}
+        assert hero_2.model_dump(exclude_unset=True) == {}
+        assert get_fields_set(hero_2) == set()
+
+
+@needs_pydanticv1
+def test_loaded_instances_exclude_unset_pydantic_v1(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+
+    engine = create_engine("sqlite://")
+    create_heroes(engine, Hero)
+    with Session(engine) as session:
+        hero_1, hero_2 = session.exec(select(Hero).order_by(Hero.id)).all()
+        assert hero_1.dict(exclude_unset=True) == {}
+        assert hero_1.dict() == {"id": 1, "name": "Deadpond", "age": None}
+        hero_1.age = 32
+        assert hero_1.dict(exclude_unset=True) == {"age": 32}
+        assert hero_2.dict(exclude_unset=True) == {}
+        assert get_fields_set(hero_2) == set()
@@ -0,0 +1,97 @@
+from typing import Optional
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import inspect
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+from sqlmodel.compat import get_fields_set
+
+from .conftest import needs_pydanticv1, needs_pydanticv2
+
+
+@needs_pydanticv2
+def test_model_validate_table_validates_once(clear_sqlmodel):
+    from pydantic import field_validator
+
+    calls = []
+
+    class HeroBase(SQLModel):
+        name: str
+        age: Optional[int] = None
+
+        @field_validator("name")
+        def count_calls(cls, v):
+            calls.append(v)
+            return v
+
+    class Hero(HeroBase, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+
+    class HeroCreate(HeroBase):
+        pass
+
+    hero = Hero.model_validate({"name": "Deadpond"})
+    assert calls == ["Deadpond"]
+    assert get_fields_set(hero) == {"name"}
+    assert inspect(hero).transient
+
+    hero_create = HeroCreate(name="Rusty-Man", age=48)
+    calls.clear()
+    hero_2 = Hero.model_validate(hero_create)
+    assert calls == ["Rusty-Man"]
+    assert hero_2.age == 48
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([hero, hero_2])
+        session.commit()
+        heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+        assert [(h.id, h.name, h.age) for h in heroes] == [
+            (1, "Deadpond", None),
+            (2, "Rusty-Man", 48),
+        ]
+        hero_copy = Hero.model_validate(heroes[0])
+        assert hero_copy is not heroes[0]
+        assert hero_copy.id == 1
+        assert inspect(hero_copy).transient
+
+    with pytest.raises(ValidationError):
+        Hero.model_validate({"name": None})
+
+
+@needs_pydanticv1
+def test_validate_table_validates_once(clear_sqlmodel):
+    from pydantic import validator
+
+    calls = []
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+
+        @validator("name")
+        def count_calls(cls, v):
+            calls.append(v)
+            return v
+
+    hero = Hero.validate({"name": "Deadpond"})
+    assert calls == ["Deadpond"]
+    assert get_fields_set(hero) == {"name"}
+    assert inspect(hero).transient
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(hero)
+        session.commit()
+        db_hero = session.exec(select(Hero)).one()
+        calls.clear()
+        hero_copy = Hero.from_orm(db_hero, update={"age": 30})
+        assert calls == ["Deadpond"]
+        assert (hero_copy.id, hero_copy.age) == (1, 30)
+        assert inspect(hero_copy).transient
+
+    with pytest.raises(ValidationError):
+        Hero.validate({"name": None})
@@ -0,0 +1,190 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, List, Optional
+
+import pytest
+from sqlmodel import Field, Session, SQLModel, select
+from sqlmodel.sql.pagination import Page
+
+
+def add_heroes(engine: Any, hero_model: Any) -> None:
+    start = datetime(2020, 1, 1)
+    with Session(engine) as session:
+        for i in range(10):
+            session.add(
+                hero_model(
+                    name=f"Hero {i % 3}",
+                    age=i % 4,
+                    created_at=start + timedelta(hours=i % 5),
+                )
+            )
+        session.commit()
+
+
+def get_all_pages(session: Session, statement: Any, **kwargs: Any) -> List[Any]:
+    pages = []
+    cursor = None
+    while True:
+        page = session.exec(statement.paginate(after=cursor, **kwargs))
+        assert isinstance(page, Page)
+        pages.append(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            return pages
+
+
+def test_paginate_primary_key(engine, hero_models):
+    _, Hero = hero_models
+    add_heroes(engine, Hero)
+    with Session(engine) as session:
+        pages = get_all_pages(session, select(Hero), limit=4)
+    assert [[hero.id for hero in page] for page in pages] == [
+        [1, 2, 3, 4],
+        [5, 6, 7, 8],
+        [9, 10],
+    ]
+
+
+def test_paginate_order_by_mixed_directions(engine, hero_models):
+    _, Hero = hero_models
+    add_heroes(engine, Hero)
+    with Session(engine) as session:
+        order_by = [Hero.age.desc(), Hero.name, Hero.id]
+        expected = session.exec(select(Hero).order_by(*order_by)).all()
+        pages = get_all_pages(
+            session, select(Hero), limit=3, order_by=[Hero.age.desc(), Hero.name]
+        )
+    assert [len(page) for page in pages] == [3, 3, 3, 1]
+    assert [hero for page in pages for hero in page] == expected
+
+
+def test_paginate_statement_order_and_columns(engine, hero_models):
+    _, Hero = hero_models
+    add_heroes(engine, Hero)
+    with Session(engine) as session:
+        statement = select(Hero.name, Hero.created_at).order_by(Hero.created_at)
+        expected = session.exec(statement.order_by(Hero.id)).all()
+        pages = get_all_pages(session, statement.where(Hero.age < 3), limit=2)
+    items = [row for page in pages for row in page]
+    assert items == [row for row in expected if row in items]
+    assert len(items) == 8
+    # The cursor columns are not in the rows
+    assert all(len(row) == 2 for row in items)
+    assert items[0].name == "Hero 0"
+
+
+def test_paginate_uses_keyset_not_offset(engine, hero_models, count_queries):
+    _, Hero = hero_models
+    add_heroes(engine, Hero)
+    statements = count_queries(engine, parameters=True)
+    with Session(engine) as session:
+        first = session.exec(select(Hero).paginate(limit=4, order_by=Hero.name))
+        session.exec(
+            select(Hero).paginate(after=first.next_cursor, limit=4, order_by=Hero.name)
+        )
+    statement, parameters = statements[-1]
+    assert (
+        "WHERE hero.name >= ? AND (hero.name > ? OR hero.name = ? AND hero.id > ?)"
+        in statement
+    )
+    assert "ORDER BY hero.name, hero.id" in statement
+    # LIMIT 5 to know if there's a next page, OFFSET 0 is added by SQLite
+    assert parameters == ("Hero 0", "Hero 0", "Hero 0", 10, 5, 0)
+
+
+def test_paginate_last_page(engine, hero_models):
+    _, Hero = hero_models
+    add_heroes(engine, Hero)
+    with Session(engine) as session:
+        page = session.exec(select(Hero).paginate(limit=10))
+        assert len(page) == 10
+        assert page.next_cursor is None
+        page = session.exec(select(Hero).where(Hero.age > 10).paginate(limit=10))
+        assert page.items == []
+        assert page.next_cursor is None
+
+
+def test_paginate_errors(engine, hero_models):
+    _, Hero = hero_models
+    with pytest.raises(ValueError, match="should be at least 1"):
+        select(Hero).paginate(limit=0)
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        select(Hero).paginate(after="not a cursor", limit=10)
+    add_heroes(engine, Hero)
+    with Session(engine) as session:
+        cursor = session.exec(select(Hero).paginate(limit=2)).next_cursor
+    # A cursor from a different ordering
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        select(Hero).paginate(after=cursor, limit=2, order_by=Hero.name)
+
+
+def test_paginate_async(hero_models):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    _, Hero = hero_models
+    pages: List[Any] = []
+
+    async def main() -> None:
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            for i in range(3):
+                session.add(Hero(name=f"Hero {i}", age=i, created_at=datetime.now()))
+            await session.commit()
+            cursor = None
+            while True:
+                page = await session.exec(select(Hero).paginate(after=cursor, limit=2))
+                pages.append([hero.name for hero in page])
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
+        await engine.dispose()
+
+    asyncio.run(main())
+    assert pages == [["Hero 0", "Hero 1"], ["Hero 2"]]
+
+
+def test_paginate_read_model(clear_sqlmodel, engine):
+    class HeroBase(SQLModel):
+        name: str
+
+    class Hero(HeroBase, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        age: int
+        created_at: datetime
+
+    class HeroRead(HeroBase):
+        id: int
+
+    SQLModel.metadata.create_all(engine)
+    add_heroes(engine, Hero)
+    with Session(engine) as session:
+        # Sorted by the primary key of Hero
+        pages = get_all_pages(session, select(HeroRead), limit=4)
+        assert [len(page) for page in pages] == [4, 4, 2]
+        assert pages[0][0] == HeroRead(id=1, name="Hero 0")
+        assert all(isinstance(hero, HeroRead) for page in pages for hero in page)
+        pages = get_all_pages(session, select(HeroRead), limit=3, order_by=Hero.name)
+        heroes = [hero for page in pages for hero in page]
+        assert [(hero.name, hero.id) for hero in heroes] == sorted(
+            (hero.name, hero.id) for hero in heroes
+        )
+        assert len(heroes) == 10
+        assert not session.identity_map
+
+
+def test_paginate_readonly_errors(engine, hero_models):
+    _, Hero = hero_models
+    statement = select(Hero).execution_options(sqlmodel_readonly=True)
+    with pytest.raises(ValueError, match="Can't paginate a read-only statement"):
+        statement.paginate(limit=2)
+    add_heroes(engine, Hero)
+    with Session(engine) as session:
+        with pytest.raises(ValueError, match="Can't paginate a read-only statement"):
+            session.exec(
+                select(Hero).paginate(limit=2),
+                execution_options={"sqlmodel_readonly": True},
+            )
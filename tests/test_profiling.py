@@ -0,0 +1,83 @@
+from typing import List, Optional
+
+from sqlalchemy.orm import configure_mappers
+from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel.profiling import profile_class_creation
+
+
+def test_profile_class_creation(clear_sqlmodel):
+    with profile_class_creation() as profile:
+
+        class HeroTeamLink(SQLModel, table=True):
+            team_id: Optional[int] = Field(
+                default=None, foreign_key="team.id", primary_key=True
+            )
+            hero_id: Optional[int] = Field(
+                default=None, foreign_key="hero.id", primary_key=True
+            )
+
+        class Team(SQLModel, table=True):
+            id: Optional[int] = Field(default=None, primary_key=True)
+            name: str
+            heroes: List["Hero"] = Relationship(
+                back_populates="teams", link_model=HeroTeamLink
+            )
+
+        class HeroBase(SQLModel):
+            name: str
+
+        class Hero(HeroBase, table=True):
+            id: Optional[int] = Field(default=None, primary_key=True)
+            teams: List[Team] = Relationship(
+                back_populates="heroes", link_model=HeroTeamLink
+            )
+
+        configure_mappers()
+
+    prefix = f"{__name__}.test_profile_class_creation.<locals>."
+    assert list(profile.timings) == [
+        f"{prefix}HeroTeamLink",
+        f"{prefix}Team",
+        f"{prefix}HeroBase",
+        f"{prefix}Hero",
+    ]
+    assert set(profile.timings[f"{prefix}Hero"]) == {
+        "config",
+        "pydantic",
+        "columns",
+        "relationships",
+        "link_models",
+        "declarative",
+        "configure",
+    }
+    assert set(profile.timings[f"{prefix}HeroBase"]) == {"config", "pydantic"}
+    assert "link_models" not in profile.timings[f"{prefix}HeroTeamLink"]
+    assert all(
+        seconds >= 0
+        for phases in profile.timings.values()
+        for seconds in phases.values()
+    )
+    totals = profile.totals()
+    assert totals["declarative"] == sum(
+        phases.get("declarative", 0) for phases in profile.timings.values()
+    )
+    slowest = profile.slowest(2)
+    assert len(slowest) == 2
+    assert slowest[0][1] >= slowest[1][1]
+    report = profile.report()
+    assert report.startswith("4 models")
+    assert f"{prefix}Hero " in report
+
+
+def test_profile_only_inside_block(clear_sqlmodel):
+    with profile_class_creation() as profile:
+        pass
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+
+    configure_mappers()
+    assert profile.timings == {}
+    assert profile.report() == "0 models\n" + "\n".join(
+        f"  {phase:<14}{0:10.1f} ms" for phase in profile.totals()
+    )
@@ -0,0 +1,143 @@
+from typing import List, Optional
+
+import pytest
+from sqlalchemy import Column, String, inspect
+from sqlmodel import Field, Relationship, Session, SQLModel, create_engine, select
+from sqlmodel.compat import get_fields_set
+
+
+def test_exec_readonly(clear_sqlmodel):
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        heroes: List["Hero"] = Relationship(back_populates="team")
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        secret_name: str = Field(sa_column=Column("secret", String))
+        age: Optional[int] = None
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+        team: Optional[Team] = Relationship(back_populates="heroes")
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        team = Team(name="Preventers")
+        session.add(Hero(name="Deadpond", secret_name="Dive Wilson", team=team))
+        session.add(Hero(name="Rusty-Man", secret_name="Tommy Sharp", age=48))
+        session.commit()
+    with Session(engine) as session:
+        heroes = session.exec_readonly(select(Hero).order_by(Hero.id)).all()
+        assert len(session.identity_map) == 0
+        assert [
+            (hero.id, hero.name, hero.secret_name, hero.age, hero.team_id)
+            for hero in heroes
+        ] == [
+            (1, "Deadpond", "Dive Wilson", None, 1),
+            (2, "Rusty-Man", "Tommy Sharp", 48, None),
+        ]
+        for hero in heroes:
+            assert isinstance(hero, Hero)
+            assert inspect(hero, raiseerr=False) is None
+            assert get_fields_set(hero) == {
+                "id",
+                "name",
+                "secret_name",
+                "age",
+                "team_id",
+            }
+        with pytest.raises(TypeError, match="read-only results are immutable"):
+            heroes[0].name = "Deadpool"
+        assert heroes[0].name == "Deadpond"
+        # The ORM path still works, with its own instances
+        hero = session.exec(select(Hero).where(Hero.id == 1)).one()
+        assert hero is not heroes[0]
+        assert hero.team.name == "Preventers"
+
+
+def test_exec_readonly_read_model(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        secret_name: str
+        age: Optional[int] = None
+
+    class HeroRead(SQLModel):
+        id: int
+        name: str
+        age: Optional[int] = None
+        nickname: str = "nobody"
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond", secret_name="Dive Wilson"))
+        session.add(Hero(name="Rusty-Man", secret_name="Tommy Sharp", age=48))
+        session.commit()
+    with Session(engine) as session:
+        heroes = session.exec_readonly(
+            select(Hero).order_by(Hero.id), model=HeroRead
+        ).all()
+        assert heroes == [
+            HeroRead(id=1, name="Deadpond", age=None, nickname="nobody"),
+            HeroRead(id=2, name="Rusty-Man", age=48, nickname="nobody"),
+        ]
+        assert get_fields_set(heroes[0]) == {"id", "name", "age"}
+        hero = session.exec_readonly(
+            select(Hero.name, Hero.id).where(Hero.age == 48), model=HeroRead
+        ).one()
+        assert hero == HeroRead(id=2, name="Rusty-Man")
+        assert get_fields_set(hero) == {"id", "name"}
+
+
+def test_exec_readonly_execution_option(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    class HeroRead(SQLModel):
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond"))
+        session.commit()
+    with Session(engine) as session:
+        hero = session.exec(
+            select(Hero), execution_options={"sqlmodel_readonly": True}
+        ).one()
+        assert isinstance(hero, Hero)
+        assert (hero.id, hero.name) == (1, "Deadpond")
+        assert inspect(hero, raiseerr=False) is None
+        hero_read = session.exec(
+            select(Hero).execution_options(sqlmodel_readonly=HeroRead)
+        ).one()
+        assert hero_read == HeroRead(name="Deadpond")
+        assert len(session.identity_map) == 0
+
+
+def test_exec_readonly_autoflush(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond"))
+        heroes = session.exec_readonly(select(Hero)).all()
+        assert [hero.name for hero in heroes] == ["Deadpond"]
+
+
+def test_exec_readonly_needs_model(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        with pytest.raises(ValueError):
+            session.exec_readonly(select(Hero.id, Hero.name))
@@ -0,0 +1,88 @@
+from typing import Any, List, Optional
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import RelationshipProperty, relationship
+from sqlmodel import Field, Relationship, Session, SQLModel, select
+
+
+def create_models(engine: Any) -> Any:
+    class HeroTeamLink(SQLModel, table=True):
+        team_id: Optional[int] = Field(
+            default=None, foreign_key="team.id", primary_key=True
+        )
+        hero_id: Optional[int] = Field(
+            default=None, foreign_key="hero.id", primary_key=True
+        )
+
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        heroes: List["Hero"] = Relationship(
+            back_populates="teams", link_model=HeroTeamLink, load="selectin"
+        )
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        teams: List[Team] = Relationship(
+            back_populates="heroes", link_model=HeroTeamLink, load="raise"
+        )
+
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        for i in range(3):
+            team = Team(name=f"Team {i}")
+            team.heroes = [Hero(name=f"Hero {i}.{j}") for j in range(2)]
+            session.add(team)
+        session.commit()
+    return Team, Hero
+
+
+def test_relationship_load(clear_sqlmodel, engine, count_queries):
+    Team, Hero = create_models(engine)
+    assert inspect(Team).relationships["heroes"].lazy == "selectin"
+    assert inspect(Hero).relationships["teams"].lazy == "raise"
+    statements = count_queries(engine)
+    with Session(engine) as session:
+        teams = session.exec(select(Team)).all()
+        assert [len(team.heroes) for team in teams] == [2, 2, 2]
+        assert len(statements) == 2
+        with pytest.raises(InvalidRequestError):
+            teams[0].heroes[0].teams  # noqa: B018
+
+
+def test_select_load_override(clear_sqlmodel, engine, count_queries):
+    Team, Hero = create_models(engine)
+    statements = count_queries(engine)
+    with Session(engine) as session:
+        heroes = session.exec(select(Hero).load("selectin", Hero.teams)).all()
+        assert all(len(hero.teams) == 1 for hero in heroes)
+        assert len(statements) == 2
+    statements.clear()
+    with Session(engine) as session:
+        teams = session.exec(select(Team).load("raise", "*")).all()
+        assert len(statements) == 1
+        with pytest.raises(InvalidRequestError):
+            teams[0].heroes  # noqa: B018
+
+
+def test_select_load_several_attributes(clear_sqlmodel, engine):
+    Team, Hero = create_models(engine)
+    statement = select(Team).load("joined", Team.heroes).where(Team.name == "Team 0")
+    with Session(engine) as session:
+        team = session.exec(statement).unique().one()
+        assert len(team.__dict__["heroes"]) == 2
+    with pytest.raises(ValueError, match="Invalid relationship load 'eager'"):
+        select(Team).load("eager", Team.heroes)  # type: ignore[arg-type]
+
+
+def test_relationship_load_invalid(clear_sqlmodel):
+    with pytest.raises(RuntimeError, match="Invalid relationship load"):
+        Relationship(load="eager")  # type: ignore[arg-type]
+    with pytest.raises(RuntimeError, match="lazy in sa_relationship_kwargs"):
+        Relationship(load="joined", sa_relationship_kwargs={"lazy": "selectin"})
+    sa_relationship: RelationshipProperty[Any] = relationship("Team")
+    with pytest.raises(RuntimeError, match="sa_relationship"):
+        Relationship(sa_relationship=sa_relationship, load="joined")  # type: ignore[call-overload]
@@ -0,0 +1,152 @@
+from typing import List, Optional
+
+import pytest
+from sqlalchemy import Column, String
+from sqlmodel import Field, Relationship, Session, SQLModel, create_engine, select
+from sqlmodel.compat import get_fields_set
+
+
+def test_select_read_model(clear_sqlmodel):
+    class HeroBase(SQLModel):
+        name: str
+        age: Optional[int] = None
+
+    class Hero(HeroBase, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        secret_name: str
+
+    class HeroRead(HeroBase):
+        id: int
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond", secret_name="Dive Wilson"))
+        session.add(Hero(name="Rusty-Man", secret_name="Tommy Sharp", age=48))
+        session.commit()
+
+    statement = select(HeroRead).order_by(Hero.id)
+    compiled = str(statement)
+    assert "hero.name, hero.age, hero.id" in compiled
+    assert "secret_name" not in compiled
+    with Session(engine) as session:
+        heroes = session.exec(statement).all()
+        assert heroes == [
+            HeroRead(id=1, name="Deadpond", age=None),
+            HeroRead(id=2, name="Rusty-Man", age=48),
+        ]
+        assert get_fields_set(heroes[0]) == {"id", "name", "age"}
+        assert len(session.identity_map) == 0
+        hero = session.exec(select(HeroRead).where(Hero.age == 48)).one()
+        assert hero == HeroRead(id=2, name="Rusty-Man", age=48)
+        # Table models are still loaded by the ORM
+        hero_db = session.exec(select(Hero).where(Hero.id == 1)).one()
+        assert hero_db.secret_name == "Dive Wilson"
+
+
+def test_select_read_model_column_name(clear_sqlmodel):
+    class HeroBase(SQLModel):
+        name: str
+        secret_name: str = Field(sa_column=Column("secret", String))
+
+    class Hero(HeroBase, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+
+    class HeroRead(HeroBase):
+        id: int
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond", secret_name="Dive Wilson"))
+        session.commit()
+    with Session(engine) as session:
+        hero = session.exec(select(HeroRead)).one()
+        assert hero == HeroRead(id=1, name="Deadpond", secret_name="Dive Wilson")
+
+
+def test_select_read_model_default_fields(clear_sqlmodel):
+    class TeamBase(SQLModel):
+        name: str
+
+    class Team(TeamBase, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        heroes: List["Hero"] = Relationship(back_populates="team")
+
+    class HeroBase(SQLModel):
+        name: str
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+
+    class Hero(HeroBase, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        team: Optional[Team] = Relationship(back_populates="heroes")
+
+    class HeroReadWithTeam(HeroBase):
+        id: int
+        team: Optional[TeamBase] = None
+        nickname: str = "nobody"
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond", team=Team(name="Preventers")))
+        session.commit()
+    assert "team_id, hero.id" in str(select(HeroReadWithTeam))
+    with Session(engine) as session:
+        hero = session.exec(select(HeroReadWithTeam)).one()
+        assert hero == HeroReadWithTeam(
+            id=1, name="Deadpond", team_id=1, team=None, nickname="nobody"
+        )
+
+
+def test_select_read_model_errors(clear_sqlmodel):
+    class HeroBase(SQLModel):
+        name: str
+
+    class Hero(HeroBase, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+
+    class HeroArchive(HeroBase, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+
+    class HeroRead(HeroBase):
+        id: int
+
+    class TeamBase(SQLModel):
+        name: str
+
+    class Team(TeamBase, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+
+    class TeamRead(TeamBase):
+        headquarters: str
+
+    class Power(SQLModel):
+        name: str
+
+    with pytest.raises(RuntimeError, match="more than one table model"):
+        select(HeroRead)
+    with pytest.raises(RuntimeError, match="headquarters is not a column of Team"):
+        select(TeamRead)
+    with pytest.raises(RuntimeError, match="doesn't share fields"):
+        select(Power)
+
+
+def test_select_read_model_new_table_model(clear_sqlmodel):
+    class HeroBase(SQLModel):
+        name: str
+
+    class Hero(HeroBase, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+
+    class HeroRead(HeroBase):
+        id: int
+
+    assert "FROM hero" in str(select(HeroRead))
+
+    # A table model defined later makes the read model ambiguous
+    class HeroArchive(HeroBase, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+
+    with pytest.raises(RuntimeError, match="more than one table model"):
+        select(HeroRead)
@@ -0,0 +1,106 @@
+from typing import Optional
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import inspect
+from sqlmodel import Field, Relationship, Session, SQLModel, create_engine, select
+from sqlmodel.compat import get_fields_set
+
+from .conftest import needs_pydanticv1, needs_pydanticv2
+
+
+def test_setattr_columns_and_relationships(clear_sqlmodel):
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+        team: Optional[Team] = Relationship(
+            sa_relationship_kwargs={"backref": "heroes"}
+        )
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    team = Team(name="Preventers")
+    hero = Hero(name="Deadpond")
+    # The backref attribute is only instrumented when the mappers are configured
+    team.heroes = [hero]
+    assert hero.team is team
+    with Session(engine) as session:
+        session.add(team)
+        session.commit()
+        hero = session.exec(select(Hero)).one()
+        hero.name = "Rusty-Man"
+        assert inspect(hero).attrs.name.history.added == ["Rusty-Man"]
+        assert hero.__dict__["name"] == "Rusty-Man"
+        session.commit()
+        session.refresh(hero)
+        assert hero.name == "Rusty-Man"
+        assert hero.team.name == "Preventers"
+        assert hero.team.heroes == [hero]
+
+
+def test_setattr_marks_fields_set(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+
+    hero = Hero(name="Deadpond")
+    assert get_fields_set(hero) == {"name"}
+    hero.age = 32
+    assert get_fields_set(hero) == {"name", "age"}
+    assert hero.__dict__["age"] == 32
+    assert inspect(hero).attrs.age.history.added == [32]
+
+
+def test_setattr_property_without_setter(clear_sqlmodel):
+    class HeroBase(SQLModel):
+        name: str
+
+        @property
+        def upper(self) -> str:
+            return self.name.upper()
+
+    class Hero(HeroBase, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+
+    # The error from Pydantic, not the one for read-only results
+    for hero in [HeroBase(name="Deadpond"), Hero(name="Deadpond")]:
+        with pytest.raises((AttributeError, ValueError)):
+            hero.upper = "DEADPOOL"  # type: ignore
+
+
+@needs_pydanticv2
+def test_setattr_validate_assignment_pydantic_v2(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        model_config = {"validate_assignment": True}
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+
+    hero = Hero(name="Deadpond")
+    hero.age = "32"
+    assert hero.age == 32
+    with pytest.raises(ValidationError):
+        hero.age = "not a number"
+
+
+@needs_pydanticv1
+def test_setattr_validate_assignment_pydantic_v1(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+
+        class Config:
+            validate_assignment = True
+
+    hero = Hero(name="Deadpond")
+    hero.age = "32"
+    assert hero.age == 32
+    with pytest.raises(ValidationError):
+        hero.age = "not a number"
@@ -0,0 +1,57 @@
+import ipaddress
+from typing import Optional
+
+import pytest
+from sqlalchemy import Text, Unicode
+from sqlmodel import Field, SQLModel, register_sqlalchemy_type
+from sqlmodel.sql import sqltypes
+
+
+@pytest.fixture(name="registry")
+def registry_fixture(monkeypatch: pytest.MonkeyPatch):
+    # Keep the registrations in each test from leaking to the others
+    monkeypatch.setattr(sqltypes, "_sqlalchemy_types", dict(sqltypes._sqlalchemy_types))
+    monkeypatch.setattr(sqltypes, "_resolved_sqlalchemy_types", {})
+
+
+def test_subclass_uses_base_type(clear_sqlmodel, registry):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        interface: ipaddress.IPv4Interface
+
+    assert isinstance(Hero.__table__.c.interface.type, sqltypes.AutoString)
+
+
+def test_register_type(clear_sqlmodel, registry):
+    register_sqlalchemy_type(ipaddress.IPv4Interface, Text)
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        interface: ipaddress.IPv4Interface
+        address: ipaddress.IPv4Address
+
+    assert isinstance(Hero.__table__.c.interface.type, Text)
+    assert isinstance(Hero.__table__.c.address.type, sqltypes.AutoString)
+
+
+def test_register_type_factory(clear_sqlmodel, registry):
+    def unicode_type(python_type, metadata):
+        return Unicode(length=metadata.max_length)
+
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str = Field(max_length=20)
+
+    register_sqlalchemy_type(str, unicode_type)
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str = Field(max_length=30)
+
+    assert isinstance(Team.__table__.c.name.type, sqltypes.AutoString)
+    assert isinstance(Hero.__table__.c.name.type, Unicode)
+
+
+def test_unknown_type(clear_sqlmodel, registry):
+    with pytest.raises(ValueError, match="has no matching SQLAlchemy type"):
+        sqltypes.get_sqlalchemy_type_for(complex, None)
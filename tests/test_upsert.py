@@ -0,0 +1,208 @@
+import asyncio
+from typing import Any, List, Optional
+
+import pytest
+from sqlalchemy import Column, String
+from sqlmodel import Field, Session, SQLModel, select
+
+
+def add_teams(engine: Any, team_model: Any) -> None:
+    with Session(engine) as session:
+        session.add(team_model(name="Preventers", headquarters="Sharp Tower"))
+        session.add(team_model(name="Z-Force", headquarters="Sister Margaret's Bar"))
+        session.commit()
+
+
+def test_upsert_unique_column(engine, hero_models, count_queries):
+    Team, _ = hero_models
+    add_teams(engine, Team)
+    statements = count_queries(engine)
+    with Session(engine) as session:
+        teams = session.upsert(
+            Team,
+            [
+                {"name": "Z-Force", "headquarters": "Van"},
+                {"name": "Avengers", "headquarters": "Avengers Tower"},
+            ],
+        )
+        assert len(statements) == 1
+        assert "ON CONFLICT (name) DO UPDATE" in statements[0]
+        assert [(team.id, team.name, team.headquarters) for team in teams] == [
+            (2, "Z-Force", "Van"),
+            (3, "Avengers", "Avengers Tower"),
+        ]
+        assert all(team in session for team in teams)
+        assert not session.new
+        assert not session.dirty
+        session.commit()
+    with Session(engine) as session:
+        db_teams = session.exec(select(Team).order_by(Team.id)).all()
+        assert [team.headquarters for team in db_teams] == [
+            "Sharp Tower",
+            "Van",
+            "Avengers Tower",
+        ]
+
+
+def test_upsert_primary_key_and_loaded_objects(engine, hero_models):
+    Team, _ = hero_models
+    add_teams(engine, Team)
+    with Session(engine) as session:
+        preventers = session.get(Team, 1)
+        assert preventers is not None
+        teams = session.upsert(
+            Team, [Team(id=1, name="Preventers", headquarters="Tower")]
+        )
+        # The same object in the session, updated
+        assert teams == [preventers]
+        assert preventers.headquarters == "Tower"
+
+
+def test_upsert_get_or_create(engine, hero_models, count_queries):
+    Team, _ = hero_models
+    add_teams(engine, Team)
+    statements = count_queries(engine)
+    with Session(engine) as session:
+        teams = session.upsert(
+            Team,
+            [{"name": "Avengers"}, {"name": "Preventers"}, {"name": "Avengers"}],
+            update=[],
+        )
+        assert "ON CONFLICT (name) DO NOTHING" in statements[0]
+        # The existing row, not returned by RETURNING, read in a single query
+        assert len(statements) == 2
+        assert [(team.id, team.name, team.headquarters) for team in teams] == [
+            (3, "Avengers", None),
+            (1, "Preventers", "Sharp Tower"),
+            (3, "Avengers", None),
+        ]
+        assert teams[0] is teams[2]
+
+
+def test_upsert_unique_constraint_and_update(engine, hero_models):
+    _, Hero = hero_models
+    with Session(engine) as session:
+        rows = [
+            {"name": f"Hero {i}", "secret_name": f"Secret {i}", "age": i}
+            for i in range(5)
+        ]
+        heroes = session.upsert(Hero, rows, chunk_size=2)
+        assert [hero.id for hero in heroes] == [1, 2, 3, 4, 5]
+        rows = [
+            {"name": "Hero 1", "secret_name": "Secret 1", "age": 30},
+            {"name": "Hero 5", "secret_name": "Secret 5", "age": 50},
+        ]
+        heroes = session.upsert(
+            Hero,
+            rows,
+            conflict_on=[Hero.name, "secret_name"],
+            update=[Hero.age],
+            returning=False,
+        )
+        # Not updated nor added
+        assert [hero.id for hero in heroes] == [None, None]
+        session.commit()
+        db_heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+        assert [hero.age for hero in db_heroes] == [0, 30, 2, 3, 4, 50]
+
+
+def test_upsert_without_conflict_target(clear_sqlmodel, engine):
+    class Power(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        with pytest.raises(ValueError, match="pass conflict_on"):
+            session.upsert(Power, [{"id": 1, "name": "Flight"}, {"name": "Speed"}])
+        with pytest.raises(ValueError, match="Missing values for id"):
+            session.upsert(Power, [Power(name="Flight")], conflict_on=["id"])
+        assert session.exec(select(Power)).all() == []
+
+
+def test_upsert_async(hero_models):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    Team, _ = hero_models
+    results: List[Any] = []
+
+    async def main() -> None:
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            for headquarters in ["Sharp Tower", "Van"]:
+                teams = await session.upsert(
+                    Team, [{"name": "Z-Force", "headquarters": headquarters}]
+                )
+                results.append((teams[0].id, teams[0].headquarters))
+            await session.commit()
+        await engine.dispose()
+
+    asyncio.run(main())
+    assert results == [(1, "Sharp Tower"), (1, "Van")]
+
+
+def test_upsert_unsupported_dialect(engine, hero_models):
+    Team, _ = hero_models
+    with Session(engine) as session:
+        session.connection().dialect.name = "mssql"
+        # Before validating the rows
+        with pytest.raises(ValueError, match="not supported for the mssql dialect"):
+            session.upsert(Team, [{"headquarters": "Sharp Tower"}])
+
+
+def test_upsert_case_insensitive_collation(clear_sqlmodel, engine):
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str = Field(sa_column=Column(String(collation="NOCASE"), unique=True))
+        headquarters: Optional[str] = None
+
+    SQLModel.metadata.create_all(engine)
+    add_teams(engine, Team)
+    with Session(engine) as session:
+        # The database returns "Preventers", not the "PREVENTERS" sent
+        teams = session.upsert(
+            Team,
+            [
+                {"name": "PREVENTERS", "headquarters": "Tower"},
+                {"name": "Avengers", "headquarters": "Avengers Tower"},
+            ],
+        )
+        assert [(team.id, team.name, team.headquarters) for team in teams] == [
+            (1, "Preventers", "Tower"),
+            (3, "Avengers", "Avengers Tower"),
+        ]
+        teams = session.upsert(Team, [{"name": "z-force"}], update=[])
+        assert [(team.id, team.name) for team in teams] == [(2, "Z-Force")]
+
+
+def test_upsert_flushes_pending(engine, hero_models):
+    Team, _ = hero_models
+    add_teams(engine, Team)
+    with Session(engine) as session:
+        avengers = Team(name="Avengers")
+        session.add(avengers)
+        teams = session.upsert(
+            Team, [{"name": "Avengers", "headquarters": "Avengers Tower"}]
+        )
+        # Inserted by the autoflush, then updated by the upsert
+        assert teams == [avengers]
+        assert avengers.headquarters == "Avengers Tower"
+        preventers = session.get(Team, 1)
+        assert preventers is not None
+        with session.no_autoflush:
+            preventers.headquarters = "Van"
+            teams = session.upsert(
+                Team, [{"name": "Preventers", "headquarters": "Tower"}]
+            )
+        # The change not flushed is kept, and flushed later
+        assert teams == [preventers]
+        assert preventers.headquarters == "Van"
+        session.commit()
+    with Session(engine) as session:
+        team = session.get(Team, 1)
+        assert team is not None
+        assert team.headquarters == "Van"